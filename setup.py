@@ -13,6 +13,9 @@ setup(name='PyTuning',
       url='https://github.com/MarkCWirt/PyTuning',
       packages=find_packages(where="src"),
       scripts=['src/pytuning/interactive.py'],
+      entry_points={
+          'console_scripts': ['pytuning-export = pytuning.cli:main'],
+      },
       install_requires=['sympy', 'numpy'],
       package_dir={'': 'src'},
       package_data={
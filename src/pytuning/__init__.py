@@ -1,7 +1,35 @@
-from pytuning.scales import create_harmonic_scale, create_pythagorean_scale, create_edo_scale, \
-    create_quarter_comma_meantone_scale, create_euler_fokker_scale, create_equal_interval_scale
-from pytuning.scale_creation import calculate_modes, find_best_modes
+import importlib
 
-__all__=["create_harmonic_scale", "calculate_modes", "find_best_modes",
-         "create_pythagorean_scale", "create_edo_scale", "create_euler_fokker_scale",
-         "create_equal_interval_scale", "create_quarter_comma_meantone_scale"]
+# Nothing is imported until it is used, so that importing the package (or a
+# light-weight part of it, such as pytuning.runtime) doesn't load sympy.
+
+_EXPORTS = {
+    "create_harmonic_scale": "scales",
+    "create_pythagorean_scale": "scales",
+    "create_edo_scale": "scales",
+    "create_quarter_comma_meantone_scale": "scales",
+    "create_euler_fokker_scale": "scales",
+    "create_equal_interval_scale": "scales",
+    "calculate_modes": "scale_creation",
+    "find_best_modes": "scale_creation",
+}
+
+__all__ = ["create_harmonic_scale", "calculate_modes", "find_best_modes",
+           "create_pythagorean_scale", "create_edo_scale", "create_euler_fokker_scale",
+           "create_equal_interval_scale", "create_quarter_comma_meantone_scale"]
+
+_SUBMODULES = ["archive", "backends", "cli", "constants", "interactive", "metrics", "midi", "monzo", "number_theory",
+               "runtime", "scala", "scale_creation", "scales", "server", "tuning_tables", "utilities",
+               "visualizations"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module("pytuning." + _EXPORTS[name]), name)
+    if name in _SUBMODULES:
+        return importlib.import_module("pytuning." + name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 19:12:05 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import mmap
+import struct
+from fractions import Fraction
+
+import numpy as np
+import sympy as sp
+
+from pytuning.tuning_tables.frequency_table import create_frequency_table
+
+try:
+    numbers = sp.numbers   # type:ignore
+except AttributeError:
+    numbers = sp.core.numbers
+
+__all__ = ["write_scale_archive", "ScaleArchive"]
+
+# The layout of the file is described in docs/utilities.rst. All values are
+# little-endian, and every section starts on an eight-byte boundary.
+
+MAGIC = b"PYTUNSCA"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQQQQQQ")
+
+RATIONAL = 0
+BIG_RATIONAL = 1
+REAL = 2
+
+SCALE_DTYPE = np.dtype([("degree_start", "<u8"), ("degree_count", "<u4"), ("reference_note", "<i4"),
+                        ("reference_frequency", "<f8"), ("name_offset", "<u8"), ("name_length", "<u4"),
+                        ("reserved", "<u4")])
+
+DEGREE_DTYPE = np.dtype([("kind", "u1"), ("reserved", "u1", 7), ("p", "<i8"), ("q", "<i8"),
+                         ("hi", "<f8"), ("lo", "<f8"), ("blob_offset", "<u8"), ("blob_length", "<u4"),
+                         ("reserved2", "<u4")])
+
+_INT64_MAX = 2 ** 63 - 1
+
+# The largest exponent accepted in a stored symbolic degree
+_MAX_EXPONENT = 1000
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def _encode_integer(value):
+    length = (value.bit_length() + 8) // 8
+    return struct.pack("<I", length) + value.to_bytes(length, "little", signed=True)
+
+
+def _decode_integer(data, offset):
+    length = struct.unpack_from("<I", data, offset)[0]
+    start = offset + 4
+    return int.from_bytes(data[start:start + length], "little", signed=True), start + length
+
+
+def _power_factors(value):
+    # The factors of a value that is a product of rational powers of positive
+    # rationals (such as 3*2**(1/3)), as (base, exponent) pairs, or None
+    factors = [x.as_base_exp() for x in sp.Mul.make_args(value)]
+    for base, exponent in factors:
+        if not (isinstance(base, numbers.Rational) and base > 0 and isinstance(exponent, numbers.Rational)):
+            return None
+    return factors
+
+
+def _double_double(value):
+    precise = sp.N(value, 40)
+    hi = float(precise)
+    return hi, float(precise - sp.Float(hi, 40))
+
+
+def _rational_double_double(p, q):
+    hi = p / q
+    return hi, float(Fraction(p, q) - Fraction(hi))
+
+
+class _Blob(object):
+    # The variable-length data: names, big integers and symbolic strings
+
+    def __init__(self):
+        self.pieces = []
+        self.length = 0
+
+    def add(self, data):
+        offset = self.length
+        self.pieces.append(data)
+        self.length = self.length + len(data)
+        return offset, len(data)
+
+
+def _encode_degree(record, degree, blob, symbolic):
+    degree = sp.sympify(degree)
+    if isinstance(degree, numbers.Rational):
+        p, q = int(degree.p), int(degree.q)
+        record["hi"], record["lo"] = _rational_double_double(p, q)
+        if abs(p) <= _INT64_MAX and q <= _INT64_MAX:
+            record["kind"] = RATIONAL
+            record["p"], record["q"] = p, q
+        else:
+            record["kind"] = BIG_RATIONAL
+            record["blob_offset"], record["blob_length"] = blob.add(_encode_integer(p) + _encode_integer(q))
+    else:
+        record["kind"] = REAL
+        record["hi"], record["lo"] = _double_double(degree)
+        factors = _power_factors(degree) if symbolic else None
+        if factors is not None:
+            data = struct.pack("<I", len(factors))
+            for base, exponent in factors:
+                for value in [base.p, base.q, exponent.p, exponent.q]:
+                    data = data + _encode_integer(int(value))
+            record["blob_offset"], record["blob_length"] = blob.add(data)
+
+
+def write_scale_archive(file_name, scales, names=None, reference_note=60, reference_frequency=None,
+                        frequencies=True, symbolic=True):
+    '''
+    Write scales to a binary scale archive
+
+    :param file_name: The name of the file to write
+    :param scales: A list of scales
+    :param names: A name for each scale. If ``None`` the scales are not named.
+    :param reference_note: The MIDI number of the absolute frequency reference,
+        used for the frequency tables. This can also be a list, with one entry for each scale.
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning.
+        This can also be a list, with one entry for each scale.
+    :param frequencies: If ``True`` (the default) store the frequencies of the
+        128 MIDI notes for each scale
+    :param symbolic: If ``True`` (the default) store the exact form of non-rational
+        degrees as well as their values, so that they can be restored exactly
+    :returns: ``None``
+
+    Rational degrees are always stored exactly. Other degrees are stored as a
+    pair of doubles whose sum has about 32 significant digits. If ``symbolic`` is
+    ``True``, degrees that are products of rational powers of rationals (such as
+    the degrees of an EDO scale, or ``3*sqrt(7)/4``) are also stored as a list of
+    integer bases and exponents. Other irrational degrees (such as those involving
+    ``pi``) are only stored numerically. The archive is read with ``ScaleArchive``.
+    '''
+    scales = [list(x) for x in scales]
+    count = len(scales)
+    if not isinstance(reference_note, (list, tuple, np.ndarray)):
+        reference_note = [reference_note] * count
+    if not isinstance(reference_frequency, (list, tuple, np.ndarray)):
+        reference_frequency = [reference_frequency] * count
+    blob = _Blob()
+    index = np.zeros(count, dtype=SCALE_DTYPE)
+    degrees = np.zeros(sum(len(x) for x in scales), dtype=DEGREE_DTYPE)
+    table = np.zeros((count if frequencies else 0, 128), dtype=np.float64)
+    position = 0
+    for number, scale in enumerate(scales):
+        frequency_table = create_frequency_table(scale, reference_note[number], reference_frequency[number])
+        entry = index[number]
+        entry["degree_start"], entry["degree_count"] = position, len(scale)
+        entry["reference_note"] = reference_note[number]
+        entry["reference_frequency"] = frequency_table.reference_frequency
+        if names is not None:
+            entry["name_offset"], entry["name_length"] = blob.add(names[number].encode("utf-8"))
+        for degree in scale:
+            _encode_degree(degrees[position], degree, blob, symbolic)
+            position = position + 1
+        if frequencies:
+            table[number] = frequency_table.frequencies
+
+    index_offset = _align(_HEADER.size)
+    degree_offset = _align(index_offset + index.nbytes)
+    frequency_offset = _align(degree_offset + degrees.nbytes)
+    blob_offset = _align(frequency_offset + table.nbytes)
+    flags = 1 if frequencies else 0
+    with open(file_name, "wb") as archive:
+        archive.write(_HEADER.pack(MAGIC, VERSION, flags, count, len(degrees), index_offset, degree_offset,
+                                   frequency_offset, blob_offset, blob.length))
+        for offset, data in [(index_offset, index), (degree_offset, degrees), (frequency_offset, table)]:
+            archive.write(b"\0" * (offset - archive.tell()))
+            archive.write(data.tobytes())
+        archive.write(b"\0" * (blob_offset - archive.tell()))
+        for piece in blob.pieces:
+            archive.write(piece)
+
+
+class ScaleArchive(object):
+    '''
+    A binary scale archive, as written by ``write_scale_archive()``
+
+    :param file_name: The name of the archive file
+
+    The file is memory-mapped, and the arrays returned by the methods of this
+    class are read-only views into the mapping. Nothing is read from disk until
+    it is used, and nothing is copied, so opening a large archive is immediate
+    and accessing a scale's frequencies or floating point degrees costs the same
+    regardless of the size of the archive:
+
+    .. code::
+
+        with ScaleArchive("scales.pta") as archive:
+            for index in range(len(archive)):
+                print(archive.name(index), archive.frequencies(index)[60])
+
+    The archive should be closed (or used as a context manager) when it is no
+    longer needed. The arrays returned by the archive must be deleted (or copied)
+    first, as the file cannot be unmapped while they exist.
+    '''
+    def __init__(self, file_name):
+        with open(file_name, "rb") as archive:
+            self._map = mmap.mmap(archive.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, flags, count, degree_count, index_offset, degree_offset, frequency_offset,
+         blob_offset, blob_length) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError("Not a scale archive: %s" % file_name)
+        if version != VERSION:
+            self._map.close()
+            raise ValueError("Unsupported scale archive version: %d" % version)
+        self._index = np.frombuffer(self._map, SCALE_DTYPE, count, index_offset)
+        self._degrees = np.frombuffer(self._map, DEGREE_DTYPE, degree_count, degree_offset)
+        self._frequencies = None
+        if flags & 1:
+            self._frequencies = np.frombuffer(self._map, np.float64, count * 128, frequency_offset).reshape(count, 128)
+        self._blob = memoryview(self._map)[blob_offset:blob_offset + blob_length]
+
+    def __len__(self):
+        return len(self._index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *arguments):
+        self.close()
+
+    def close(self):
+        '''
+        Close the archive
+
+        A ``BufferError`` is raised if arrays returned by the archive are still in
+        use, as the file cannot be unmapped while they exist. Once they have been
+        deleted ``close()`` can be called again.
+        '''
+        self._index = self._degrees = self._frequencies = None
+        self._blob.release()
+        try:
+            self._map.close()
+        except BufferError:
+            raise BufferError("The scale archive cannot be closed while arrays returned by it are in use")
+
+    def _degree_records(self, index):
+        entry = self._index[index]
+        start = int(entry["degree_start"])
+        return self._degrees[start:start + int(entry["degree_count"])]
+
+    def name(self, index):
+        '''
+        The name of a scale
+
+        :param index: The index of the scale
+        :returns: The name (``str``)
+        '''
+        entry = self._index[index]
+        offset = int(entry["name_offset"])
+        return bytes(self._blob[offset:offset + int(entry["name_length"])]).decode("utf-8")
+
+    def reference(self, index):
+        '''
+        The reference of a scale's frequency table
+
+        :param index: The index of the scale
+        :returns: A tuple (reference note, reference frequency)
+        '''
+        entry = self._index[index]
+        return int(entry["reference_note"]), float(entry["reference_frequency"])
+
+    def frequencies(self, index=None):
+        '''
+        The frequency table of a scale
+
+        :param index: The index of the scale. If ``None`` the tables of all the
+            scales are returned.
+        :returns: A read-only NumPy ``float64`` array of length 128 (or a matrix with
+            one row per scale)
+        '''
+        if self._frequencies is None:
+            raise ValueError("The archive does not contain frequency tables")
+        if index is None:
+            return self._frequencies
+        return self._frequencies[index]
+
+    def floats(self, index):
+        '''
+        The degrees of a scale as floating point values
+
+        :param index: The index of the scale
+        :returns: A read-only NumPy ``float64`` array
+        '''
+        return self._degree_records(index)["hi"]
+
+    def kinds(self, index):
+        '''
+        How the degrees of a scale are stored
+
+        :param index: The index of the scale
+        :returns: A read-only NumPy array: ``RATIONAL`` (0) for rationals whose numerator
+            and denominator fit into 64 bits, ``BIG_RATIONAL`` (1) for other rationals,
+            and ``REAL`` (2) for non-rational degrees
+        '''
+        return self._degree_records(index)["kind"]
+
+    def ratios(self, index):
+        '''
+        The numerators and denominators of a scale's degrees
+
+        :param index: The index of the scale
+        :returns: A tuple of two read-only NumPy ``int64`` arrays. They are only meaningful
+            for degrees of kind ``RATIONAL`` (see ``kinds()``).
+        '''
+        records = self._degree_records(index)
+        return records["p"], records["q"]
+
+    def _symbolic_degree(self, offset):
+        count = struct.unpack_from("<I", self._blob, offset)[0]
+        offset = offset + 4
+        factors = []
+        values = []
+        while len(values) < 4 * count:
+            value, offset = _decode_integer(self._blob, offset)
+            values.append(value)
+        for index in range(count):
+            base_p, base_q, exponent_p, exponent_q = values[4 * index:4 * index + 4]
+            if base_p <= 0 or base_q <= 0 or exponent_q <= 0 or abs(exponent_p) > _MAX_EXPONENT * exponent_q:
+                raise ValueError("Invalid symbolic degree in scale archive")
+            factors.append(sp.Rational(base_p, base_q) ** sp.Rational(exponent_p, exponent_q))
+        return sp.Mul(*factors)
+
+    def _degree(self, record):
+        kind = int(record["kind"])
+        if kind == RATIONAL:
+            return sp.Rational(int(record["p"]), int(record["q"]))
+        offset = int(record["blob_offset"])
+        if kind == BIG_RATIONAL:
+            p, offset = _decode_integer(self._blob, offset)
+            q, offset = _decode_integer(self._blob, offset)
+            return sp.Rational(p, q)
+        if int(record["blob_length"]) > 0:
+            return self._symbolic_degree(offset)
+        return sp.Float(float(record["hi"]), 32) + sp.Float(float(record["lo"]), 32)
+
+    def scale(self, index):
+        '''
+        Restore a scale
+
+        :param index: The index of the scale
+        :returns: The scale, as a list of ``sympy`` values
+
+        Rational degrees and (if they were stored) symbolic degrees are restored
+        exactly; other degrees are restored as 32-digit floating point values.
+        '''
+        return [self._degree(record) for record in self._degree_records(index)]
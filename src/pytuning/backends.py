@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 22:31:47 2026
+
+@author: mark
+"""
+
+# The number types that scales are built from and analyzed in. By default
+# everything is done in sympy, as it always has been; the other backends
+# trade sympy's generality for speed.
+
+from __future__ import print_function, division
+
+import contextlib
+import contextvars
+import warnings
+from fractions import Fraction
+
+import sympy as sp
+
+__all__ = ["Backend", "get_backend", "set_backend", "use_backend", "available_backends"]
+
+# The largest denominator considered when recovering a ratio from a float
+MAX_DENOMINATOR = 10 ** 9
+
+# A float recovered as a ratio with a larger denominator than this is taken to be
+# a tempered (irrational) value rather than a just interval
+JUST_DENOMINATOR = 10 ** 6
+
+
+class Backend(object):
+    '''
+    A numeric backend: the type used to represent scale degrees
+
+    :param name: The name of the backend
+    :param rational: A function of (numerator, denominator) returning an exact
+        (or, for an approximate backend, the nearest) value of the backend's type
+    :param exact: ``True`` if the backend represents rationals exactly
+    :param symbolic: ``True`` for the ``sympy`` backend, whose values may also be
+        irrational
+
+    Backends are not normally created directly. Use ``get_backend()``.
+    '''
+    def __init__(self, name, rational, exact=True, symbolic=False):
+        self.name = name
+        self._rational = rational
+        self.exact = exact
+        self.symbolic = symbolic
+
+    def __repr__(self):
+        return "Backend(%r)" % self.name
+
+    def rational(self, p, q=1):
+        '''
+        Create the value ``p/q``
+
+        :param p: The numerator
+        :param q: The denominator
+        :returns: The value, in the backend's type
+
+        If either argument is a (non-rational) ``sympy`` value the result is a ``sympy`` value.
+        '''
+        if isinstance(p, sp.Basic) and not p.is_Integer or isinstance(q, sp.Basic) and not q.is_Integer:
+            return sp.sympify(p) / q
+        return self._rational(int(p), int(q))
+
+    def number(self, value):
+        '''
+        Convert a value to the backend's type
+
+        :param value: The value (an ``int``, ``float``, ``fractions.Fraction``, ``sympy``
+            value, or a value of any of the other backends)
+        :returns: The converted value
+
+        For exact backends rational values (including floats, which are rational) are
+        converted exactly, and irrational ``sympy`` values are returned unchanged. For
+        the ``float`` backend everything is converted to ``float``.
+        '''
+        if self.symbolic:
+            return value if isinstance(value, sp.Basic) else sp.sympify(value)
+        if not self.exact:
+            return float(value)
+        if isinstance(value, sp.Basic):
+            if not value.is_Rational:
+                return value
+            return self._rational(int(value.p), int(value.q))
+        ratio = Fraction(value)
+        return self._rational(ratio.numerator, ratio.denominator)
+
+    def fraction(self, value):
+        '''
+        The numerator and denominator of a value
+
+        :param value: The value
+        :returns: A tuple (numerator, denominator)
+
+        For the ``sympy`` backend (and irrational ``sympy`` values in any backend) this is
+        ``sympy.fraction()``. Floats are converted to the nearest fraction with a
+        denominator of at most ``MAX_DENOMINATOR``, which recovers the ratio of a float
+        calculated from a just interval.
+
+        A float cannot be distinguished from an irrational value, so the "ratio" of a
+        tempered degree in the ``float`` backend is just a close approximation, and
+        the ratio-based metrics calculated from it are meaningless. If the denominator
+        found is larger than ``JUST_DENOMINATOR`` a ``RuntimeWarning`` is issued.
+        '''
+        if self.symbolic or isinstance(value, sp.Basic) and not value.is_Rational:
+            return sp.fraction(value)
+        if isinstance(value, float):
+            ratio = Fraction(value).limit_denominator(MAX_DENOMINATOR)
+            if ratio.denominator > JUST_DENOMINATOR:
+                warnings.warn("%r does not appear to be a just ratio; ratio-based metrics are "
+                              "undefined for tempered values in the float backend" % value,
+                              RuntimeWarning, stacklevel=2)
+            value = ratio
+        elif isinstance(value, sp.Basic):
+            return int(value.p), int(value.q)
+        return int(value.numerator), int(value.denominator)
+
+    def power(self, base, p, q):
+        '''
+        Raise a value to a rational power
+
+        :param base: The base
+        :param p: The numerator of the exponent
+        :param q: The denominator of the exponent
+        :returns: ``base ** (p/q)``
+
+        For the exact backends the power is formed in ``sympy``, and is converted to
+        the backend's type if it is rational.
+        '''
+        if not self.exact:
+            return float(base) ** (p / q)
+        value = (sp.sympify(base) ** sp.Rational(1, q)) ** p
+        return self.number(value)
+
+    def evaluate(self, value):
+        '''
+        Evaluate a value (such as a metric) numerically
+
+        :param value: The value
+        :returns: A ``sympy.Float`` for the ``sympy`` backend, and otherwise a ``float``
+        '''
+        if self.symbolic:
+            return sp.sympify(value).evalf()
+        return float(value)
+
+
+def _gmpy2_rational(p, q):
+    import gmpy2   # type: ignore
+    return gmpy2.mpq(p, q)
+
+
+def _has_gmpy2():
+    try:
+        import gmpy2   # type: ignore # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+_BACKENDS = {
+    "sympy": Backend("sympy", sp.Rational, symbolic=True),
+    "fraction": Backend("fraction", Fraction),
+    "gmpy2": Backend("gmpy2", _gmpy2_rational),
+    "float": Backend("float", lambda p, q: p / q, exact=False),
+}
+
+_default = _BACKENDS["sympy"]
+
+# The backend set by use_backend(). Each thread (and asyncio task) has its own
+# value, so a per-call backend doesn't affect code running elsewhere.
+_context_backend = contextvars.ContextVar("pytuning_backend", default=None)
+
+
+def available_backends():
+    '''
+    The names of the backends that can be used
+
+    :returns: A list of names. ``gmpy2`` is only included if it is installed.
+    '''
+    return [x for x in ["sympy", "fraction", "gmpy2", "float"] if x != "gmpy2" or _has_gmpy2()]
+
+
+def get_backend(backend=None):
+    '''
+    Look up a numeric backend
+
+    :param backend: The name of the backend (``sympy``, ``fraction``, ``gmpy2``, or
+        ``float``), a ``Backend``, or ``None`` for the current default
+    :returns: The ``Backend``
+
+    This is used by the functions that take a ``backend`` argument to resolve it.
+    The current default is that of the innermost ``use_backend()`` block in the
+    calling thread, or if there is none the one set by ``set_backend()``.
+    '''
+    if backend is None:
+        backend = _context_backend.get()
+        return _default if backend is None else backend
+    if isinstance(backend, Backend):
+        return backend
+    if backend not in _BACKENDS:
+        raise ValueError("Unknown backend: %s" % backend)
+    if backend == "gmpy2" and not _has_gmpy2():
+        raise ValueError("The gmpy2 backend requires the gmpy2 package")
+    return _BACKENDS[backend]
+
+
+def set_backend(backend):
+    '''
+    Set the default numeric backend
+
+    :param backend: The name of the backend, or a ``Backend``
+    :returns: The previous default ``Backend``
+
+    The default is used by every function that takes a ``backend`` argument when
+    none is given (outside of ``use_backend()`` blocks), in every thread. The initial
+    default is ``sympy``.
+    '''
+    global _default
+    previous = _default
+    _default = get_backend(backend)
+    return previous
+
+
+@contextlib.contextmanager
+def use_backend(backend):
+    '''
+    Change the default numeric backend for the duration of a ``with`` block
+
+    :param backend: The name of the backend, or a ``Backend``
+
+    The change only applies to the calling thread (or ``asyncio`` task), so other
+    threads continue to use their own default:
+
+    .. code::
+
+        with use_backend("fraction"):
+            modes = find_best_modes(create_pythagorean_scale(), 7)
+    '''
+    token = _context_backend.set(get_backend(backend))
+    try:
+        yield _context_backend.get()
+    finally:
+        _context_backend.reset(token)
@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:55:26 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import argparse
+import collections
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+
+import sympy as sp
+
+from pytuning.scala import read_scala_scale
+from pytuning.tuning_tables import create_timidity_tuning, create_fluidsynth_tuning, create_csound_tuning, \
+    create_scala_tuning, create_mts_bulk_dump
+
+__all__ = ["read_scale_file", "export_scales", "main"]
+
+_MANIFEST = ".pytuning-manifest.json"
+
+_SCALE_EXTENSIONS = (".scl", ".json")
+
+
+def _render_timidity(scale, name, options):
+    return create_timidity_tuning(scale, options["reference_note"], options["reference_frequency"])
+
+
+def _render_fluidsynth(scale, name, options):
+    return create_fluidsynth_tuning(scale, options["reference_note"],
+                                    reference_frequency=options["reference_frequency"])
+
+
+def _render_csound(scale, name, options):
+    return create_csound_tuning(scale, options["reference_note"], options["reference_frequency"])
+
+
+def _render_scala(scale, name, options):
+    return create_scala_tuning(scale, name)
+
+
+def _render_mts(scale, name, options):
+    return create_mts_bulk_dump(scale, options["reference_note"], options["reference_frequency"],
+                                name=name[:16])
+
+
+# The output formats: the extension of the output file, the function that
+# renders it (returning str or bytes), and whether the output depends on
+# the reference note and frequency.
+
+FORMATS = collections.OrderedDict([
+    ("timidity", (".timidity", _render_timidity, True)),
+    ("fluidsynth", (".fluidsynth", _render_fluidsynth, True)),
+    ("csound", (".csound", _render_csound, True)),
+    ("scala", (".scl", _render_scala, False)),
+    ("mts", (".syx", _render_mts, True)),
+])
+
+
+# The forms of degree accepted in JSON files: a ratio (``3/2``, ``1.5``), optionally
+# raised to a rational power (``2**(7/12)``, ``(3/2)**2``). Definitions may come
+# from anywhere, so they are matched against this rather than given to sympify
+# (which evaluates its input).
+
+_RATIO = r"\d+(?:\.\d+)?(?:/\d+)?"
+_EXPONENT = r"-?\d+(?:/\d+)?"
+_MAX_EXPONENT = 1000
+_DEGREE = re.compile(r"^(?P<base>%s|\(\s*%s\s*\))(?:\s*\*\*\s*(?P<exponent>\d+|\(\s*%s\s*\)))?$" %
+                     (_RATIO, _RATIO, _EXPONENT))
+
+
+def _parse_degree(degree):
+    if isinstance(degree, bool) or not isinstance(degree, (int, float, str)):
+        raise ValueError("Invalid scale degree: %r" % degree)
+    if isinstance(degree, float):
+        return sp.Float(degree)
+    if isinstance(degree, int):
+        return sp.Integer(degree)
+    match = _DEGREE.match(degree.strip())
+    if match is None:
+        raise ValueError("Invalid scale degree: %r" % degree)
+    try:
+        base = sp.Rational(match.group("base").strip("() "))
+        exponent = match.group("exponent")
+        exponent = sp.Integer(1) if exponent is None else sp.Rational(exponent.strip("() "))
+    except (ValueError, ZeroDivisionError):
+        raise ValueError("Invalid scale degree: %r" % degree)
+    # Large exponents would be calculated exactly, which could take forever
+    if base == 0 or abs(exponent) > _MAX_EXPONENT:
+        raise ValueError("Invalid scale degree: %r" % degree)
+    return base ** exponent
+
+
+def read_scale_file(file_name):
+    '''
+    Read a scale definition file
+
+    :param file_name: The file name. Scala (``.scl``) and JSON (``.json``)
+        files are supported.
+    :returns: A tuple (scale, name)
+
+    A JSON file contains either a list of degrees, or an object with the keys
+    ``scale`` (the list of degrees) and (optionally) ``name``. As elsewhere in
+    the package the list starts with 1 and ends with the formal octave. Degrees
+    may be integers, floats, or strings giving a ratio, optionally raised to a
+    rational power, such as ``"9/8"``, ``"1.5"`` or ``"2**(1/12)"``. Other expressions
+    are rejected (the strings are not evaluated):
+
+    .. code::
+
+        {"name": "Ptolemy", "scale": [1, "9/8", "5/4", "4/3", "3/2", "5/3", "15/8", 2]}
+
+    For Scala files the description line is used as the name, and for
+    JSON files without a name the file name is used.
+    '''
+    stem = os.path.splitext(os.path.basename(file_name))[0]
+    if file_name.lower().endswith(".scl"):
+        scale, description = read_scala_scale(file_name, return_description=True)
+        return scale, description or stem
+    with open(file_name) as scale_file:
+        definition = json.load(scale_file)
+    name = stem
+    if isinstance(definition, dict):
+        name = definition.get("name", stem)
+        definition = definition.get("scale")
+    if not isinstance(definition, list) or len(definition) < 2:
+        raise ValueError("No scale found in %s" % file_name)
+    return [_parse_degree(x) for x in definition], name
+
+
+def _hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_hash(file_name):
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as input_file:
+        for block in iter(lambda: input_file.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_hash(input_hash, format_name, options):
+    # The hash that an output is derived from: the input file's contents and
+    # everything else that affects the rendering.
+    if not FORMATS[format_name][2]:
+        options = {}
+    key = json.dumps([input_hash, format_name, options], sort_keys=True)
+    return _hash(key.encode("utf-8"))
+
+
+def _render_scale(job):
+    input_file, outputs, options = job
+    results = []
+    timings = {}
+    start = time.perf_counter()
+    try:
+        scale, name = read_scale_file(input_file)
+    except (ValueError, OSError) as error:
+        return input_file, results, timings, "%s" % error
+    timings["parse"] = time.perf_counter() - start
+    for format_name, output_file, source_hash in outputs:
+        start = time.perf_counter()
+        try:
+            content = FORMATS[format_name][1](scale, name, options)
+        except Exception as error:
+            # A scale that parses but can't be rendered (a symbolic degree, say)
+            # is an error for this input only
+            return input_file, results, timings, "%s: %s" % (format_name, error)
+        if not isinstance(content, bytes):
+            content = content.encode("utf-8")
+        with open(output_file, "wb") as output:
+            output.write(content)
+        timings[format_name] = time.perf_counter() - start
+        results.append((os.path.basename(output_file), source_hash, _hash(content)))
+    return input_file, results, timings, None
+
+
+def export_scales(input_directory, output_directory, formats=None, reference_note=60,
+                  reference_frequency=None, processes=None, force=False, report=None):
+    '''
+    Render tuning tables for a directory of scale definitions
+
+    :param input_directory: The directory of scale definitions (see ``read_scale_file()``)
+    :param output_directory: The directory to write the tables to. It is created if
+        it doesn't exist, and it must not be the input directory.
+    :param formats: A list of the formats to write. If ``None`` (the default) all the
+        formats are written: ``timidity``, ``fluidsynth``, ``csound``, ``scala``
+        and ``mts`` (a MIDI Tuning Standard bulk dump).
+    :param reference_note: The MIDI number of the absolute frequency reference
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :param processes: The number of worker processes to use. If ``None`` (the
+        default) one process per CPU is used. If ``1`` the work is done in the
+        calling process.
+    :param force: If ``True`` render every output, even if it is up to date
+    :param report: A function called with a line of text for each error. If
+        ``None`` errors are printed to ``stderr``.
+    :returns: A ``dict`` with the keys ``rendered``, ``skipped`` (the number of outputs
+        of each kind), ``errors`` (a list of (input file, message) tuples), and
+        ``timings``: for each format (and ``parse``, for reading the definitions), a
+        tuple of the count and total time in seconds
+
+    Each output file is named for its input (including the input's extension, so
+    that ``a.json`` and ``a.scl`` don't collide) with an extension for the format:
+    ``a.json.timidity``, ``a.scl.scl``, and so on. A
+    manifest of the SHA-256 hashes of the inputs and outputs is kept in the output
+    directory, and an output is only rendered again if its input (or the reference
+    settings) have changed, or if the output file has been changed or removed.
+    '''
+    formats = list(FORMATS) if formats is None else list(formats)
+    for format_name in formats:
+        if format_name not in FORMATS:
+            raise ValueError("Unknown format: %s" % format_name)
+    if report is None:
+        report = lambda line: print(line, file=sys.stderr)  # noqa: E731
+    options = {"reference_note": reference_note,
+               "reference_frequency": None if reference_frequency is None else float(reference_frequency)}
+    if os.path.realpath(output_directory) == os.path.realpath(input_directory):
+        raise ValueError("The output directory must not be the input directory")
+    if not os.path.isdir(output_directory):
+        os.makedirs(output_directory)
+    manifest_file = os.path.join(output_directory, _MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_file):
+        with open(manifest_file) as manifest_input:
+            manifest = json.load(manifest_input)
+
+    jobs = []
+    skipped = 0
+    for file_name in sorted(os.listdir(input_directory)):
+        input_file = os.path.join(input_directory, file_name)
+        if not file_name.lower().endswith(_SCALE_EXTENSIONS) or not os.path.isfile(input_file):
+            continue
+        input_hash = _file_hash(input_file)
+        outputs = []
+        for format_name in formats:
+            output_name = file_name + FORMATS[format_name][0]
+            output_file = os.path.join(output_directory, output_name)
+            source_hash = _source_hash(input_hash, format_name, options)
+            recorded = manifest.get(output_name)
+            if not force and recorded is not None and recorded["source"] == source_hash and \
+                    os.path.exists(output_file) and _file_hash(output_file) == recorded["output"]:
+                skipped = skipped + 1
+                continue
+            outputs.append((format_name, output_file, source_hash))
+        if len(outputs) > 0:
+            jobs.append((input_file, outputs, options))
+
+    if processes == 1 or len(jobs) <= 1:
+        results = map(_render_scale, jobs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes)
+        results = pool.imap_unordered(_render_scale, jobs)
+
+    rendered = 0
+    errors = []
+    timings = collections.OrderedDict((x, [0, 0.0]) for x in ["parse"] + formats)
+    try:
+        for input_file, outputs, job_timings, error in results:
+            if error is not None:
+                errors.append((input_file, error))
+                report("%s: %s" % (input_file, error))
+                continue
+            for output_name, source_hash, output_hash in outputs:
+                manifest[output_name] = {"source": source_hash, "output": output_hash}
+            rendered = rendered + len(outputs)
+            for key, seconds in job_timings.items():
+                timings[key][0] = timings[key][0] + 1
+                timings[key][1] = timings[key][1] + seconds
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        with open(manifest_file + ".tmp", "w") as manifest_output:
+            json.dump(manifest, manifest_output, indent=1, sort_keys=True)
+        os.replace(manifest_file + ".tmp", manifest_file)
+
+    return {"rendered": rendered, "skipped": skipped, "errors": errors,
+            "timings": collections.OrderedDict((k, tuple(v)) for k, v in timings.items())}
+
+
+def _format_summary(summary):
+    lines = ["%-12s %8s %12s %12s" % ("Format", "Count", "Total (s)", "Mean (ms)")]
+    for key, (count, seconds) in summary["timings"].items():
+        mean = 1000.0 * seconds / count if count > 0 else 0.0
+        lines.append("%-12s %8d %12.3f %12.3f" % (key, count, seconds, mean))
+    lines.append("%d rendered, %d up to date, %d errors" % (summary["rendered"], summary["skipped"],
+                                                            len(summary["errors"])))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    '''
+    The ``pytuning-export`` command
+
+    :param argv: The command line arguments. If ``None`` ``sys.argv`` is used.
+    :returns: The exit status (0 for success, 1 if any scale could not be read)
+    '''
+    parser = argparse.ArgumentParser(prog="pytuning-export",
+                                     description="Render tuning tables for a directory of Scala (.scl) "
+                                                 "and JSON (.json) scale definitions.")
+    parser.add_argument("input_directory", help="The directory of scale definitions")
+    parser.add_argument("output_directory", help="The directory to write the tables to")
+    parser.add_argument("-f", "--formats", default=",".join(FORMATS),
+                        help="Comma-separated list of formats (default: %(default)s)")
+    parser.add_argument("-n", "--reference-note", type=int, default=60,
+                        help="MIDI note of the reference frequency (default: %(default)s)")
+    parser.add_argument("-r", "--reference-frequency", type=float, default=None,
+                        help="Frequency of the reference note (default: from 12-EDO)")
+    parser.add_argument("-j", "--processes", type=int, default=None,
+                        help="Number of worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="Render outputs even if they are up to date")
+    arguments = parser.parse_args(argv)
+    try:
+        summary = export_scales(arguments.input_directory, arguments.output_directory,
+                                [x.strip() for x in arguments.formats.split(",") if x.strip()],
+                                arguments.reference_note, arguments.reference_frequency,
+                                arguments.processes, arguments.force)
+    except (ValueError, OSError) as error:
+        parser.error("%s" % error)
+    print(_format_summary(summary))
+    return 1 if len(summary["errors"]) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
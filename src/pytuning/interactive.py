@@ -20,26 +20,14 @@ from __future__ import print_function, division
 from typing import List, Any
 import sympy as sp
 
-try:
-    import matplotlib.pyplot as plt   # type: ignore
-    plt.ioff()
-    get_ipython().magic(u'matplotlib')
-except Exception:
-    print("Warning: Matplotlib not available")
-
-try:
-    import seaborn as sns   # type: ignore
-    sns.set()
-except Exception:
-    print("Warning: Seaborn not available")
-
 from pytuning.number_theory import *  # noqa
 from pytuning.constants import *  # noqa
 from pytuning.scales import *  # noqa
 from pytuning.metrics import *  # noqa
 from pytuning.tuning_tables import *  # noqa
-from pytuning.scale_creation import find_best_modes, create_scale_from_scale, find_factors  # noqa
+from pytuning.scale_creation import find_best_modes, create_scale_from_scale, find_factors, find_factors_many  # noqa
 from pytuning.visualizations import consonance_matrix  # noqa
+from pytuning.visualizations import _plotting
 
 from pytuning.scales import *  # noqa
 from pytuning.utilities import *  # noqa
@@ -53,13 +41,21 @@ except NameError:
 
 sp.init_printing(use_unicode=True)
 
+# Matplotlib (and seaborn) are loaded by the first plot, or the first use
+# of plt or sns, and pyplot is then set up for the console
+_plotting.interactive = True
+
+plt = _plotting.LazyModule("matplotlib.pyplot", _plotting.pyplot)
+sns = _plotting.LazyModule("seaborn", _plotting.seaborn)
+
+
 try:
     from IPython.display import display   # type: ignore
 except Exception:
     pass
 
 __all__ = ["harmonic_scale", "intervals", "scale", "cents",
-           "distinct_i", "generators", "Interval"]
+           "distinct_i", "generators", "plt", "sns"]
 
 # Global Variables
 
@@ -5,19 +5,19 @@ Created on Tue May 26 11:08:37 2015
 @author: mark
 """
 
-import sympy as sp
-import numpy as np
-
 from pytuning.utilities import distinct_intervals, normalize_interval
+from pytuning.backends import get_backend
 
 __all__ = ["sum_p_q","sum_distinct_intervals","metric_3","sum_p_q_for_all_intervals",
            "sum_q_for_all_intervals"]
 
-def sum_p_q(scale):
+def sum_p_q(scale, backend=None):
     '''    
     Calculate a metric for a scale
     
     :param scale: The scale.
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     :returns: A ``dict`` with the metric value.
     
     This is an estimate of scale consonance. It is derived 
@@ -46,13 +46,16 @@ def sum_p_q(scale):
         {'sum_p_q': 3138}
         
     '''
-    return {"sum_p_q": int(sum(map (lambda x: sum(list(sp.fraction(x))), scale)))}
+    backend = get_backend(backend)
+    return {"sum_p_q": int(sum(map (lambda x: sum(list(backend.fraction(x))), scale)))}
 
-def sum_distinct_intervals(scale):
+def sum_distinct_intervals(scale, backend=None):
     '''    
     Calculate a metric for a scale
     
     :param scale: The scale.
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     :returns: A ``dict`` with the metric value.
         
     This metric is an estimate of scale consonance. Numerically
@@ -71,13 +74,15 @@ def sum_distinct_intervals(scale):
     
         {'sum_distinct_intervals': 22}
     '''
-    return {"sum_distinct_intervals": len(distinct_intervals(scale))}
+    return {"sum_distinct_intervals": len(distinct_intervals(scale, backend))}
 
-def metric_3(scale):
+def metric_3(scale, backend=None):
     '''    
     Calculate a metric for a scale
     
     :param scale: The scale.
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     :returns: A ``dict`` with the metric value.
     
     Metric 3 is an estimate of scale consonance. Given a
@@ -96,18 +101,19 @@ def metric_3(scale):
     form a set of distinct intervals.
     '''
     
-    return {"metric_3": sum([1/y for y in filter(
-                    lambda x: x != 0, [(
-                        sp.fraction(x)[0] - 
-                        sp.fraction(x)[1])/
-                        sp.fraction(x)[1] for x in scale])]).evalf()
+    backend = get_backend(backend)
+    fractions = [backend.fraction(x) for x in scale]
+    return {"metric_3": backend.evaluate(sum([backend.rational(q, p - q)
+                                              for p, q in fractions if p != q]))
             }
 
-def sum_p_q_for_all_intervals(scale):
+def sum_p_q_for_all_intervals(scale, backend=None):
     '''    
     Calculate a metric for a scale
     
     :param scale: The scale (i.e., a list of ``sympy.Rational`` values)
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     :returns: The metric.
     
     This metric is an estimate of scale consonance. It is formed by examining
@@ -121,17 +127,19 @@ def sum_p_q_for_all_intervals(scale):
     Smaller values are more consonant.
     
     '''
-    
+    backend = get_backend(backend)
     return {"sum_p_q_for_all_intervals": 
-                int(sum(map (lambda x: sum(list(sp.fraction(x))), 
-                distinct_intervals(scale))))
+                int(sum(map (lambda x: sum(list(backend.fraction(x))), 
+                distinct_intervals(scale, backend))))
     }
                         
-def sum_q_for_all_intervals(scale):
+def sum_q_for_all_intervals(scale, backend=None):
     '''    
     Calculate a metric for a scale.
     
     :param scale: The scale (i.e., a list of ``Rational`` s)
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     :returns: The metric.
     
     Metric 5 is an estimate of scale consonance. It is summation
@@ -140,16 +148,19 @@ def sum_q_for_all_intervals(scale):
     
     Smaller values are more consonant.
     '''
-    m5 = np.sum([sp.fraction(normalize_interval(x))[1] 
-        for x in distinct_intervals(scale)])
+    backend = get_backend(backend)
+    m5 = sum([backend.fraction(normalize_interval(x, backend=backend))[1] 
+        for x in distinct_intervals(scale, backend)])
     
     return {"sum_q_for_all_intervals": m5}
                         
-def all_metrics(scale):
+def all_metrics(scale, backend=None):
     '''    
     Calculate all metrics for the scale
     
     :param scale: The scale (i.e., a list of ``Rational`` s)
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     :returns: A ``dict`` containing all metrics.
     
     As an example:
@@ -176,5 +187,5 @@ def all_metrics(scale):
     '''
     output = {}
     for metric in __all__:
-        output[metric] = list(globals()[metric](scale).values())[0]
+        output[metric] = list(globals()[metric](scale, backend).values())[0]
     return output
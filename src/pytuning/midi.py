@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:40:18 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import collections
+import heapq
+import struct
+
+from pytuning.tuning_tables.frequency_table import create_frequency_table
+
+__all__ = ["read_midi_events", "write_midi_file", "retune_midi_events", "retune_midi_file"]
+
+# Events are passed around as (tick, bytes) tuples, where tick is the absolute
+# time in MIDI ticks. Channel messages are stored as they appear on the wire
+# (with the status byte); meta events are stored as FF, type, data and
+# system exclusive events as F0 (or F7), data. The lengths of meta and system
+# exclusive events are added back when the events are written.
+
+_BUFFER_SIZE = 1 << 16
+
+# Controllers which are not passed through, as they would change the pitch
+# bend range set up by the retuner: data entry, data increment/decrement and
+# the (N)RPN selection controllers.
+
+_RESERVED_CONTROLLERS = frozenset([6, 38, 96, 97, 98, 99, 100, 101])
+_CONTROLLER_DEFAULTS = {7: 100, 10: 64, 11: 127}
+
+
+def _read_variable_length(stream):
+    value = 0
+    while True:
+        byte = stream.read(1)
+        if len(byte) == 0:
+            raise ValueError("Unexpected end of MIDI file")
+        value = (value << 7) | (byte[0] & 0x7F)
+        if not byte[0] & 0x80:
+            return value
+
+
+def _variable_length(value):
+    output = [value & 0x7F]
+    value = value >> 7
+    while value:
+        output.append((value & 0x7F) | 0x80)
+        value = value >> 7
+    return bytes(reversed(output))
+
+
+def _read_exactly(stream, count):
+    data = stream.read(count)
+    if len(data) != count:
+        raise ValueError("Unexpected end of MIDI file")
+    return data
+
+
+def _read_header(file_name):
+    with open(file_name, "rb") as stream:
+        chunk_type, length = struct.unpack(">4sI", _read_exactly(stream, 8))
+        if chunk_type != b"MThd" or length < 6:
+            raise ValueError("Not a standard MIDI file: %s" % file_name)
+        midi_format, track_count, division = struct.unpack(">HHH", _read_exactly(stream, 6))
+        stream.seek(length - 6, 1)
+        tracks = []
+        while len(tracks) < track_count:
+            header = stream.read(8)
+            if len(header) < 8:
+                break
+            chunk_type, length = struct.unpack(">4sI", header)
+            if chunk_type == b"MTrk":
+                tracks.append((stream.tell(), length))
+            stream.seek(length, 1)
+    return midi_format, division, tracks
+
+
+def _read_track(file_name, offset, length):
+    # Each track is read through its own file object, so that the tracks can be
+    # merged without reading any of them into memory.
+    with open(file_name, "rb", buffering=_BUFFER_SIZE) as stream:
+        stream.seek(offset)
+        end = offset + length
+        tick = 0
+        status = None
+        while stream.tell() < end:
+            tick = tick + _read_variable_length(stream)
+            first = _read_exactly(stream, 1)[0]
+            if first == 0xFF:
+                meta_type = _read_exactly(stream, 1)[0]
+                data = _read_exactly(stream, _read_variable_length(stream))
+                if meta_type == 0x2F:
+                    return
+                yield tick, bytes([0xFF, meta_type]) + data
+            elif first in (0xF0, 0xF7):
+                yield tick, bytes([first]) + _read_exactly(stream, _read_variable_length(stream))
+            else:
+                if first & 0x80:
+                    status = first
+                    data = b""
+                elif status is None:
+                    raise ValueError("MIDI data byte without a status byte")
+                else:
+                    data = bytes([first])
+                size = 1 if status & 0xF0 in (0xC0, 0xD0) else 2
+                yield tick, bytes([status]) + data + _read_exactly(stream, size - len(data))
+
+
+def read_midi_events(file_name):
+    '''
+    Read the events of a standard MIDI file
+
+    :param file_name: The name of the file
+    :returns: A tuple (division, events). ``division`` is the time division
+        from the file header, and ``events`` is a generator yielding
+        (tick, event) tuples in time order.
+
+    The tracks of the file are merged into a single time-ordered stream. The
+    file is read incrementally (each track is read through its own buffered
+    file object), so only a small part of it is in memory at any time.
+
+    In the events, ``tick`` is the absolute time in MIDI ticks and ``event``
+    is the bytes of the event. Channel messages are given in full (running
+    status is expanded), meta events as ``FF``, type, data, and system exclusive
+    messages as ``F0`` (or ``F7``), data. The end-of-track meta events are
+    not included.
+
+    A ``ValueError`` is raised for format 2 files, whose tracks are independent
+    sequences and cannot be merged.
+    '''
+    midi_format, division, tracks = _read_header(file_name)
+    if midi_format == 2:
+        raise ValueError("Format 2 MIDI files cannot be merged into a single sequence")
+    readers = [_read_track(file_name, offset, length) for offset, length in tracks]
+    return division, heapq.merge(*readers, key=lambda event: event[0])
+
+
+def write_midi_file(file_name, events, division):
+    '''
+    Write a format 0 (single track) standard MIDI file
+
+    :param file_name: The name of the file
+    :param events: An iterable of (tick, event) tuples, in time order, as
+        yielded by ``read_midi_events()``
+    :param division: The time division of the file
+    :returns: ``None``
+
+    The events are written as they are produced, and the length of the
+    track is filled in when the last event has been written, so the events
+    are never all held in memory.
+    '''
+    with open(file_name, "wb", buffering=_BUFFER_SIZE) as stream:
+        stream.write(b"MThd" + struct.pack(">IHHH", 6, 0, 1, division))
+        stream.write(b"MTrk\0\0\0\0")
+        start = stream.tell()
+        last_tick = 0
+        for tick, event in events:
+            stream.write(_variable_length(tick - last_tick))
+            last_tick = tick
+            if event[0] == 0xFF:
+                stream.write(event[:2] + _variable_length(len(event) - 2) + event[2:])
+            elif event[0] in (0xF0, 0xF7):
+                stream.write(event[:1] + _variable_length(len(event) - 1) + event[1:])
+            else:
+                stream.write(event)
+        stream.write(b"\0\xff\x2f\0")
+        end = stream.tell()
+        stream.seek(start - 4)
+        stream.write(struct.pack(">I", end - start))
+
+
+class _ChannelPool(object):
+    # The output channels used for retuned notes. Each channel has an owner, the
+    # (input channel, pitch bend) pair that it is currently playing. Channels are
+    # reused by notes with the same owner, then allocated from the free channels in
+    # least-recently-released order, and when none are free the least recently used
+    # channel is stolen. All of these lookups are constant time.
+
+    def __init__(self, channels):
+        self.owner = dict((c, None) for c in channels)
+        self.bend = dict((c, None) for c in channels)
+        self.program = dict((c, None) for c in channels)
+        self.controllers = dict((c, {}) for c in channels)
+        self.voices = dict((c, []) for c in channels)
+        self.busy = collections.OrderedDict()
+        self.free = collections.OrderedDict((c, None) for c in channels)
+        self.busy_owners = {}
+        self.free_owners = {}
+
+    def find(self, owner):
+        return self.busy_owners.get(owner)
+
+    def allocate(self, owner):
+        # Returns the channel, and the voices that must be stopped to use it
+        channel = self.free_owners.get(owner)
+        if channel is None:
+            channel = next(iter(self.free)) if len(self.free) > 0 else next(iter(self.busy))
+        stolen = self.voices[channel]
+        self._release(channel)
+        self.free.pop(channel)
+        if self.free_owners.get(self.owner[channel]) == channel:
+            del self.free_owners[self.owner[channel]]
+        self.owner[channel] = owner
+        self.busy[channel] = None
+        self.busy_owners[owner] = channel
+        return channel, stolen
+
+    def add_voice(self, channel, voice):
+        self.voices[channel].append(voice)
+        self.busy.move_to_end(channel)
+
+    def remove_voice(self, channel, input_channel, note):
+        voices = self.voices[channel]
+        for index, voice in enumerate(voices):
+            if voice[0] == input_channel and voice[1] == note:
+                del voices[index]
+                if len(voices) == 0:
+                    self._release(channel)
+                return voice
+
+    def _release(self, channel):
+        if channel in self.busy:
+            del self.busy[channel]
+            if self.busy_owners.get(self.owner[channel]) == channel:
+                del self.busy_owners[self.owner[channel]]
+            self.free[channel] = None
+            self.free_owners[self.owner[channel]] = channel
+        self.voices[channel] = []
+
+    def owned_by(self, input_channel):
+        return [c for c, owner in self.owner.items() if owner is not None and owner[0] == input_channel]
+
+
+def _pitch_bend_message(channel, bend):
+    return bytes([0xE0 | channel, bend & 0x7F, bend >> 7])
+
+
+def _bend_range_messages(channel, bend_range):
+    semitones = int(bend_range)
+    cents = int(round((bend_range - semitones) * 100))
+    return [bytes([0xB0 | channel, controller, value]) for controller, value in
+            [(101, 0), (100, 0), (6, semitones), (38, cents), (101, 127), (100, 127)]]
+
+
+def retune_midi_events(events, scale, reference_note=60, reference_frequency=None, keyboard_mapping=None,
+                       bend_range=2.0, passthrough_channels=(9,), channels=None):
+    '''
+    Retune a stream of MIDI events to a scale using pitch bend
+
+    :param events: An iterable of (tick, event) tuples, as yielded by ``read_midi_events()``
+    :param scale: The scale (list of frequency ratios)
+    :param reference_note: The MIDI number of the absolute frequency reference
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :param keyboard_mapping: An optional ``KeyboardMapping``
+    :param bend_range: The pitch bend range to use, in semitones. It is set
+        on each output channel at the start of the stream.
+    :param passthrough_channels: Channels (0-15) whose events are passed through
+        unchanged. By default this is the General MIDI percussion channel.
+    :param channels: The output channels used for the retuned notes. If ``None``
+        (the default) all the channels that are not passed through are used.
+    :returns: A generator yielding (tick, event) tuples
+
+    Each note is played as the nearest 12-EDO note with a pitch bend, taken
+    from a table calculated once from the scale (see
+    ``FrequencyTable.pitch_bends()``). As pitch bend applies to a whole
+    channel, notes with different bends must be played on different channels,
+    so the notes of each input channel are distributed over a pool of output
+    channels. Program changes and controllers are sent to the output channels
+    that an input channel is using. When more distinct bends are sounding than
+    there are channels, the least recently used channel is stolen (its sounding
+    notes are ended).
+
+    Pitch bend messages in the input, and controllers that would change the
+    pitch bend range, are removed. Notes which the scale places outside of the
+    MIDI range are dropped. The memory used is bounded by the number of
+    channels and notes, not by the length of the stream.
+    '''
+    table = create_frequency_table(scale, reference_note, reference_frequency, keyboard_mapping)
+    note_table, bend_table = [x.tolist() for x in table.pitch_bends(bend_range)]
+    passthrough_channels = frozenset(passthrough_channels)
+    if channels is None:
+        channels = [c for c in range(16) if c not in passthrough_channels]
+    pool = _ChannelPool(channels)
+    programs = {}
+    controllers = collections.defaultdict(dict)
+    sounding = collections.defaultdict(list)
+
+    for channel in channels:
+        for message in _bend_range_messages(channel, bend_range):
+            yield 0, message
+        yield 0, _pitch_bend_message(channel, 8192)
+        pool.bend[channel] = 8192
+
+    for tick, event in events:
+        status = event[0]
+        kind = status & 0xF0
+        input_channel = status & 0x0F
+        if status >= 0xF0 or input_channel in passthrough_channels:
+            yield tick, event
+            continue
+        if kind == 0x90 and event[2] > 0:
+            note = event[1]
+            output_note = note_table[note]
+            if output_note < 0:
+                continue
+            bend = bend_table[note]
+            owner = (input_channel, bend)
+            channel = pool.find(owner)
+            if channel is None:
+                channel, stolen = pool.allocate(owner)
+                for stolen_input, stolen_note, stolen_output in stolen:
+                    sounding[(stolen_input, stolen_note)].remove(channel)
+                    yield tick, bytes([0x80 | channel, stolen_output, 0])
+                # An input channel without a program change plays the General MIDI default,
+                # program 0, which is also what a channel that has never had one plays
+                program = programs.get(input_channel, 0)
+                if (pool.program[channel] or 0) != program:
+                    pool.program[channel] = program
+                    yield tick, bytes([0xC0 | channel, program])
+                wanted = controllers[input_channel]
+                current = pool.controllers[channel]
+                for controller in sorted(set(wanted) | set(current)):
+                    value = wanted.get(controller, _CONTROLLER_DEFAULTS.get(controller, 0))
+                    if current.get(controller, _CONTROLLER_DEFAULTS.get(controller, 0)) != value:
+                        yield tick, bytes([0xB0 | channel, controller, value])
+                pool.controllers[channel] = dict(wanted)
+                if pool.bend[channel] != bend:
+                    pool.bend[channel] = bend
+                    yield tick, _pitch_bend_message(channel, bend)
+            pool.add_voice(channel, (input_channel, note, output_note))
+            sounding[(input_channel, note)].append(channel)
+            yield tick, bytes([0x90 | channel, output_note, event[2]])
+        elif kind == 0x80 or kind == 0x90:
+            note = event[1]
+            if len(sounding[(input_channel, note)]) == 0:
+                continue
+            channel = sounding[(input_channel, note)].pop(0)
+            voice = pool.remove_voice(channel, input_channel, note)
+            yield tick, bytes([kind | channel, voice[2], event[2]])
+        elif kind == 0xA0:
+            for channel in sounding[(input_channel, event[1])]:
+                yield tick, bytes([0xA0 | channel, note_table[event[1]], event[2]])
+        elif kind == 0xB0:
+            if event[1] in _RESERVED_CONTROLLERS:
+                continue
+            controllers[input_channel][event[1]] = event[2]
+            for channel in pool.owned_by(input_channel):
+                pool.controllers[channel][event[1]] = event[2]
+                yield tick, bytes([0xB0 | channel, event[1], event[2]])
+        elif kind == 0xC0:
+            programs[input_channel] = event[1]
+            for channel in pool.owned_by(input_channel):
+                pool.program[channel] = event[1]
+                yield tick, bytes([0xC0 | channel, event[1]])
+        elif kind == 0xD0:
+            for channel in pool.owned_by(input_channel):
+                yield tick, bytes([0xD0 | channel, event[1]])
+
+
+def retune_midi_file(input_file, output_file, scale, reference_note=60, reference_frequency=None,
+                     keyboard_mapping=None, bend_range=2.0, passthrough_channels=(9,), channels=None):
+    '''
+    Retune a standard MIDI file to a scale using pitch bend
+
+    :param input_file: The name of the MIDI file to read
+    :param output_file: The name of the MIDI file to write
+    :param scale: The scale (list of frequency ratios)
+
+    The other parameters are the same as for ``retune_midi_events()``.
+
+    The file is processed in a single pass: the events of the input are read,
+    retuned, and written as a format 0 file as they are processed, so files
+    of any length can be retuned in a small amount of memory. For example:
+
+    .. code::
+
+        from pytuning.midi import retune_midi_file
+        from pytuning.scales import create_quarter_comma_meantone_scale
+
+        retune_midi_file("bach.mid", "bach_meantone.mid", create_quarter_comma_meantone_scale(),
+                         reference_note=69, reference_frequency=440.0)
+    '''
+    division, events = read_midi_events(input_file)
+    write_midi_file(output_file, retune_midi_events(events, scale, reference_note, reference_frequency,
+                                                    keyboard_mapping, bend_range, passthrough_channels,
+                                                    channels), division)
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:12:31 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+from fractions import Fraction
+
+import numpy as np
+import sympy as sp
+from sympy.ntheory.factor_ import factorrat
+
+try:
+    numbers = sp.numbers   # type:ignore
+except AttributeError:
+    numbers = sp.core.numbers
+
+__all__ = ["MonzoScale"]
+
+
+def _first_primes(count):
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if sp.isprime(candidate):
+            primes.append(candidate)
+        candidate = candidate + 1
+    return primes
+
+
+class MonzoScale(object):
+    '''
+    A scale represented as a matrix of prime exponents (monzos)
+
+    :param monzos: The exponent vectors of the degrees. This can be
+        a two-dimensional array (degrees by primes) or a list of tuples
+        such as those returned by ``prime_factor_ratio(r, return_as_vector=True)``.
+        Shorter vectors are padded with zeros.
+    :param primes: The primes that the columns refer to. If ``None``
+        (the default) the columns are the successive primes, starting at 2.
+
+    Each degree of the scale is stored as a vector of exponents over the
+    primes. Thus :math:`\\frac{81}{64}` would be stored as ``(-6, 4)``,
+    and :math:`\\frac{5}{4}` as ``(-2, 0, 1)``. The exponents of the whole scale
+    are held in the ``monzos`` member, a NumPy integer matrix with one row per
+    degree and one column per prime.
+
+    In this representation forming an interval is a subtraction of two
+    vectors, and normalizing to the octave only changes the exponent of 2, so
+    analyses that would otherwise need a great deal of rational arithmetic
+    (finding distinct intervals, or calculating the p/q metrics) can be
+    done as array operations.
+
+    Only scales with rational degrees can be represented. Conversion to and
+    from a list of ``sympy`` values is lossless:
+
+    .. code::
+
+        pythag = create_pythagorean_scale()
+        monzo_scale = MonzoScale.from_scale(pythag)
+        monzo_scale.to_scale() == pythag
+        True
+
+    Note that, as elsewhere in the package, the last degree of the scale
+    is taken as the formal octave.
+    '''
+    def __init__(self, monzos, primes=None):
+        rows = [tuple(int(e) for e in row) for row in monzos]
+        width = max([len(row) for row in rows] + [1])
+        if primes is None:
+            primes = _first_primes(width)
+        if width > len(primes):
+            raise ValueError("There are more exponents than primes")
+        self.primes = np.array(primes, dtype=np.int64)
+        self.monzos = np.zeros((len(rows), len(self.primes)), dtype=np.int64)
+        for index, row in enumerate(rows):
+            self.monzos[index, :len(row)] = row
+
+    @classmethod
+    def from_scale(cls, scale):
+        '''
+        Create a ``MonzoScale`` from a scale
+
+        :param scale: The scale (a list of ``sympy.Rational`` values)
+        :returns: The ``MonzoScale``
+        '''
+        factorizations = []
+        for degree in scale:
+            degree = sp.sympify(degree)
+            if not isinstance(degree, numbers.Rational) or degree <= 0:
+                raise ValueError("Only positive rational degrees can be represented as monzos: %s" % degree)
+            factorizations.append(dict(factorrat(degree)))
+        largest = max([max(f) for f in factorizations if len(f) > 0] + [2])
+        primes = list(sp.primerange(2, largest + 1))
+        return cls([[f.get(p, 0) for p in primes] for f in factorizations], primes)
+
+    def __len__(self):
+        return self.monzos.shape[0]
+
+    def __repr__(self):
+        return "MonzoScale(%s, primes=%s)" % (self.monzos.tolist(), self.primes.tolist())
+
+    def _derived(self, monzos):
+        output = MonzoScale([], self.primes)
+        output.monzos = np.asarray(monzos, dtype=np.int64).reshape(-1, len(self.primes))
+        return output
+
+    def ratios(self):
+        '''
+        Calculate the numerators and denominators of the degrees
+
+        :returns: A tuple of two NumPy arrays (numerators, denominators).
+            The entries are Python integers, so they are exact for any size.
+        '''
+        primes = self.primes.astype(object)
+        exponents = self.monzos.astype(object)
+        numerators = np.prod(primes ** np.maximum(exponents, 0), axis=1, dtype=object)
+        denominators = np.prod(primes ** np.maximum(-exponents, 0), axis=1, dtype=object)
+        return numerators, denominators
+
+    def to_scale(self):
+        '''
+        Convert to a list of ``sympy`` values
+
+        :returns: The scale (a list of ``sympy.Rational`` values)
+        '''
+        numerators, denominators = self.ratios()
+        return [sp.Rational(p, q) for p, q in zip(numerators, denominators)]
+
+    def log2(self):
+        '''
+        The base-2 logarithm of each degree
+
+        :returns: A NumPy ``float64`` array
+        '''
+        return self.monzos.dot(np.log2(self.primes.astype(np.float64)))
+
+    def cents(self):
+        '''
+        The size of each degree, in cents
+
+        :returns: A NumPy ``float64`` array
+        '''
+        return 1200.0 * self.log2()
+
+    def _octave_vector(self, octave):
+        factors = dict(factorrat(sp.Rational(octave)))
+        if any(p not in self.primes for p in factors):
+            raise ValueError("The octave %s cannot be expressed over the primes %s" % (octave, self.primes.tolist()))
+        return np.array([factors.get(p, 0) for p in self.primes.tolist()], dtype=np.int64)
+
+    def normalize(self, octave=2):
+        '''
+        Normalize the degrees to the octave
+
+        :param octave: The formal octave
+        :returns: A new ``MonzoScale``
+
+        This follows the same conventions as ``normalize_interval()``. For the
+        usual octave of 2 only the exponent of 2 changes.
+        '''
+        octave_vector = self._octave_vector(octave)
+        octaves = self.log2() / np.log2(float(octave))
+        nearest = np.round(octaves)
+        octaves = np.where(np.abs(octaves - nearest) < 1e-9, nearest, octaves)
+        shift = np.ceil(octaves) - 1
+        shift[~self.monzos.any(axis=1)] = 0
+        return self._derived(self.monzos - np.outer(shift.astype(np.int64), octave_vector))
+
+    def interval_matrix(self):
+        '''
+        Calculate the intervals between all pairs of degrees
+
+        :returns: A three-dimensional integer array. Entry ``[i, j]`` is the monzo
+            of ``scale[i] / scale[j]``.
+        '''
+        return self.monzos[:, np.newaxis, :] - self.monzos[np.newaxis, :, :]
+
+    def distinct_intervals(self):
+        '''
+        Find the distinct intervals in the scale, including inversions
+
+        :returns: A ``MonzoScale`` of the distinct intervals
+
+        This is the equivalent of ``pytuning.utilities.distinct_intervals()``.
+        '''
+        doubled = np.vstack([self.monzos, self.monzos + self.monzos[-1]])
+        first, second = np.triu_indices(doubled.shape[0], k=1)
+        intervals = np.unique(doubled[second] - doubled[first], axis=0)
+        intervals = self._derived(intervals)
+        keep = (intervals.log2() < 1.0) & intervals.monzos.any(axis=1)
+        return self._derived(intervals.monzos[keep])
+
+    def sum_p_q(self):
+        '''
+        Equivalent to ``pytuning.metrics.sum_p_q()``
+        '''
+        numerators, denominators = self.ratios()
+        return {"sum_p_q": int(np.sum(numerators + denominators))}
+
+    def sum_distinct_intervals(self):
+        '''
+        Equivalent to ``pytuning.metrics.sum_distinct_intervals()``
+        '''
+        return {"sum_distinct_intervals": len(self.distinct_intervals())}
+
+    def metric_3(self):
+        '''
+        Equivalent to ``pytuning.metrics.metric_3()``
+        '''
+        numerators, denominators = self.ratios()
+        return {"metric_3": float(sum(Fraction(q, p - q) for p, q in zip(numerators, denominators) if p != q))}
+
+    def sum_p_q_for_all_intervals(self):
+        '''
+        Equivalent to ``pytuning.metrics.sum_p_q_for_all_intervals()``
+        '''
+        numerators, denominators = self.distinct_intervals().ratios()
+        return {"sum_p_q_for_all_intervals": int(np.sum(numerators + denominators))}
+
+    def sum_q_for_all_intervals(self):
+        '''
+        Equivalent to ``pytuning.metrics.sum_q_for_all_intervals()``
+        '''
+        numerators, denominators = self.distinct_intervals().normalize().ratios()
+        return {"sum_q_for_all_intervals": int(np.sum(denominators))}
+
+    def all_metrics(self):
+        '''
+        Calculate all the metrics for the scale
+
+        :returns: A ``dict`` with the same contents as ``pytuning.metrics.all_metrics()``
+        '''
+        output = {}
+        for metric in [self.sum_p_q, self.sum_distinct_intervals, self.metric_3,
+                       self.sum_p_q_for_all_intervals, self.sum_q_for_all_intervals]:
+            output.update(metric())
+        return output
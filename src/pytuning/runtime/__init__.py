@@ -0,0 +1,11 @@
+from pytuning.runtime.scales import reduce_to_octave, create_edo_scale, create_harmonic_scale, \
+    create_equal_interval_scale
+from pytuning.runtime.conversions import ratio_to_cents, cents_to_ratio, note_number_to_freq, \
+    edo12_frequency
+from pytuning.runtime.tables import create_frequency_table, create_timidity_tuning, create_em_tuning, \
+    create_fluidsynth_tuning, create_csound_tuning, create_scala_tuning
+
+__all__ = ["reduce_to_octave", "create_edo_scale", "create_harmonic_scale", "create_equal_interval_scale",
+           "ratio_to_cents", "cents_to_ratio", "note_number_to_freq", "edo12_frequency",
+           "create_frequency_table", "create_timidity_tuning", "create_em_tuning",
+           "create_fluidsynth_tuning", "create_csound_tuning", "create_scala_tuning"]
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 21:52:17 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import math
+from fractions import Fraction
+
+from pytuning.runtime.scales import create_edo_scale
+
+__all__ = ["ratio_to_cents", "cents_to_ratio", "note_number_to_freq", "edo12_frequency"]
+
+
+def ratio_to_cents(ratio):
+    '''
+    Convert a scale degree to a cent value
+
+    :param ratio: The scale degree (``float``, ``int`` or ``fractions.Fraction``)
+    :returns: The scale degree in cents (``float``)
+
+    For exact ratios the logarithms of the numerator and denominator are taken
+    separately, so ratios of large integers are handled without loss of precision.
+    '''
+    if isinstance(ratio, (int, Fraction)):
+        ratio = Fraction(ratio)
+        return 1200.0 * (math.log2(ratio.numerator) - math.log2(ratio.denominator))
+    return 1200.0 * math.log2(ratio)
+
+
+def cents_to_ratio(cents):
+    '''
+    Convert a cent value to a ratio
+
+    :param cents: The degree value in cents
+    :returns: the frequency ratio (``float``)
+    '''
+    return 2.0 ** (cents / 1200.0)
+
+
+def edo12_frequency(note, concert_pitch=440.0):
+    '''
+    The frequency of a MIDI note in the standard tuning (12-EDO, A4 = 440 Hz)
+
+    :param note: The note number
+    :param concert_pitch: The frequency of A4 (note 69)
+    :returns: The frequency in Hertz
+    '''
+    return concert_pitch * 2.0 ** ((note - 69.0) / 12.0)
+
+
+def note_number_to_freq(note, scale=None, reference_note=69, reference_frequency=440.0):
+    '''
+    Convert a note number (MIDI) to a frequency (Hz).
+
+    :param note: The note number (0<=note<=127)
+    :param scale: The scale. If none it assume EDO 12.
+    :param reference_note: The conversions reference note
+    :param reference_frequency: The frequency of the reference note
+    :returns: The frequency of the note in Hertz (``float``)
+
+    The default values for ``reference_note`` and ``reference_frequency``
+    correspond to standard orchestral tuning, a4 = 440 Hz.
+    '''
+    if scale is None:
+        scale = create_edo_scale(12)
+    octave_offset, note_offset = divmod(note - reference_note, len(scale) - 1)
+    return reference_frequency * float(scale[-1]) ** octave_offset * float(scale[note_offset])
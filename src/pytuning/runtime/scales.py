@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 21:49:03 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+from fractions import Fraction
+
+__all__ = ["reduce_to_octave", "create_edo_scale", "create_harmonic_scale", "create_equal_interval_scale"]
+
+
+def reduce_to_octave(interval, octave=2):
+    '''
+    Normalize an interval by repeated multiplication or division by the octave
+
+    :param interval: The interval (a number of any type supporting arithmetic and comparison)
+    :param octave: The formal octave
+    :returns: The normalized interval
+
+    The interval is brought into the range :math:`1 \\le i \\le octave`, with powers of
+    the octave (other than the unison) mapped onto the octave itself, as
+    ``pytuning.utilities.normalize_interval()`` does. Only exact comparisons are used,
+    and it is cheap when the interval is already close to the target range (as it is
+    when walking a chain of generators).
+    '''
+    if interval >= octave:
+        while interval > octave:
+            interval = interval / octave
+    elif interval < 1:
+        while interval <= 1:
+            interval = interval * octave
+    return interval
+
+
+def _generator_chain(generator, length, octave, normalize):
+    '''
+    Walk a chain of generators, yielding ``generator ** index`` for
+    ``index`` in ``range(length)``. Each degree is formed from the previous
+    one, so the cost of the chain is linear in its length.
+    '''
+    x = generator ** 0
+    for index in range(length):
+        if index > 0:
+            x = x * generator
+            if normalize:
+                x = reduce_to_octave(x, octave)
+                # An exact power of the octave maps onto the octave, not the unison
+                if x == 1 and generator != 1:
+                    x = x * octave
+        yield x
+
+
+def create_edo_scale(number_tones, octave=2):
+    '''
+    Create an equal division of octave (EDO, ET) scale
+
+    :param number_tones: The number of tones/divisions in the scale
+    :param octave: The formal octave (frequency ratio)
+    :returns: The scale, as a list of ``float`` values
+    '''
+    return [1.0] + [float(octave) ** (index / number_tones) for index in range(1, number_tones)] + \
+        [float(octave)]
+
+
+def create_harmonic_scale(first_harmonic, last_harmonic, normalize=True, octave=2):
+    '''
+    Create a harmonic scale
+
+    :param first_harmonic: The first harmonic
+    :param last_harmonic: The last harmonic
+    :param normalize: If true, normalize the scale to an octave
+        (2/1 by default, otherwise taken from ``octave``)
+    :param octave: The definition of the formal octave.
+    :returns: The scale, as a list of ``fractions.Fraction`` values
+    '''
+    octave = Fraction(octave)
+    output = set([Fraction(1), octave])
+    for harmonic in range(first_harmonic, last_harmonic + 1):
+        interval = Fraction(harmonic, first_harmonic)
+        output.add(reduce_to_octave(interval, octave) if normalize else interval)
+    return sorted(output)
+
+
+def create_equal_interval_scale(generator_interval, scale_size=12, number_down_intervals=6,
+                                epsilon=None, sort=True, octave=2, remove_duplicates=True,
+                                normalize=True):
+    '''
+    Create a scale with equal-interval tuning
+
+    :param generator_interval: The interval to use for generation (``float`` or
+        ``fractions.Fraction``)
+    :param scale_size: The number of degrees in the scale
+    :param number_down_intervals: The number of inverted intervals to use in
+        scale construction.
+    :param epsilon: Rounding parameter. If set to ``None`` no rounding is
+        done. Otherwise the scale degrees are rounded to the nearest
+        epsilon
+    :param sort: If ``True``, sort the output by degree size
+    :param octave: The formal octave
+    :param remove_duplicates: If ``True`` remove duplicate entries
+    :param normalize: IF ``True``, normalize the degrees to the octave
+    :returns: The scale
+
+    The scale is constructed as by ``pytuning.scales.create_equal_interval_scale()``.
+    A ``Fraction`` generator gives an exact scale of ``Fraction`` values, and
+    a ``float`` generator a scale of ``float`` values.
+    '''
+    down_intervals = number_down_intervals + 1
+    up_intervals = scale_size - down_intervals + 1
+    if isinstance(generator_interval, (int, Fraction)) and isinstance(octave, (int, Fraction)):
+        generator_interval = Fraction(generator_interval)
+        octave = Fraction(octave)
+    else:
+        generator_interval = float(generator_interval)
+        octave = float(octave)
+    output = list(_generator_chain(generator_interval, up_intervals, octave, normalize))
+    output = output + list(_generator_chain(1 / generator_interval, down_intervals, octave, normalize))
+    output = output + [octave]
+    if epsilon is not None:
+        output = list(set([round(y / epsilon) * epsilon for y in output]))
+    if sort:
+        output = sorted(output)
+        if remove_duplicates:
+            output = sorted(set(output))
+    return output
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 21:57:40 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+from fractions import Fraction
+
+from pytuning.runtime.conversions import edo12_frequency, ratio_to_cents
+
+__all__ = ["create_frequency_table", "create_timidity_tuning", "create_em_tuning",
+           "create_fluidsynth_tuning", "create_csound_tuning", "create_scala_tuning"]
+
+
+def _format_frequency(frequency):
+    '''
+    Format a frequency to fifteen significant figures, in the same way as
+    a (default precision) ``sympy`` floating point value.
+    '''
+    mantissa, exponent = ("%.14e" % abs(frequency)).split("e")
+    digits = mantissa.replace(".", "")
+    exponent = int(exponent)
+    sign = "-" if frequency < 0 else ""
+    if exponent >= 0:
+        return sign + digits[:exponent + 1] + "." + digits[exponent + 1:]
+    return sign + "0." + "0" * (-exponent - 1) + digits
+
+
+def create_frequency_table(scale, reference_note=60, reference_frequency=None):
+    '''
+    Calculate the frequencies of all 128 MIDI notes for a scale
+
+    :param scale: The scale (list of frequency ratios)
+    :param reference_note: The MIDI number of the absolute frequency reference
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :returns: A list of 128 ``float`` frequencies, indexed by note number
+
+    The notes are assigned to degrees as by ``pytuning.tuning_tables.FrequencyTable``.
+    '''
+    if reference_frequency is None:
+        reference_frequency = edo12_frequency(reference_note)
+    reference_frequency = float(reference_frequency)
+    degrees = [float(x) for x in scale]
+    steps = len(degrees) - 1
+    offsets = [note - reference_note for note in range(128)]
+    return [reference_frequency * degrees[-1] ** (x // steps) * degrees[x % steps] for x in offsets]
+
+
+def _reference(reference_note, reference_frequency):
+    if reference_frequency is None:
+        reference_frequency = edo12_frequency(reference_note)
+    return reference_note, float(reference_frequency)
+
+
+def create_timidity_tuning(scale, reference_note=60, reference_frequency=None):
+    '''
+    Create a Timidity++ tuning table
+
+    The parameters and output are those of ``pytuning.tuning_tables.create_timidity_tuning()``.
+    '''
+    reference_note, reference_frequency = _reference(reference_note, reference_frequency)
+    frequencies = create_frequency_table(scale, reference_note, reference_frequency)
+    return '''# Timidity tuning table created by pytuning,
+# call timidity with the -Z option to enable.
+# Note reference: %d; Freq reference: %f Hz''' % (reference_note, reference_frequency) + \
+        "".join(["\n%d" % round(x * 1000.0) for x in frequencies])
+
+
+def create_em_tuning(scale, reference_note=60, reference_frequency=None):
+    '''
+    Create an Emergent tuning table
+
+    The parameters and output are those of ``pytuning.tuning_tables.create_em_tuning()``.
+    '''
+    reference_note, reference_frequency = _reference(reference_note, reference_frequency)
+    frequencies = create_frequency_table(scale, reference_note, reference_frequency)
+    return '''# Emergent Tuning Table created by MCW
+# Note reference: %d; Freq reference: %f Hz''' % (reference_note, reference_frequency) + \
+        "".join(["\nset tuning ( %d    %s)" % (note, _format_frequency(freq)) for note, freq in enumerate(frequencies)])
+
+
+def create_fluidsynth_tuning(scale, reference_note=60, chan=[0], bank=0, prog=[0],
+                             reference_frequency=None):
+    '''
+    Create a Fluidsynth tuning table
+
+    The parameters and output are those of ``pytuning.tuning_tables.create_fluidsynth_tuning()``.
+    '''
+    reference_note, reference_frequency = _reference(reference_note, reference_frequency)
+    frequencies = create_frequency_table(scale, reference_note, reference_frequency)
+    zero = edo12_frequency(0)
+    cents = [ratio_to_cents(x / zero) for x in frequencies]
+    notes = [" %d %f" % (note, x if x > 0.00001 else 0.0) for note, x in enumerate(cents)]
+    output = ['''# Fluidsynth Tuning Table created by pytuning
+# Note reference: %d; Freq reference: %f Hz''' % (reference_note, reference_frequency)]
+    for program in prog:
+        prefix = "\ntune %d %d" % (bank, program)
+        output.append("\ntuning tuning%03d %d %d" % (program, bank, program) + "".join([prefix + x for x in notes]))
+    for channel in chan:
+        output.append("".join(["\nsettuning %d %d %d" % (channel, bank, program) for program in prog]))
+    return "".join(output)
+
+
+def create_csound_tuning(scale, reference_note=60, reference_frequency=None, table_num=1):
+    '''
+    Create a CSound tuning table
+
+    The parameters and output are those of ``pytuning.tuning_tables.create_csound_tuning()``.
+    '''
+    frequencies = create_frequency_table(scale, reference_note, reference_frequency)
+    entries_per_line = 8
+    representations = ["%11.5f" % freq for freq in frequencies]
+    lines = []
+    for index in range(0, len(representations), entries_per_line):
+        prefix = "f%d 0 256 -2 " % table_num if index == 0 else "            "
+        lines.append(prefix + " ".join(representations[index:index + entries_per_line]))
+    return " \\\n".join(lines) + "\n"
+
+
+def create_scala_tuning(scale, name):
+    '''
+    Create a Scala scale file
+
+    The parameters and output are those of ``pytuning.tuning_tables.create_scala_tuning()``:
+    exact degrees (``int`` or ``fractions.Fraction``) are written as ratios, and others
+    in cents.
+    '''
+    output = ["! Scale produced by pytuning. For tuning yoshimi or zynaddsubfx,\n! only include the portion below the final '!'",
+              "\n!", "\n%s" % name, "\n%3d" % (len(scale) - 1), "\n!"]
+    for degree in scale[1:]:
+        if isinstance(degree, (int, Fraction)):
+            output.append("\n%s" % Fraction(degree))
+        else:
+            output.append("\n%0.5f" % ratio_to_cents(degree))
+    return "".join(output)
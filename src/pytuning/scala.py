@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 13:41:09 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import io
+import math
+import multiprocessing
+import os
+from fractions import Fraction
+
+import numpy as np
+import sympy as sp
+
+__all__ = ["parse_scala_scale", "read_scala_scale", "parse_scala_keyboard_mapping",
+           "read_scala_keyboard_mapping", "index_scala_archive", "ScalaIndex"]
+
+# Scala files pre-date any widespread use of UTF-8, and the files in the
+# Scala archive are mostly ISO-8859-1. Latin-1 can decode any byte sequence,
+# so reading never fails on the description.
+
+_SCALA_ENCODING = "latin-1"
+
+
+def _read_text(file_name):
+    with io.open(file_name, "r", encoding=_SCALA_ENCODING) as scala_file:
+        return scala_file.read()
+
+
+def _non_comment_lines(text):
+    return [line.strip() for line in text.splitlines() if not line.lstrip().startswith("!")]
+
+
+def _split_scala_scale(text):
+    lines = _non_comment_lines(text)
+    if len(lines) < 2:
+        raise ValueError("Not a Scala scale: the description or note count is missing")
+    description = lines[0]
+    try:
+        count = int(lines[1].split()[0])
+    except (IndexError, ValueError):
+        raise ValueError("Invalid note count in Scala scale: %r" % lines[1])
+    pitches = [line.split()[0] for line in lines[2:] if line]
+    if len(pitches) < count:
+        raise ValueError("Scala scale has %d pitches, but %d were declared" % (len(pitches), count))
+    return description, pitches[:count]
+
+
+def _pitch_to_ratio(pitch):
+    try:
+        if "." in pitch:
+            return 2 ** (sp.Rational(pitch) / 1200)
+        ratio = sp.Rational(pitch)
+    except (TypeError, ValueError, sp.SympifyError):
+        raise ValueError("Invalid pitch in Scala scale: %r" % pitch)
+    if ratio <= 0:
+        raise ValueError("Invalid pitch in Scala scale: %r" % pitch)
+    return ratio
+
+
+def parse_scala_scale(text, return_description=False):
+    '''
+    Parse the contents of a Scala scale (``.scl``) file
+
+    :param text: The contents of the file
+    :param return_description: If ``True`` return the description line
+        of the file as well as the scale
+    :returns: The scale, or a tuple (scale, description)
+
+    Pitches given as ratios (for example ``3/2`` or ``2``) become exact
+    ``sympy.Rational`` values, and pitches given in cents (any value with
+    a decimal point) become exact powers of two, so 700.0 cents is returned as
+    :math:`2^{\\frac{7}{12}}`.
+
+    As elsewhere in the package the returned scale starts with 1 (which
+    is implicit in the Scala file) and the last degree is the formal octave.
+    The degrees are returned in the order that they appear in the file.
+
+    A ``ValueError`` is raised if the text is not a valid Scala scale.
+    '''
+    description, pitches = _split_scala_scale(text)
+    scale = [sp.Integer(1)] + [_pitch_to_ratio(pitch) for pitch in pitches]
+    if return_description:
+        return scale, description
+    return scale
+
+
+def read_scala_scale(file_name, return_description=False):
+    '''
+    Read a Scala scale (``.scl``) file
+
+    :param file_name: The name of the file
+    :param return_description: If ``True`` return the description line
+        of the file as well as the scale
+    :returns: The scale, or a tuple (scale, description)
+
+    See ``parse_scala_scale()`` for details. For example, a file written
+    by ``create_scala_tuning()`` can be read back in:
+
+    .. code::
+
+        with open("pythagorean.scl", "w") as scl:
+            scl.write(create_scala_tuning(create_pythagorean_scale(), "Pythagorean"))
+
+        scale = read_scala_scale("pythagorean.scl")
+    '''
+    return parse_scala_scale(_read_text(file_name), return_description)
+
+
+def parse_scala_keyboard_mapping(text):
+    '''
+    Parse the contents of a Scala keyboard mapping (``.kbm``) file
+
+    :param text: The contents of the file
+    :returns: A ``dict`` describing the mapping
+
+    The keys of the returned ``dict`` are:
+
+    * ``size``: The size of the mapping pattern (0 for a linear mapping)
+    * ``first_note``: The first MIDI note to retune
+    * ``last_note``: The last MIDI note to retune
+    * ``middle_note``: The MIDI note to which the first entry of the
+      mapping is assigned
+    * ``reference_note``: The MIDI note for which the frequency is given
+    * ``reference_frequency``: The frequency of the reference note
+    * ``octave_degree``: The scale degree which is taken as the formal octave
+    * ``mapping``: A list of ``size`` scale degrees, with ``None`` for keys
+      which are not mapped (``x`` in the file)
+
+    A ``ValueError`` is raised if the text is not a valid keyboard mapping.
+    '''
+    values = [line.split()[0] for line in _non_comment_lines(text) if line]
+    if len(values) < 7:
+        raise ValueError("Not a Scala keyboard mapping: the header is incomplete")
+    try:
+        header = [int(x) for x in values[0:5]] + [float(values[5]), int(values[6])]
+        mapping = [None if x.lower() == "x" else int(x) for x in values[7:7 + header[0]]]
+    except ValueError:
+        raise ValueError("Invalid value in Scala keyboard mapping")
+    mapping = mapping + [None] * (header[0] - len(mapping))
+    keys = ["size", "first_note", "last_note", "middle_note", "reference_note",
+            "reference_frequency", "octave_degree"]
+    output = dict(zip(keys, header))
+    output["mapping"] = mapping
+    return output
+
+
+def read_scala_keyboard_mapping(file_name):
+    '''
+    Read a Scala keyboard mapping (``.kbm``) file
+
+    :param file_name: The name of the file
+    :returns: A ``dict`` describing the mapping (see ``parse_scala_keyboard_mapping()``)
+    '''
+    return parse_scala_keyboard_mapping(_read_text(file_name))
+
+
+def _prime_limit(numbers):
+    primes = [max(sp.primefactors(n)) for n in numbers if n > 1]
+    return max(primes + [1])
+
+
+def _index_scala_file(path):
+    # The index only needs floating point sizes and the prime limit, so the
+    # pitches are parsed with Fractions and logarithms rather than sympy.
+    try:
+        description, pitches = _split_scala_scale(_read_text(path))
+        cents = []
+        integers = []
+        for pitch in pitches:
+            if "." in pitch:
+                cents.append(float(pitch))
+                integers = None
+            else:
+                ratio = Fraction(pitch)
+                if ratio <= 0:
+                    return None
+                cents.append(1200.0 * (math.log2(ratio.numerator) - math.log2(ratio.denominator)))
+                if integers is not None:
+                    integers.extend([ratio.numerator, ratio.denominator])
+    except (ValueError, ZeroDivisionError, UnicodeError, OSError):
+        return None
+    prime_limit = 0 if integers is None else _prime_limit(integers)
+    return path, description, cents, prime_limit
+
+
+def _find_scala_files(directory):
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in files if name.lower().endswith(".scl"))
+    return sorted(paths)
+
+
+def index_scala_archive(directory, index_file, processes=None, chunksize=32):
+    '''
+    Index a directory of Scala scale files
+
+    :param directory: The directory. It is searched recursively for ``.scl`` files.
+    :param index_file: The name of the index file to write (a NumPy ``.npz`` file)
+    :param processes: The number of worker processes to use. If ``None`` (the
+        default) one process per CPU is used. If ``1`` the work is done in the
+        calling process.
+    :param chunksize: The number of files handed to a worker at a time
+    :returns: The number of scales indexed
+
+    The files are parsed in parallel, and for each scale the index holds the
+    file name (relative to ``directory``), description, number of degrees,
+    the degrees in cents, and the prime limit (or zero if any degree is given
+    in cents). Files that cannot be parsed are skipped.
+
+    The index is loaded with ``ScalaIndex``, which allows the archive to be
+    searched without parsing it again. For example, using the
+    `Scala scale archive <http://www.huygens-fokker.org/scala/downloads.html#scales>`__:
+
+    .. code::
+
+        index_scala_archive("scl", "scales.npz")
+        index = ScalaIndex("scales.npz")
+        for entry in index.find(size=7, prime_limit=5):
+            print(index.names[entry], index.descriptions[entry])
+
+    When using more than one process, the calling code should be protected
+    by an ``if __name__ == '__main__':`` block on platforms that do not
+    fork.
+    '''
+    paths = _find_scala_files(directory)
+    if processes == 1:
+        results = [_index_scala_file(path) for path in paths]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_index_scala_file, paths, chunksize)
+    results = [x for x in results if x is not None]
+
+    sizes = np.array([len(x[2]) for x in results], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+    cents = np.array([c for x in results for c in x[2]], dtype=np.float64)
+    np.savez_compressed(index_file,
+                        root=np.array(os.path.abspath(directory)),
+                        names=np.array([os.path.relpath(x[0], directory) for x in results], dtype=np.str_),
+                        descriptions=np.array([x[1] for x in results], dtype=np.str_),
+                        sizes=sizes,
+                        offsets=offsets,
+                        cents=cents,
+                        prime_limits=np.array([x[3] for x in results], dtype=np.int64))
+    return len(results)
+
+
+class ScalaIndex(object):
+    '''
+    An index of Scala scale files, as written by ``index_scala_archive()``
+
+    :param index_file: The name of the index file
+
+    The index holds the following members, which are NumPy arrays with one
+    entry per scale:
+
+    * ``names``: The file names, relative to the ``root`` member
+    * ``descriptions``: The description lines of the files
+    * ``sizes``: The number of pitches in each file (the scale has one more
+      degree, as the unison is implicit in the file)
+    * ``prime_limits``: The prime limit of each scale, or zero if any degree
+      is given in cents
+
+    Entries are referred to by their position in these arrays.
+    '''
+    def __init__(self, index_file):
+        with np.load(index_file, allow_pickle=False) as data:
+            self.root = str(data["root"])
+            self.names = data["names"]
+            self.descriptions = data["descriptions"]
+            self.sizes = data["sizes"]
+            self.prime_limits = data["prime_limits"]
+            self._offsets = data["offsets"]
+            self._cents = data["cents"]
+
+    def __len__(self):
+        return len(self.names)
+
+    def cents(self, entry):
+        '''
+        The degrees of a scale in cents
+
+        :param entry: The index of the scale
+        :returns: A NumPy ``float64`` array, excluding the (implicit) unison
+        '''
+        return self._cents[self._offsets[entry]:self._offsets[entry + 1]]
+
+    def find(self, size=None, prime_limit=None):
+        '''
+        Find the scales matching some criteria
+
+        :param size: If not ``None``, only return scales with this number of pitches
+        :param prime_limit: If not ``None``, only return rational scales
+            with at most this prime limit
+        :returns: A NumPy array of the indices of the matching scales
+        '''
+        selected = np.ones(len(self), dtype=bool)
+        if size is not None:
+            selected &= self.sizes == size
+        if prime_limit is not None:
+            selected &= (self.prime_limits > 0) & (self.prime_limits <= prime_limit)
+        return np.flatnonzero(selected)
+
+    def scale(self, entry, return_description=False):
+        '''
+        Read a scale from the archive
+
+        :param entry: The index of the scale
+        :param return_description: If ``True`` return the description as well
+        :returns: The scale (see ``read_scala_scale()``)
+        '''
+        return read_scala_scale(os.path.join(self.root, str(self.names[entry])), return_description)
@@ -10,6 +10,7 @@ import sympy as sp
 import numpy as np
 import itertools
 import operator
+import multiprocessing
 
 # Moved in Python 3
 try:
@@ -20,8 +21,9 @@ except:
 
 from pytuning.utilities import get_mode_masks, mask_scale, mask_to_steps
 from pytuning.metrics import all_metrics
+from pytuning.backends import get_backend, use_backend
 
-def calculate_modes(scale, num_tones, metric_function=None):
+def calculate_modes(scale, num_tones, metric_function=None, backend=None):
     '''    
     Calculate all possible modes for a scale
     
@@ -32,6 +34,11 @@ def calculate_modes(scale, num_tones, metric_function=None):
     :param metric_function: The metric function to use. 
         If unspecified all defined metrics (from ``pytuning.metrics``)
         will be used.
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used. The scale is converted to the backend's type,
+        and the backend is passed to the default metrics. A ``metric_function`` is
+        run inside ``use_backend()``, so metrics which use the default backend use
+        this one (in the calling thread only).
         
     As an example, we can find all 7-note modes of the
     Pythagorean scale with the following:
@@ -128,14 +135,17 @@ def calculate_modes(scale, num_tones, metric_function=None):
     * steps: 
         The step representation of the mask.
     '''
+    backend = get_backend(backend)
+    scale = [backend.number(x) for x in scale]
     masks = get_mode_masks(len(scale),num_tones+1)
     output = []
     for mask in masks:
         temp_scale = mask_scale(scale, mask)
         if metric_function is not None:
-            metrics = metric_function(temp_scale)
+            with use_backend(backend):
+                metrics = metric_function(temp_scale)
         else:
-            metrics = all_metrics(temp_scale)
+            metrics = all_metrics(temp_scale, backend)
         output = output + [
             {
                 "scale"          : temp_scale,
@@ -150,7 +160,7 @@ def calculate_modes(scale, num_tones, metric_function=None):
 
 def find_best_modes(scale, num_tones, 
                     sort_order=['sum_p_q_for_all_intervals','sum_p_q','sum_distinct_intervals'], 
-                    num_scales=1, metric_function=None):
+                    num_scales=1, metric_function=None, backend=None):
     '''
     Find the best modes for a scale, as defined by the specified
     metrics.
@@ -163,6 +173,8 @@ def find_best_modes(scale, num_tones,
         all scales will be returned
     :param metric_function: The metric function to use. If
         ``None`` then ``all_metrics`` will be used.
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     :returns: A sorted list of mode objects.
         
     The sort order is a list of keys that the metric function
@@ -258,9 +270,9 @@ def find_best_modes(scale, num_tones,
     
     if metric_function is not None:
         scales = calculate_modes(scale, num_tones, 
-                                  metric_function=metric_function)
+                                  metric_function=metric_function, backend=backend)
     else:
-        scales = calculate_modes(scale, num_tones)
+        scales = calculate_modes(scale, num_tones, backend=backend)
     scales = sorted(scales, key=lambda x: tuple(
             x[y] for y in sort_order)
             )
@@ -351,10 +363,24 @@ def find_factors(interval, constructors, max_terms=8):
         # Is equivalent to:
         x = ['s']
     '''
+    return _find_factors_with_index(interval, constructors,
+                                    _create_factor_index(constructors, max_terms))
+
+def _create_factor_index(constructors, max_terms):
+    '''
+    Create the candidate index used by ``find_factors``: every product of
+    up to ``max_terms`` constructors, along with its numeric size. Building
+    this is the expensive part of the factoring, and it only depends on the
+    constructors, so it can be shared across many target intervals.
+    '''
     intervals = [x[0] for x in constructors] + [sp.Integer(1)]
     possiblities = np.array([x for x in itertools.combinations_with_replacement(intervals, max_terms)])
     reduced = np.array([reduce(operator.__mul__,x) for x in possiblities])
     interval_sizes_numeric = np.array([float(x.evalf()) for x in reduced])
+    return possiblities, interval_sizes_numeric
+
+def _find_factors_with_index(interval, constructors, factor_index):
+    possiblities, interval_sizes_numeric = factor_index
     distances = np.abs(interval_sizes_numeric - float(interval.evalf()))
     best_index = np.argmin(distances)
     target_compostion = list(possiblities[best_index])
@@ -403,6 +429,64 @@ def find_factors(interval, constructors, max_terms=8):
     else:
         values = reduce(operator.__mul__,simplified_target)
     return (simplified_target, adjusted_output, values)
+
+# Per-process state for find_factors_many(). Each worker in the pool receives
+# the constructors and the candidate index once, when it starts.
+
+_worker_factor_state = None
+
+def _initialize_factor_worker(constructors, factor_index):
+    global _worker_factor_state
+    _worker_factor_state = (constructors, factor_index)
+
+def _find_factors_in_worker(interval):
+    constructors, factor_index = _worker_factor_state
+    return _find_factors_with_index(interval, constructors, factor_index)
+
+def find_factors_many(intervals, constructors, max_terms=8, processes=1, chunksize=1):
+    '''
+    Factor many intervals over the same set of basis generators
+
+    :param intervals: An iterable of intervals to match (``sympy`` values)
+    :param constructors: The generator functions (see ``find_factors``)
+    :param max_terms: The maximum number of factors to return
+    :param processes: The number of worker processes to use. If ``1`` (the
+        default) the work is done in the calling process. If ``None``
+        one process per CPU is used.
+    :param chunksize: The number of intervals handed to a worker at a time
+    :returns: A generator yielding one ``find_factors`` result per interval
+
+    This is equivalent to calling ``find_factors`` on each interval in turn,
+    but the table of candidate products (which is the expensive part of
+    the calculation) is only computed once and is shared by all of
+    the targets.
+
+    Results are yielded in the same order as the input intervals, and they
+    are yielded as soon as they are available, so a long list can be
+    consumed as it is being factored. As an example, to factor all the
+    degrees of a scale over the 12-EDO constructors using four processes:
+
+    .. code::
+
+        from pytuning.constants import edo12_constructors
+
+        pythag = create_pythagorean_scale()
+        for factors in find_factors_many(pythag, edo12_constructors, processes=4):
+            print(factors[1])
+
+    When using more than one process, the calling code should be protected
+    by an ``if __name__ == '__main__':`` block on platforms that do not
+    fork.
+    '''
+    factor_index = _create_factor_index(constructors, max_terms)
+    if processes == 1:
+        for interval in intervals:
+            yield _find_factors_with_index(interval, constructors, factor_index)
+    else:
+        with multiprocessing.Pool(processes, initializer=_initialize_factor_worker,
+                                  initargs=(constructors, factor_index)) as pool:
+            for result in pool.imap(_find_factors_in_worker, intervals, chunksize):
+                yield result
     
 def create_scale_from_scale(scale, interval_function, max_terms=8, tone_table=None):
     '''    
@@ -2,8 +2,12 @@ from pytuning.scales.harmonic import create_harmonic_scale
 from pytuning.scales.pythagorean import create_pythagorean_scale
 from pytuning.scales.edo import create_edo_scale #, calculate_edo_mode
 from pytuning.scales.euler_fokker import create_euler_fokker_scale
+from pytuning.scales.combination_product import create_combination_product_set, \
+    create_hexany, create_dekany, create_eikosany
+from pytuning.scales.tonality_diamond import create_tonality_diamond
 from pytuning.scales.equal_interval import create_equal_interval_scale
 from pytuning.scales.diatonic import create_diatonic_scale
+from pytuning.scales.mos import find_mos_sizes, create_mos_tree, create_mos_scale
 from pytuning.scales.meantone import create_quarter_comma_meantone_scale, \
     convert_p5_to_r, convert_r_to_p5
 from pytuning.scales.lucy import find_lucy_interval, lucy_symbolic_to_simplified, \
@@ -14,10 +18,13 @@ from pytuning.scale_creation import create_scale_from_scale
 
 __all__ = ["create_harmonic_scale", "create_pythagorean_scale", 
            "create_edo_scale", "create_euler_fokker_scale",
+           "create_combination_product_set", "create_hexany", "create_dekany",
+           "create_eikosany", "create_tonality_diamond",
            "create_equal_interval_scale", "create_quarter_comma_meantone_scale",
            "convert_p5_to_r", "convert_r_to_p5",
            "find_lucy_interval", "lucy_symbolic_to_simplified",
            "create_lucy_tuning_spiral", "calculate_lucy_mode",
            "calculate_lucy_mode_twelve_tone",
            "create_lucy_tone_table", "create_lucy_scale_from_scale",
-           "create_scale_from_scale", "create_diatonic_scale"]
\ No newline at end of file
+           "create_scale_from_scale", "create_diatonic_scale",
+           "find_mos_sizes", "create_mos_tree", "create_mos_scale"]
\ No newline at end of file
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:41:05 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import itertools
+
+import numpy as np
+import sympy as sp
+
+from pytuning.backends import get_backend
+from pytuning.monzo import MonzoScale
+
+
+def _monzo_scale_to_degrees(monzos, octave, normalize, backend=None):
+    '''
+    Finish a scale built in the monzo domain: remove duplicate degrees
+    (by hashing the exponent vectors), optionally normalize, and bookend
+    the result with the unison and the formal octave.
+    '''
+    unique = sorted(set(map(tuple, monzos.monzos.tolist())))
+    degrees = MonzoScale(unique, monzos.primes)
+    if normalize:
+        degrees = degrees.normalize(octave)
+    backend = get_backend(backend)
+    numerators, denominators = degrees.ratios()
+    output = [backend.rational(p, q) for p, q in zip(numerators, denominators)] + \
+        [backend.rational(1), backend.number(octave)]
+    return sorted(set(output))
+
+
+def create_combination_product_set(factors, k, octave=2, normalize=True, backend=None):
+    '''
+    Create a combination product set (CPS) scale
+
+    :param factors: The factors of the set (usually prime or odd numbers)
+    :param k: The number of factors multiplied together for each degree
+        (at least one, and no more than the number of factors)
+    :param octave: The formal octave
+    :param normalize: If ``True``, normalize the degrees to the octave
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
+    :returns: The scale
+
+    A combination product set, CPS(k, n), is formed by taking every
+    combination of ``k`` of the ``n`` factors and multiplying them together.
+    The scale is expressed relative to the smallest product, so that the
+    scale has a unison. As an example, the 2-out-of-4 set on the factors
+    1, 3, 5, and 7 (which is Erv Wilson's *hexany*):
+
+    .. code::
+
+        scale = create_combination_product_set([1, 3, 5, 7], 2)
+
+    produces the products :math:`3, 5, 7, 15, 21, 35`, which, relative to
+    the :math:`3` and normalized, yields:
+
+    .. math::
+
+        \\left [ 1, \\frac{7}{6}, \\frac{5}{4}, \\frac{35}{24}, \\frac{5}{3},
+        \\frac{7}{4}, 2\\right ]
+
+    The products are formed by adding the prime exponent vectors of the
+    factors, and duplicates are removed by hashing those vectors, so large
+    sets can be generated quickly.
+    '''
+    if not 0 < k <= len(factors):
+        raise ValueError("k must be between 1 and the number of factors (%d)" % len(factors))
+    factor_monzos = MonzoScale.from_scale([sp.Integer(x) for x in factors] + [sp.Integer(octave)])
+    combinations = np.array(list(itertools.combinations(range(len(factors)), k)), dtype=np.int64)
+    products = factor_monzos.monzos[:-1][combinations.reshape(-1, k)].sum(axis=1)
+    products = MonzoScale(products, factor_monzos.primes)
+    smallest = products.monzos[np.argmin(products.log2())]
+    degrees = MonzoScale(products.monzos - smallest, products.primes)
+    return _monzo_scale_to_degrees(degrees, octave, normalize, backend)
+
+
+def create_hexany(factors=(1, 3, 5, 7), octave=2, normalize=True, backend=None):
+    '''
+    Create a hexany, the combination product set CPS(2, 4)
+
+    :param factors: The four factors
+    :param octave: The formal octave
+    :param normalize: If ``True``, normalize the degrees to the octave
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
+    :returns: The scale
+    '''
+    if len(factors) != 4:
+        raise ValueError("A hexany needs four factors")
+    return create_combination_product_set(factors, 2, octave=octave, normalize=normalize,
+                                          backend=backend)
+
+
+def create_dekany(factors=(1, 3, 5, 7, 9), k=2, octave=2, normalize=True, backend=None):
+    '''
+    Create a dekany, the combination product set CPS(2, 5) or CPS(3, 5)
+
+    :param factors: The five factors
+    :param k: The number of factors in each product (2 or 3)
+    :param octave: The formal octave
+    :param normalize: If ``True``, normalize the degrees to the octave
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
+    :returns: The scale
+    '''
+    if len(factors) != 5:
+        raise ValueError("A dekany needs five factors")
+    if k not in (2, 3):
+        raise ValueError("A dekany is formed from products of two or three factors")
+    return create_combination_product_set(factors, k, octave=octave, normalize=normalize,
+                                          backend=backend)
+
+
+def create_eikosany(factors=(1, 3, 5, 7, 9, 11), octave=2, normalize=True, backend=None):
+    '''
+    Create an eikosany, the combination product set CPS(3, 6)
+
+    :param factors: The six factors
+    :param octave: The formal octave
+    :param normalize: If ``True``, normalize the degrees to the octave
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
+    :returns: The scale
+    '''
+    if len(factors) != 6:
+        raise ValueError("An eikosany needs six factors")
+    return create_combination_product_set(factors, 3, octave=octave, normalize=normalize,
+                                          backend=backend)
@@ -6,14 +6,17 @@ Created on Tue May 26 11:42:12 2015
 """
 
 
-import sympy as sp
+from pytuning.backends import get_backend
 
-def create_edo_scale(number_tones, octave=2):
+def create_edo_scale(number_tones, octave=2, backend=None):
     '''    
     Create an equal division of octave (EDO, ET) scale.
     
     :param number_tones: The number of tones/divisions in the scale
     :param octave: The formal octave (frequency ratio)
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used. The degrees are irrational, so for the exact
+        backends they remain ``sympy`` values (other than the unison and octave).
     
     Example, 12T-ET:
     
@@ -46,8 +49,8 @@ def create_edo_scale(number_tones, octave=2):
         \\sqrt{3}, 3^{\\frac{7}{12}}, 3^{\\frac{2}{3}}, 3^{\\frac{3}{4}}, 3^{\\frac{5}{6}}, 
         3^{\\frac{11}{12}}, 3\\right ]
     '''
-    division      = sp.Integer(octave)**sp.Rational(1,number_tones)
+    backend = get_backend(backend)
     output = []
     for index in range(number_tones+1):
-        output = output + [division**index]
+        output = output + [backend.power(octave, index, number_tones)]
     return output
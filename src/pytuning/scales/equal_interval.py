@@ -7,11 +7,22 @@ Created on Tue May 26 11:57:03 2015
 
 from __future__ import print_function, division
 import sympy as sp
-from pytuning.utilities import normalize_interval
+from pytuning.backends import get_backend
+from pytuning.runtime.scales import _generator_chain
+
+def _degree_sort_key(degree):
+    '''
+    Sort key for scale degrees. Comparing irrational ``sympy`` values
+    evaluates both sides numerically on every comparison, so for those we
+    evaluate them once, at a precision high enough to separate the degrees.
+    '''
+    if isinstance(degree, sp.Expr) and not degree.is_Rational:
+        return degree.evalf(30)
+    return degree
 
 def create_equal_interval_scale(generator_interval, scale_size=12, number_down_intervals=6, 
                           epsilon=None, sort=True, octave=2, remove_duplicates=True, 
-                          normalize=True):
+                          normalize=True, floating_point=False, backend=None):
     '''    
     Create a scale with equal-interval tuning
     
@@ -26,6 +37,12 @@ def create_equal_interval_scale(generator_interval, scale_size=12, number_down_i
     :param octave: The formal octave
     :param remove_duplicates: If ``True`` remove duplicate entries
     :param normalize: IF ``True``, normalize the degrees to the octave
+    :param floating_point: If ``True``, perform the calculation in floating point
+        and return the degrees as Python ``float`` values. This is the same as
+        ``backend="float"``.
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used. For the exact backends an irrational generator
+        gives a scale of ``sympy`` values.
     
     In general one should keep epsilon at ``None`` and perform and
     rounding outside the function.
@@ -57,30 +74,34 @@ def create_equal_interval_scale(generator_interval, scale_size=12, number_down_i
         .. math::
         
             P_5 = \\sqrt[\\frac{7}{12}]{2}
+
+    Each degree is calculated from the previous degree in the chain, so
+    long chains (of thousands of generators) can be built in linear time.
+    For generators that can be represented exactly this gives the same
+    (exact) result as forming each power separately. If exact
+    results aren't needed, ``floating_point=True`` will avoid ``sympy``
+    altogether, which is much faster still:
+
+    .. code::
+
+        scale = create_equal_interval_scale(cents_to_ratio(696.0), scale_size=1000,
+                                            number_down_intervals=0,
+                                            floating_point=True)
     '''
     down_intervals = number_down_intervals + 1
     up_intervals   = scale_size - down_intervals + 1
-    r_5 = generator_interval
-    output = []
-    for index in range(up_intervals):
-        x = r_5 ** index
-        if normalize:
-            output = output + [normalize_interval(x, octave)]
-        else:
-            output = output + [x]
-    for index in range(down_intervals):
-        x = (1/r_5) ** index
-        if normalize:
-            output = output + [normalize_interval(x, octave)]
-        else:
-            output = output + [x]
-    output = output + [sp.Integer(octave)]
+    backend = get_backend("float" if floating_point else backend)
+    r_5 = backend.number(generator_interval)
+    octave = backend.number(octave)
+    output = list(_generator_chain(r_5, up_intervals, octave, normalize))
+    output = output + list(_generator_chain(1/r_5, down_intervals, octave, normalize))
+    output = output + [octave]
     if epsilon is not None:
         output =  list(set([round(y/epsilon)* epsilon for y in output]))
     else:
         output =  list(output)
     if sort:
-        output = sorted(output)
+        output = sorted(output, key=_degree_sort_key)
         if remove_duplicates:
-            output = sorted(set(output))
+            output = sorted(set(output), key=_degree_sort_key)
     return output
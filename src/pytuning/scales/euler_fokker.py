@@ -5,20 +5,10 @@ Created on Tue May 26 11:46:12 2015
 @author: mark
 """
 
-import sympy as sp
-import itertools
-import operator
+from pytuning.backends import get_backend
+from pytuning.utilities import _reduce_to_octave
 
-from pytuning.utilities import normalize_interval
-
-# Moved in Python 3
-try:
-    import functools
-    reduce = functools.reduce
-except:
-    pass
-
-def create_euler_fokker_scale(intervals, multiplicities, octave=2, normalize=True):
+def create_euler_fokker_scale(intervals, multiplicities, octave=2, normalize=True, backend=None):
     '''    
     Create a scale in the Euler-Fokker Genera
     
@@ -27,6 +17,8 @@ def create_euler_fokker_scale(intervals, multiplicities, octave=2, normalize=Tru
     :param multiplicities: The multiplicities of the factors (see below)
     :param octave: The formal octave
     :param normalize: If ``True``, normalize the intervals to the octave.
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     
     ``intervals`` and ``multiplicities`` should both be lists of equal length.
     The entries in ``multiplicities`` give the number of each factor to use.
@@ -61,27 +53,45 @@ def create_euler_fokker_scale(intervals, multiplicities, octave=2, normalize=Tru
         
         scale1 == scale2
         True
+
+    Scales are built from the exponents of the factors rather than from all the
+    subsets of the factor list, so large genera (for example, ``[3,5,7,11]``
+    with multiplicities ``[3,2,2,1]``) can be created quickly.
     '''
 
-    output = []
+    # Work over exponent vectors: each distinct factor can appear from zero
+    # times up to its total multiplicity, so each distinct product is formed
+    # exactly once (rather than once per subset of a list of repeated factors).
+
+    exponents = {}
     for index in range(len(intervals)):
-        output = output + [intervals[index]] * multiplicities[index]
-        output = [sp.Integer(x) for x in output]
-        
-    potential = list(itertools.chain(*[[x for x in itertools.combinations(output,r)] 
-                                       for r in range(1,len(output)+1)]))
-    output = []
-    for item in potential:
-        if len(item) == 0:
-            output = output + [item[0]]
-        else:
-            output = output + [reduce(operator.__mul__, item)]
+        factor = int(intervals[index])
+        exponents[factor] = exponents.get(factor, 0) + multiplicities[index]
 
+    products = set([1])
+    for factor, multiplicity in exponents.items():
+        powers = [factor ** e for e in range(multiplicity + 1)]
+        products = set([x * y for x in products for y in powers])
 
+    backend = get_backend(backend)
     if normalize:
-        output = [sp.Integer(1)] + [normalize_interval(x, octave) for x in output] + [sp.Integer(octave)]
+        output = [_reduce_integer_to_octave(x, octave, backend) for x in products]
     else:
-        output = [sp.Integer(1)] + [x for x in output] + [sp.Integer(octave)]
+        output = [backend.rational(x) for x in products]
+    output = output + [backend.rational(1), backend.number(octave)]
 
     output = sorted(set(output))
     return output
+
+def _reduce_integer_to_octave(n, octave, backend):
+    '''
+    Normalize a positive integer to the octave, exactly. The result
+    follows the same convention as ``normalize_interval``.
+    '''
+    if int(octave) != octave:
+        return _reduce_to_octave(backend.rational(n), backend.number(octave))
+    octave = int(octave)
+    d = 1
+    while n > octave * d:
+        d = d * octave
+    return backend.rational(n, d)
@@ -6,10 +6,10 @@ Created on Tue May 26 11:01:24 2015
 """
 from __future__ import print_function, division
 
-import sympy as sp
 from pytuning.utilities import normalize_interval
+from pytuning.backends import get_backend
 
-def create_harmonic_scale(first_harmonic, last_harmonic, normalize=True, octave=2):
+def create_harmonic_scale(first_harmonic, last_harmonic, normalize=True, octave=2, backend=None):
     '''    
     Create a harmonic scale
     
@@ -18,6 +18,8 @@ def create_harmonic_scale(first_harmonic, last_harmonic, normalize=True, octave=
     :param normalize: If true, normalize the scale to an octave 
                       (2/1 by default, otherwise taken from ``octave``)
     :param octave: The definition of the formal octave.
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     :returns: The scale
     
     As an example of use, a normalized scale constructed from harmonics
@@ -47,20 +49,22 @@ def create_harmonic_scale(first_harmonic, last_harmonic, normalize=True, octave=
         \\left [ 1, \\frac{4}{3}, \\frac{5}{3}, 2, \\frac{7}{3}, \\frac{8}{3}, 3, 
         \\frac{10}{3}\\right ]
     '''
-    r = [sp.Integer(1) + sp.Integer(1)*(i) for i in range(last_harmonic)]
+    backend = get_backend(backend)
+    r = [backend.rational(1 + i) for i in range(last_harmonic)]
     r = r[first_harmonic-1:]
     r = [i / r[0] for i in r]
     output = []
     for interval in r:
         if normalize:
-            interval = normalize_interval(interval, octave)
+            interval = normalize_interval(interval, octave, backend)
         output = output + [interval]
     output = sorted(list(set(output)))
     
     if normalize:
-        output = [sp.Integer(1)] + [normalize_interval(x, octave) for x in output] + [sp.Integer(octave)]
+        output = [backend.rational(1)] + [normalize_interval(x, octave, backend) for x in output] + \
+            [backend.number(octave)]
     else:
-        output = [sp.Integer(1)] + [x for x in output] + [sp.Integer(octave)]
+        output = [backend.rational(1)] + [x for x in output] + [backend.number(octave)]
     
     output = sorted(set(output))
     
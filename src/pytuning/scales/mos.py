@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 20:58:41 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+from collections import namedtuple
+
+import sympy as sp
+
+from pytuning.scales.equal_interval import create_equal_interval_scale
+
+MOSPattern = namedtuple("MOSPattern", ["size", "large", "small"])
+MOSNode = namedtuple("MOSNode", ["size", "lower", "upper", "boundary", "below", "above"])
+
+
+def _side(generator, period, p, q):
+    '''
+    Compare a generator with ``period ** (p/q)``, returning -1, 0 or 1.
+    The powers are compared rather than the logarithms, so that for rational
+    generators the comparison is exact.
+    '''
+    difference = sp.sympify(generator) ** q - sp.sympify(period) ** p
+    if difference == 0:
+        return 0
+    return 1 if difference > 0 else -1
+
+
+def _check_generator(generator, period):
+    if _side(generator, period, 0, 1) <= 0 or _side(generator, period, 1, 1) >= 0:
+        raise ValueError("The generator must lie between the unison and the period")
+
+
+def _patterns(b, d):
+    # The step counts of the b + d note scale for generators below and above the mediant
+    return MOSPattern(b + d, b, d), MOSPattern(b + d, d, b)
+
+
+def find_mos_sizes(generator, period=2, max_size=100):
+    '''
+    Find the sizes at which a chain of generators forms a moment of symmetry scale
+
+    :param generator: The generator interval (``sympy`` value)
+    :param period: The period (formal octave) of the scale
+    :param max_size: The largest scale size to consider
+    :returns: A list of ``MOSPattern`` tuples (``size``, ``large``, ``small``): the
+        number of tones in the scale and the number of large and small steps.
+
+    A moment of symmetry (MOS) scale is one in which the generator chain,
+    reduced to the period, divides the period into exactly two step sizes. The
+    sizes at which this happens are the denominators of the path to the generator
+    (as a fraction of the period, :math:`\\log_{period} generator`) in the
+    Stern-Brocot tree -- that is, of the convergents and semiconvergents of its
+    continued fraction. Only the nodes of that path are visited, so no sweeping
+    over sizes is needed. For example, the fifth gives the familiar 2, 3, 5, 7 and 12
+    note scales:
+
+    .. code::
+
+        find_mos_sizes(sp.Rational(3, 2), max_size=12)
+
+        [MOSPattern(size=2, large=1, small=1), MOSPattern(size=3, large=2, small=1),
+         MOSPattern(size=5, large=2, small=3), MOSPattern(size=7, large=5, small=2),
+         MOSPattern(size=12, large=5, small=7)]
+
+    If the generator is a rational fraction of the period the chain closes
+    into an equal division, and no larger sizes are returned. The generator
+    must lie between the unison and the period.
+    '''
+    _check_generator(generator, period)
+    output = []
+    a, b, c, d = 0, 1, 1, 1
+    while b + d <= max_size:
+        side = _side(generator, period, a + c, b + d)
+        if side == 0:
+            break
+        below, above = _patterns(b, d)
+        if side < 0:
+            output.append(below)
+            c, d = a + c, b + d
+        else:
+            output.append(above)
+            a, b = a + c, b + d
+    return output
+
+
+def create_mos_tree(min_generator, max_generator, period=2, max_size=50):
+    '''
+    Find the moment of symmetry scales for a range of generators
+
+    :param min_generator: The smallest generator in the range (``sympy`` value)
+    :param max_generator: The largest generator in the range
+    :param period: The period (formal octave) of the scales
+    :param max_size: The largest scale size to consider
+    :returns: A list of ``MOSNode`` tuples, ordered by size and then by generator
+
+    Each node describes one scale size, and the range of generators over which
+    the chain of that size is a MOS scale. Its fields are:
+
+    * ``size``: The number of tones in the scale
+    * ``lower``, ``upper``: The range of generators (exclusive) over which the scale is
+      a MOS, expressed as fractions of the period
+    * ``boundary``: The generator, again as a fraction of the period, at which the step
+      pattern changes. Here the two step sizes are equal, and the scale is an equal
+      division of the period; on either side the large and small steps swap places.
+    * ``below``, ``above``: The ``MOSPattern`` for generators between ``lower`` and
+      ``boundary``, and between ``boundary`` and ``upper``
+
+    A fraction ``f`` corresponds to the generator ``period ** f`` (which is exact in ``sympy``).
+    The nodes are those of the Stern-Brocot tree whose ranges overlap the requested
+    range, so the result is the complete MOS family tree within it. For example,
+    the family of the diatonic scale:
+
+    .. code::
+
+        tree = create_mos_tree(2 ** sp.Rational(4, 7), 2 ** sp.Rational(3, 5), max_size=12)
+        [(x.size, x.boundary) for x in tree]
+
+        [(2, 1/2), (3, 2/3), (5, 3/5), (7, 4/7), (12, 7/12)]
+
+    The boundary of a node may lie outside the requested range, in which case only
+    one of the patterns occurs within it.
+    '''
+    _check_generator(min_generator, period)
+    _check_generator(max_generator, period)
+    if sp.sympify(max_generator) <= sp.sympify(min_generator):
+        raise ValueError("The generator range is empty")
+    nodes = []
+    stack = [(0, 1, 1, 1)]
+    while len(stack) > 0:
+        a, b, c, d = stack.pop()
+        if b + d > max_size:
+            continue
+        if _side(min_generator, period, c, d) >= 0 or _side(max_generator, period, a, b) <= 0:
+            continue
+        below, above = _patterns(b, d)
+        nodes.append(MOSNode(b + d, sp.Rational(a, b), sp.Rational(c, d), sp.Rational(a + c, b + d),
+                             below, above))
+        stack.append((a, b, a + c, b + d))
+        stack.append((a + c, b + d, c, d))
+    return sorted(nodes, key=lambda x: (x.size, x.boundary))
+
+
+def create_mos_scale(generator, size, number_down_intervals=0, period=2):
+    '''
+    Create a moment of symmetry scale
+
+    :param generator: The generator interval (``sympy`` value)
+    :param size: The number of tones in the scale. This must be one of the
+        sizes returned by ``find_mos_sizes()``
+    :param number_down_intervals: The number of inverted generators in the chain
+        (see ``create_equal_interval_scale()``)
+    :param period: The period (formal octave) of the scale
+    :returns: The scale
+
+    .. code::
+
+        create_mos_scale(sp.Rational(3, 2), 5)
+
+        [1, 9/8, 81/64, 3/2, 27/16, 2]
+    '''
+    if size not in [x.size for x in find_mos_sizes(generator, period, size)]:
+        raise ValueError("The chain of %d generators does not form a moment of symmetry scale" % size)
+    return create_equal_interval_scale(generator, size, number_down_intervals, octave=period)
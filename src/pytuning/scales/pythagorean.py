@@ -11,7 +11,7 @@ from pytuning.constants import perfect_fifth
 
 
 def create_pythagorean_scale(scale_size=12, number_down_fifths=6, 
-                          epsilon=None, sort=True, octave=2, remove_duplicates=True):
+                          epsilon=None, sort=True, octave=2, remove_duplicates=True, backend=None):
     '''    
     Create a Pythagorean scale
     
@@ -24,6 +24,8 @@ def create_pythagorean_scale(scale_size=12, number_down_fifths=6,
     :param sort: If ``True``, sort the output by degree size
     :param octave: The formal octave
     :param remove_duplicates: If ``True`` remove duplicate entries
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     
     The Pythagorean scale is an even-interval scale with the
     following generating interval:
@@ -38,4 +40,5 @@ def create_pythagorean_scale(scale_size=12, number_down_fifths=6,
                                        number_down_intervals=number_down_fifths, 
                                        epsilon=epsilon, 
                                        sort=sort, octave=octave, 
-                                       remove_duplicates=remove_duplicates)
+                                       remove_duplicates=remove_duplicates,
+                                       backend=backend)
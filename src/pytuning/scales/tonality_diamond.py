@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:07:52 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import sympy as sp
+
+from pytuning.monzo import MonzoScale
+from pytuning.scales.combination_product import _monzo_scale_to_degrees
+
+
+def create_tonality_diamond(odd_limit, octave=2, normalize=True, backend=None):
+    '''
+    Create a tonality diamond scale
+
+    :param odd_limit: The odd limit of the diamond
+    :param octave: The formal octave
+    :param normalize: If ``True``, normalize the degrees to the octave
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
+    :returns: The scale
+
+    The tonality diamond contains every ratio that can be formed from two
+    of the odd identities :math:`1, 3, 5, \\ldots` up to the odd limit. As an
+    example, the 5-limit diamond:
+
+    .. code::
+
+        scale = create_tonality_diamond(5)
+
+    yields:
+
+    .. math::
+
+        \\left [ 1, \\frac{6}{5}, \\frac{5}{4}, \\frac{4}{3}, \\frac{3}{2},
+        \\frac{8}{5}, \\frac{5}{3}, 2\\right ]
+
+    and Partch's 11-limit diamond (29 degrees plus the octave) is given
+    by ``create_tonality_diamond(11)``.
+    '''
+    identities = MonzoScale.from_scale([sp.Integer(x) for x in range(1, odd_limit + 1, 2)] + [sp.Integer(octave)])
+    monzos = identities.monzos[:-1]
+    ratios = (monzos[:, None, :] - monzos[None, :, :]).reshape(-1, monzos.shape[1])
+    return _monzo_scale_to_degrees(MonzoScale(ratios, identities.primes), octave, normalize,
+                                   backend)
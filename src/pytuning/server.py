@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 15:31:02 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import asyncio
+import collections
+import os
+import socket
+import struct
+
+from pytuning.scala import read_scala_scale
+from pytuning.tuning_tables.frequency_table import create_frequency_table
+
+__all__ = ["RetuningServer", "encode_osc_message", "decode_osc_message"]
+
+# The tables for one scale. Everything is held in Python lists, as indexing
+# a list is faster than indexing (and unboxing from) a NumPy array.
+
+_NoteTable = collections.namedtuple("_NoteTable", ["frequencies", "notes", "bends"])
+
+
+def _pad_osc(data):
+    return data + b"\0" * (4 - len(data) % 4)
+
+
+def _read_osc_string(data, offset):
+    end = data.index(b"\0", offset)
+    return data[offset:end].decode("utf-8"), (end // 4 + 1) * 4
+
+
+def encode_osc_message(address, *arguments):
+    '''
+    Encode an Open Sound Control (OSC) message
+
+    :param address: The OSC address (for example ``"/pytuning/freq"``)
+    :param arguments: The arguments: ``int``, ``float`` or ``str`` values
+    :returns: The message (``bytes``)
+
+    Only the basic OSC 1.0 argument types (``i``, ``f`` and ``s``) are supported.
+    '''
+    tags = ","
+    payload = b""
+    for argument in arguments:
+        if isinstance(argument, int):
+            tags = tags + "i"
+            payload = payload + struct.pack(">i", argument)
+        elif isinstance(argument, float):
+            tags = tags + "f"
+            payload = payload + struct.pack(">f", argument)
+        else:
+            tags = tags + "s"
+            payload = payload + _pad_osc(str(argument).encode("utf-8"))
+    return _pad_osc(address.encode("utf-8")) + _pad_osc(tags.encode("ascii")) + payload
+
+
+def decode_osc_message(data):
+    '''
+    Decode an Open Sound Control (OSC) message
+
+    :param data: The message (``bytes``)
+    :returns: A tuple (address, list of arguments)
+
+    A ``ValueError`` is raised if the message cannot be decoded.
+    '''
+    try:
+        address, offset = _read_osc_string(data, 0)
+        tags, offset = _read_osc_string(data, offset)
+        arguments = []
+        for tag in tags[1:]:
+            if tag == "i":
+                arguments.append(struct.unpack_from(">i", data, offset)[0])
+                offset = offset + 4
+            elif tag == "f":
+                arguments.append(struct.unpack_from(">f", data, offset)[0])
+                offset = offset + 4
+            elif tag == "s":
+                value, offset = _read_osc_string(data, offset)
+                arguments.append(value)
+            else:
+                raise ValueError("Unsupported OSC type tag: %s" % tag)
+    except (struct.error, UnicodeError, IndexError) as error:
+        raise ValueError("Invalid OSC message: %s" % error)
+    if not tags.startswith(","):
+        raise ValueError("Invalid OSC type tags: %s" % tags)
+    return address, arguments
+
+
+class _RetuningProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        # The event loop only keeps weak references to tasks, so the load
+        # tasks are held here until they finish
+        self.tasks = set()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, address):
+        if self.server._is_load_request(data):
+            task = asyncio.ensure_future(self._load(data, address))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+        else:
+            self.transport.sendto(self.server.handle(data), address)
+
+    async def _load(self, data, address):
+        self.transport.sendto(await self.server.handle_load(data), address)
+
+
+class RetuningServer(object):
+    '''
+    A local server answering note frequency and pitch bend queries
+
+    :param bend_range: The pitch bend range (in semitones) used for pitch bend answers
+    :param scale_directory: The directory that ``load`` requests read Scala files from.
+        If ``None`` (the default) ``load`` requests are refused.
+
+    The server holds precomputed tables for any number of named scales, one
+    of which is active. Queries are answered by looking a note up in these
+    tables, so no calculation is done while serving.
+
+    The server listens on a UDP or Unix datagram socket, and answers each
+    datagram with a single datagram. Requests are either plain text or
+    `Open Sound Control <http://opensoundcontrol.org/>`__ messages (messages
+    starting with ``/`` are taken to be OSC). The text requests are:
+
+    * ``freq NOTE [SCALE]``: The frequency of a note. The reply is ``ok NOTE FREQUENCY``.
+    * ``bend NOTE [SCALE]``: The 12-EDO note and pitch bend that sound a note.
+      The reply is ``ok NOTE MIDI_NOTE BEND``.
+    * ``use SCALE``: Make a loaded scale the active one.
+    * ``load SCALE FILE [REFERENCE_NOTE [REFERENCE_FREQUENCY]]``: Read a Scala
+      file and load it under the given name. ``FILE`` is relative to the
+      ``scale_directory``, and files outside that directory are refused.
+    * ``list``: The loaded scales, with the active scale first.
+
+    If ``SCALE`` is omitted the active scale is used. Errors are
+    replied to with ``error MESSAGE``. (A file that can't be loaded gets the same
+    message whatever the reason, so that the server doesn't reveal anything
+    about the files on the host.) The OSC requests have the addresses
+    ``/pytuning/freq``, ``/pytuning/bend``, ``/pytuning/use``, ``/pytuning/load``
+    and ``/pytuning/list``, take the same arguments, and are answered with a
+    message to the same address (or ``/pytuning/error``).
+
+    Scales are loaded in the background (see ``load_scale_async()``), and
+    switching the active scale is the replacement of a single reference, so
+    queries continue to be answered while a new scale is loaded.
+
+    .. code::
+
+        server = RetuningServer()
+        server.load_scale("pythagorean", create_pythagorean_scale(), reference_note=60)
+        server.run_udp("127.0.0.1", 9000)
+
+    and then, from the shell:
+
+    .. code::
+
+        $ echo "freq 67" | nc -u -w1 127.0.0.1 9000
+        ok 67 392.4383479507...
+    '''
+    def __init__(self, bend_range=2.0, scale_directory=None):
+        self.bend_range = bend_range
+        self.scale_directory = None if scale_directory is None else os.path.realpath(scale_directory)
+        self.tables = {}
+        self.active = None
+        self._active_table = None
+
+    def compile_scale(self, scale, reference_note=60, reference_frequency=None, keyboard_mapping=None):
+        '''
+        Compute the tables for a scale
+
+        :param scale: The scale (list of frequency ratios)
+        :param reference_note: The MIDI number of the absolute frequency reference
+        :param reference_frequency: The frequency of the reference note. If ``None``
+            (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+        :param keyboard_mapping: An optional ``KeyboardMapping``
+        :returns: The tables, which can be passed to ``install_tables()``
+        '''
+        table = create_frequency_table(scale, reference_note, reference_frequency, keyboard_mapping)
+        notes, bends = table.pitch_bends(self.bend_range)
+        return _NoteTable(table.frequencies.tolist(), notes.tolist(), bends.tolist())
+
+    def install_tables(self, name, tables, activate=False):
+        '''
+        Install precomputed tables under a name
+
+        :param name: The name of the scale
+        :param tables: The tables, as returned by ``compile_scale()``
+        :param activate: If ``True`` make this the active scale. The
+            first scale installed is always made active.
+        '''
+        self.tables[name] = tables
+        if activate or self.active is None or self.active == name:
+            self.active = name
+            self._active_table = tables
+
+    def load_scale(self, name, scale, reference_note=60, reference_frequency=None, keyboard_mapping=None,
+                   activate=False):
+        '''
+        Compute and install the tables for a scale
+
+        :param name: The name of the scale
+        :param scale: The scale (list of frequency ratios)
+        :param reference_note: The MIDI number of the absolute frequency reference
+        :param reference_frequency: The frequency of the reference note. If ``None``
+            (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+        :param keyboard_mapping: An optional ``KeyboardMapping``
+        :param activate: If ``True`` make this the active scale
+        '''
+        self.install_tables(name, self.compile_scale(scale, reference_note, reference_frequency, keyboard_mapping),
+                            activate)
+
+    async def load_scale_async(self, name, scale, reference_note=60, reference_frequency=None,
+                               keyboard_mapping=None, activate=False):
+        '''
+        Compute the tables for a scale in a worker thread, and then install them
+
+        The parameters are the same as for ``load_scale()``. The server continues to
+        answer queries (from the tables that were active before the call)
+        while the tables are being computed.
+        '''
+        loop = asyncio.get_running_loop()
+        tables = await loop.run_in_executor(None, self.compile_scale, scale, reference_note,
+                                            reference_frequency, keyboard_mapping)
+        self.install_tables(name, tables, activate)
+
+    def activate(self, name):
+        '''
+        Make a loaded scale the active one
+
+        :param name: The name of the scale
+        '''
+        tables = self.tables[name]
+        self.active = name
+        self._active_table = tables
+
+    def _table(self, name):
+        if name is None:
+            if self._active_table is None:
+                raise ValueError("No scale is loaded")
+            return self._active_table
+        if name not in self.tables:
+            raise ValueError("Unknown scale: %s" % name)
+        return self.tables[name]
+
+    def _query(self, command, arguments):
+        if command in ("freq", "bend"):
+            if len(arguments) not in (1, 2):
+                raise ValueError("Usage: %s NOTE [SCALE]" % command)
+            note = int(arguments[0])
+            if not 0 <= note <= 127:
+                raise ValueError("Note out of range: %d" % note)
+            table = self._table(arguments[1] if len(arguments) == 2 else None)
+            if command == "freq":
+                return [note, table.frequencies[note]]
+            return [note, table.notes[note], table.bends[note]]
+        if command == "use":
+            if len(arguments) != 1:
+                raise ValueError("Usage: use SCALE")
+            self._table(arguments[0])
+            self.activate(arguments[0])
+            return [arguments[0]]
+        if command == "list":
+            return [self.active] + sorted(x for x in self.tables if x != self.active) if self.active else []
+        raise ValueError("Unknown command: %s" % command)
+
+    def _parse(self, data):
+        if data.startswith(b"/"):
+            address, arguments = decode_osc_message(data)
+            if not address.startswith("/pytuning/"):
+                raise ValueError("Unknown address: %s" % address)
+            return True, address[len("/pytuning/"):], arguments
+        words = data.decode("utf-8").split()
+        if len(words) == 0:
+            raise ValueError("Empty request")
+        return False, words[0], words[1:]
+
+    def _reply(self, osc, command, values):
+        if osc:
+            return encode_osc_message("/pytuning/%s" % command, *values)
+        return ("%s %s" % (command, " ".join("%s" % x for x in values))).strip().encode("utf-8")
+
+    def _scale_file(self, file_name):
+        # The real path of a file in the scale directory, or None if it is outside it
+        if self.scale_directory is None:
+            return None
+        path = os.path.realpath(os.path.join(self.scale_directory, file_name))
+        if os.path.commonpath([self.scale_directory, path]) != self.scale_directory:
+            return None
+        return path
+
+    def _is_load_request(self, data):
+        if data.startswith(b"/"):
+            return data.startswith(b"/pytuning/load\0")
+        words = data.split(None, 1)
+        return len(words) > 0 and words[0] == b"load"
+
+    def handle(self, data):
+        '''
+        Answer a request
+
+        :param data: The request (``bytes``)
+        :returns: The reply (``bytes``)
+
+        This is what the server does with each datagram it receives (other than
+        ``load`` requests, which are handled by ``handle_load()``).
+        '''
+        osc = data.startswith(b"/")
+        try:
+            osc, command, arguments = self._parse(data)
+            return self._reply(osc, "ok" if not osc else command, self._query(command, arguments))
+        except (ValueError, UnicodeError) as error:
+            return self._reply(osc, "error", ["%s" % error])
+
+    async def handle_load(self, data):
+        '''
+        Answer a ``load`` request
+
+        :param data: The request (``bytes``)
+        :returns: The reply (``bytes``)
+        '''
+        osc = data.startswith(b"/")
+        try:
+            osc, command, arguments = self._parse(data)
+            if command != "load" or not 2 <= len(arguments) <= 4:
+                raise ValueError("Usage: load SCALE FILE [REFERENCE_NOTE [REFERENCE_FREQUENCY]]")
+            reference_note = int(arguments[2]) if len(arguments) > 2 else 60
+            reference_frequency = float(arguments[3]) if len(arguments) > 3 else None
+        except (ValueError, UnicodeError) as error:
+            return self._reply(osc, "error", ["%s" % error])
+        if self.scale_directory is None:
+            return self._reply(osc, "error", ["Loading scales is not enabled"])
+        try:
+            path = self._scale_file(arguments[1])
+            if path is None:
+                raise ValueError("Outside the scale directory")
+            loop = asyncio.get_running_loop()
+            scale = await loop.run_in_executor(None, read_scala_scale, path)
+            await self.load_scale_async(arguments[0], scale, reference_note, reference_frequency)
+        except (ValueError, UnicodeError, OSError):
+            return self._reply(osc, "error", ["Cannot load scale: %s" % arguments[1]])
+        return self._reply(osc, "ok" if not osc else command, [arguments[0]])
+
+    async def serve_udp(self, host="127.0.0.1", port=9000):
+        '''
+        Start serving on a UDP socket
+
+        :param host: The address to listen on
+        :param port: The port to listen on
+        :returns: The ``asyncio`` transport. The server runs until it is closed.
+        '''
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(lambda: _RetuningProtocol(self),
+                                                           local_addr=(host, port))
+        return transport
+
+    async def serve_unix(self, path):
+        '''
+        Start serving on a Unix datagram socket
+
+        :param path: The path of the socket
+        :returns: The ``asyncio`` transport. The server runs until it is closed.
+
+        Clients must bind their own socket to a path in order to receive replies.
+        '''
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(lambda: _RetuningProtocol(self),
+                                                           local_addr=path, family=socket.AF_UNIX)
+        return transport
+
+    async def _serve_forever(self, serve, *arguments):
+        transport = await serve(*arguments)
+        try:
+            await asyncio.Future()
+        finally:
+            transport.close()
+
+    def run_udp(self, host="127.0.0.1", port=9000):
+        '''
+        Serve on a UDP socket until interrupted
+
+        :param host: The address to listen on
+        :param port: The port to listen on
+        '''
+        asyncio.run(self._serve_forever(self.serve_udp, host, port))
+
+    def run_unix(self, path):
+        '''
+        Serve on a Unix datagram socket until interrupted
+
+        :param path: The path of the socket
+        '''
+        asyncio.run(self._serve_forever(self.serve_unix, path))
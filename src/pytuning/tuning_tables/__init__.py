@@ -1,5 +1,18 @@
 from pytuning.tuning_tables.tuning_tables import create_timidity_tuning, create_fluidsynth_tuning, \
-    create_scala_tuning, create_csound_tuning, create_em_tuning
+    create_scala_tuning, create_csound_tuning, create_em_tuning, stream_timidity_tuning, \
+    stream_fluidsynth_tuning, stream_scala_tuning, stream_csound_tuning, stream_em_tuning, \
+    write_tuning_table, stream_tuning_table_sweep
+from pytuning.tuning_tables.frequency_table import FrequencyTable, create_frequency_table, \
+    create_frequency_matrix, create_frequency_tables
+from pytuning.tuning_tables.keyboard_mapping import KeyboardMapping
+from pytuning.tuning_tables.mts import encode_mts_frequencies, create_mts_bulk_dump, \
+    create_mts_bulk_dumps, stream_mts_single_note_changes, create_mts_scale_octave_tuning
 
 __all__ = ["create_timidity_tuning", "create_fluidsynth_tuning", "create_scala_tuning",
-           "create_csound_tuning", "create_em_tuning"]
\ No newline at end of file
+           "create_csound_tuning", "create_em_tuning", "stream_timidity_tuning",
+           "stream_fluidsynth_tuning", "stream_scala_tuning", "stream_csound_tuning",
+           "stream_em_tuning", "write_tuning_table", "FrequencyTable", "create_frequency_table",
+           "create_frequency_matrix", "create_frequency_tables", "stream_tuning_table_sweep",
+           "KeyboardMapping",
+           "encode_mts_frequencies", "create_mts_bulk_dump", "create_mts_bulk_dumps",
+           "stream_mts_single_note_changes", "create_mts_scale_octave_tuning"]
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:38:20 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import functools
+
+import numpy as np
+
+__all__ = ["FrequencyTable", "create_frequency_table", "edo12_frequency", "create_frequency_matrix",
+           "create_frequency_tables"]
+
+
+def edo12_frequency(note, concert_pitch=440.0):
+    '''
+    The frequency of a MIDI note in the standard tuning (12-EDO, A4 = 440 Hz)
+
+    :param note: The note number (or a NumPy array of note numbers)
+    :param concert_pitch: The frequency of A4 (note 69)
+    :returns: The frequency in Hertz
+    '''
+    return concert_pitch * 2.0 ** ((np.asarray(note, dtype=np.float64) - 69.0) / 12.0)
+
+
+def _note_ratios(degrees, reference_notes):
+    # The octave multiplier and degree of every note, relative to each reference note
+    steps = len(degrees) - 1
+    offsets = np.arange(128) - np.asarray(reference_notes)[..., np.newaxis]
+    return degrees[-1] ** (offsets // steps), degrees[offsets % steps]
+
+
+def _calculate_frequencies(scale, reference_note, reference_frequency):
+    degrees = np.array([float(x) for x in scale], dtype=np.float64)
+    octave_multipliers, note_ratios = _note_ratios(degrees, reference_note)
+    return reference_frequency * octave_multipliers * note_ratios
+
+
+class FrequencyTable(object):
+    '''
+    The frequencies of all 128 MIDI notes for a scale
+
+    :param scale: The scale (list of frequency ratios)
+    :param reference_note: The MIDI number of the absolute frequency reference
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :param frequencies: Precomputed frequencies. If ``None`` (the default) they
+        are calculated from the scale.
+    :param keyboard_mapping: A ``KeyboardMapping``. If given, the notes are
+        assigned to scale degrees by the mapping, and the mapping's reference note
+        and frequency are used in place of ``reference_note`` and ``reference_frequency``.
+
+    The frequencies are calculated once, in floating point, and are stored
+    in the ``frequencies`` member as a read-only NumPy ``float64`` array indexed
+    by note number. Without a keyboard mapping the assignment of notes to
+    degrees is the same as that used by ``note_number_to_freq()``. Notes
+    which are not mapped have a frequency of ``nan``.
+
+    In general tables should be obtained through ``create_frequency_table()``,
+    which caches them.
+    '''
+    def __init__(self, scale, reference_note=60, reference_frequency=None, frequencies=None,
+                 keyboard_mapping=None):
+        if keyboard_mapping is not None:
+            reference_note = keyboard_mapping.reference_note
+            reference_frequency = keyboard_mapping.reference_frequency
+            if frequencies is None:
+                frequencies = keyboard_mapping.frequencies(scale)
+        if reference_frequency is None:
+            reference_frequency = edo12_frequency(reference_note)
+        self.scale = tuple(scale)
+        self.reference_note = reference_note
+        self.reference_frequency = float(reference_frequency)
+        self.keyboard_mapping = keyboard_mapping
+        if frequencies is None:
+            frequencies = _calculate_frequencies(self.scale, reference_note, self.reference_frequency)
+        self.frequencies = np.array(frequencies, dtype=np.float64)
+        self.frequencies.flags.writeable = False
+
+    def __len__(self):
+        return len(self.frequencies)
+
+    def __getitem__(self, note):
+        return self.frequencies[note]
+
+    def __iter__(self):
+        return iter(self.frequencies)
+
+    def cents(self, frequency=None):
+        '''
+        The pitch of each note in cents, relative to a frequency
+
+        :param frequency: The frequency of the zero-cent point. If ``None``
+            (the default) the frequency of MIDI note 0 in 12-EDO is used,
+            so that the values are in "MIDI cents" (100 times the
+            12-EDO note number).
+        :returns: A NumPy ``float64`` array
+        '''
+        if frequency is None:
+            frequency = edo12_frequency(0)
+        return 1200.0 * np.log2(self.frequencies / frequency)
+
+    def pitch_bends(self, bend_range=2.0):
+        '''
+        The 12-EDO note and pitch bend that sounds each note
+
+        :param bend_range: The pitch bend range of the synthesizer, in semitones
+        :returns: A tuple of two NumPy integer arrays, indexed by note number:
+            the MIDI note to play, and the 14-bit pitch bend value to apply (8192 being
+            no bend)
+
+        This allows a scale to be played on a synthesizer which does not
+        support the MIDI Tuning Standard. The note is the nearest 12-EDO
+        note, so the bend is never more than half a semitone. Notes which are
+        not mapped, or which are out of the MIDI range, are given a note of -1.
+        '''
+        cents = self.cents()
+        valid = np.isfinite(cents)
+        nearest = np.rint(np.where(valid, cents, 0.0) / 100.0)
+        valid &= (nearest >= 0) & (nearest <= 127)
+        bends = np.rint(8192.0 + (np.where(valid, cents, 0.0) - 100.0 * nearest) / (100.0 * bend_range) * 8192.0)
+        notes = np.where(valid, nearest, -1).astype(np.int64)
+        bends = np.where(valid, np.clip(bends, 0, 16383), 8192).astype(np.int64)
+        return notes, bends
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_frequency_table(scale, reference_note, reference_frequency, keyboard_mapping):
+    return FrequencyTable(scale, reference_note, reference_frequency, keyboard_mapping=keyboard_mapping)
+
+
+def create_frequency_table(scale, reference_note=60, reference_frequency=None, keyboard_mapping=None):
+    '''
+    Create (or retrieve) the frequency table of a scale
+
+    :param scale: The scale (list of frequency ratios)
+    :param reference_note: The MIDI number of the absolute frequency reference
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :param keyboard_mapping: An optional ``KeyboardMapping`` (see ``FrequencyTable``)
+    :returns: A ``FrequencyTable``
+
+    Tables are cached on the scale, reference note, reference frequency and keyboard mapping,
+    so creating several tuning tables for the same scale and reference
+    only calculates the frequencies once.
+    '''
+    if reference_frequency is None:
+        reference_frequency = edo12_frequency(reference_note)
+    return _cached_frequency_table(tuple(scale), reference_note, float(reference_frequency), keyboard_mapping)
+
+
+def create_frequency_matrix(scale, reference_notes=(60,), concert_pitches=(440.0,)):
+    '''
+    Calculate the frequencies of a scale for many reference notes and pitch standards
+
+    :param scale: The scale (list of frequency ratios)
+    :param reference_notes: The MIDI numbers of the reference notes
+    :param concert_pitches: The pitch standards, as the frequency of A4 (for
+        example 415, 432, 440, or 442 Hz)
+    :returns: A NumPy ``float64`` array with the shape
+        ``(len(reference_notes), len(concert_pitches), 128)``
+
+    Entry ``[i, j, note]`` is the frequency of ``note`` when the scale is rooted
+    at ``reference_notes[i]``, and that note is tuned to its 12-EDO frequency with
+    A4 at ``concert_pitches[j]``. Thus ``concert_pitches=[440.0]`` gives the same
+    frequencies as ``create_frequency_table()`` with the default reference frequency.
+
+    The scale is converted to floating point once, and the tables are formed
+    with array operations, so this is much faster than creating each table
+    separately.
+    '''
+    degrees = np.array([float(x) for x in scale], dtype=np.float64)
+    reference_notes = np.asarray(reference_notes)
+    octave_multipliers, note_ratios = _note_ratios(degrees, reference_notes)
+    reference_frequencies = edo12_frequency(reference_notes[:, np.newaxis],
+                                            np.asarray(concert_pitches, dtype=np.float64)[np.newaxis, :])
+    return reference_frequencies[:, :, np.newaxis] * octave_multipliers[:, np.newaxis, :] * \
+        note_ratios[:, np.newaxis, :]
+
+
+def create_frequency_tables(scale, reference_notes=(60,), concert_pitches=(440.0,)):
+    '''
+    Create frequency tables for many reference notes and pitch standards
+
+    :param scale: The scale (list of frequency ratios)
+    :param reference_notes: The MIDI numbers of the reference notes
+    :param concert_pitches: The pitch standards, as the frequency of A4
+    :returns: A list of ``FrequencyTable`` objects, ordered by reference note and then
+        by pitch standard
+
+    The frequencies are calculated with ``create_frequency_matrix()``.
+    '''
+    matrix = create_frequency_matrix(scale, reference_notes, concert_pitches)
+    scale = tuple(scale)
+    return [FrequencyTable(scale, note, matrix[i, j, note], frequencies=matrix[i, j])
+            for i, note in enumerate(reference_notes) for j in range(len(concert_pitches))]
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:52:37 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import functools
+
+import numpy as np
+
+from pytuning.tuning_tables.frequency_table import edo12_frequency
+
+__all__ = ["KeyboardMapping"]
+
+
+class KeyboardMapping(object):
+    '''
+    A mapping of MIDI notes (keys) onto the degrees of a scale
+
+    :param mapping: The scale degree for each key in the repeating pattern
+        of the mapping, with ``None`` for keys which are not mapped. If ``None``
+        (the default) the mapping is linear: each key is assigned to the next
+        degree of the scale.
+    :param middle_note: The MIDI note to which the first entry of the mapping
+        (and thus the first degree of the scale) is assigned
+    :param reference_note: The MIDI note for which the frequency is given. If
+        ``None`` (the default) it is the same as ``middle_note``.
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :param first_note: The first MIDI note which is mapped
+    :param last_note: The last MIDI note which is mapped
+    :param octave_degree: The scale degree whose ratio is the interval between
+        repetitions of the mapping. If ``None`` (the default) it is the number of
+        degrees in the scale, so that each repetition moves by the formal octave.
+
+    This follows the model of Scala keyboard mapping (``.kbm``) files. The
+    pattern in ``mapping`` is repeated across the keyboard in both directions
+    from ``middle_note``, and each repetition is transposed by the ratio of
+    degree ``octave_degree`` of the scale. (For scales with unequal steps this is
+    not the same as moving ``octave_degree`` degrees up the scale from each
+    key.) For example, to place a seven-note scale on the white keys of
+    the keyboard, with the black keys left unmapped and A4 tuned to 440 Hz:
+
+    .. code::
+
+        mapping = KeyboardMapping([0, None, 1, None, 2, 3, None, 4, None, 5, None, 6],
+                                  middle_note=60, reference_note=69, reference_frequency=440.0,
+                                  octave_degree=7)
+
+    The frequencies are calculated once for each scale and stored in a 128-entry
+    array (see ``frequencies()``), so looking up a note is an array read.
+
+    ``create_frequency_table()`` and ``note_number_to_freq()`` accept a
+    ``KeyboardMapping`` through their ``keyboard_mapping`` parameter.
+    '''
+    def __init__(self, mapping=None, middle_note=60, reference_note=None, reference_frequency=None,
+                 first_note=0, last_note=127, octave_degree=None):
+        if reference_note is None:
+            reference_note = middle_note
+        if reference_frequency is None:
+            reference_frequency = edo12_frequency(reference_note)
+        self.mapping = None if mapping is None else tuple(mapping)
+        if self.mapping is not None and len(self.mapping) == 0:
+            raise ValueError("The mapping must contain at least one key")
+        self.middle_note = middle_note
+        self.reference_note = reference_note
+        self.reference_frequency = float(reference_frequency)
+        self.first_note = first_note
+        self.last_note = last_note
+        self.octave_degree = octave_degree
+
+    @classmethod
+    def from_scala(cls, keyboard_mapping):
+        '''
+        Create a ``KeyboardMapping`` from a parsed Scala keyboard mapping
+
+        :param keyboard_mapping: The ``dict`` returned by ``pytuning.scala.read_scala_keyboard_mapping()``
+        :returns: The ``KeyboardMapping``
+        '''
+        return cls(keyboard_mapping["mapping"] if keyboard_mapping["size"] > 0 else None,
+                   middle_note=keyboard_mapping["middle_note"],
+                   reference_note=keyboard_mapping["reference_note"],
+                   reference_frequency=keyboard_mapping["reference_frequency"],
+                   first_note=keyboard_mapping["first_note"],
+                   last_note=keyboard_mapping["last_note"],
+                   octave_degree=keyboard_mapping["octave_degree"] or None)
+
+    def _key(self):
+        return (self.mapping, self.middle_note, self.reference_note, self.reference_frequency,
+                self.first_note, self.last_note, self.octave_degree)
+
+    def __eq__(self, other):
+        return isinstance(other, KeyboardMapping) and self._key() == other._key()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return "KeyboardMapping(%s, middle_note=%d, reference_note=%d, reference_frequency=%s, " \
+               "first_note=%d, last_note=%d, octave_degree=%s)" % self._key()
+
+    def degrees(self):
+        '''
+        The scale degree assigned to each MIDI note
+
+        :returns: A tuple of three NumPy arrays of length 128: the degrees given by the
+            mapping (counted from the first degree of the scale, and continuing
+            through the octaves of the scale), the number of repetitions of the mapping
+            from ``middle_note``, and a boolean array which is ``True`` for mapped notes.
+            The ratio of a note is that of its degree, multiplied by the ratio of
+            ``octave_degree`` for each repetition.
+        '''
+        notes = np.arange(128)
+        offsets = notes - self.middle_note
+        if self.mapping is None:
+            return offsets, np.zeros(128, dtype=np.int64), np.ones(128, dtype=bool)
+        pattern = np.array([0 if x is None else x for x in self.mapping], dtype=np.int64)
+        present = np.array([x is not None for x in self.mapping], dtype=bool)
+        positions = offsets % len(pattern)
+        return pattern[positions], offsets // len(pattern), present[positions]
+
+    def frequencies(self, scale):
+        '''
+        The frequency of each MIDI note
+
+        :param scale: The scale (list of frequency ratios)
+        :returns: A read-only NumPy ``float64`` array of length 128, indexed by note
+            number. Notes which are not mapped have a frequency of ``nan``.
+
+        The result is cached, so repeated calls with the same scale are not recalculated.
+        '''
+        return _compile_keyboard_mapping(self, tuple(scale))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_keyboard_mapping(keyboard_mapping, scale):
+    steps = len(scale) - 1
+    degrees, repetitions, mapped = keyboard_mapping.degrees()
+    if not mapped[keyboard_mapping.reference_note]:
+        raise ValueError("The reference note %d is not mapped" % keyboard_mapping.reference_note)
+    scale_ratios = np.array([float(x) for x in scale], dtype=np.float64)
+
+    def degree_ratio(degree):
+        # Degrees beyond the scale continue through its formal octaves
+        return scale_ratios[-1] ** (degree // steps) * scale_ratios[degree % steps]
+
+    octave_degree = steps if keyboard_mapping.octave_degree is None else keyboard_mapping.octave_degree
+    ratios = degree_ratio(degrees) * degree_ratio(octave_degree) ** repetitions
+    frequencies = keyboard_mapping.reference_frequency * ratios / ratios[keyboard_mapping.reference_note]
+    notes = np.arange(128)
+    mapped = mapped & (notes >= keyboard_mapping.first_note) & (notes <= keyboard_mapping.last_note)
+    frequencies[~mapped] = np.nan
+    frequencies.flags.writeable = False
+    return frequencies
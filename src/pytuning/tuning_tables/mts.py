@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 13:05:44 2026
+
+@author: mark
+"""
+
+from __future__ import print_function, division
+
+import numpy as np
+
+from pytuning.tuning_tables.frequency_table import create_frequency_table
+
+__all__ = ["encode_mts_frequencies", "create_mts_bulk_dump", "create_mts_bulk_dumps",
+           "stream_mts_single_note_changes", "create_mts_scale_octave_tuning"]
+
+# The MIDI Tuning Standard messages are universal system exclusive messages.
+# 0x7E is the non-real-time header, 0x7F the real-time header, and 0x08 the
+# sub-ID for MIDI tuning.
+
+_NON_REAL_TIME = 0x7E
+_REAL_TIME = 0x7F
+_MIDI_TUNING = 0x08
+
+_BULK_DUMP_LENGTH = 6 + 16 + 128 * 3 + 2
+
+
+def encode_mts_frequencies(frequencies):
+    '''
+    Encode frequencies in the MIDI Tuning Standard frequency format
+
+    :param frequencies: The frequencies, in Hertz. This can be a scalar, or
+        a NumPy array of any shape.
+    :returns: A NumPy ``uint8`` array with an extra trailing dimension of length 3
+
+    Each frequency is encoded as three 7-bit bytes: the 12-EDO semitone at or
+    below the frequency (the MIDI note number), followed by the fraction of
+    a semitone above it as a 14-bit value (most significant byte first), so the
+    resolution is about 0.0061 cents.
+
+    Frequencies below note 0 are clamped to note 0, and those above the
+    range of the encoding are clamped to its maximum. Frequencies that
+    are not a number (``nan``) are encoded as ``7F 7F 7F``, which the
+    standard defines as "no change".
+    '''
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+    missing = np.isnan(frequencies)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        semitones = 69.0 + 12.0 * np.log2(np.where(missing, 440.0, frequencies) / 440.0)
+    semitones = np.nan_to_num(semitones, nan=0.0, neginf=0.0, posinf=127.0)
+    value = np.rint(np.clip(semitones, 0.0, 128.0) * 16384.0).astype(np.int64)
+    value = np.clip(value, 0, 128 * 16384 - 2)
+    output = np.empty(frequencies.shape + (3,), dtype=np.uint8)
+    output[..., 0] = value >> 14
+    output[..., 1] = (value >> 7) & 0x7F
+    output[..., 2] = value & 0x7F
+    output[missing] = 0x7F
+    return output
+
+
+def _encode_name(name):
+    name = (name or "").encode("ascii", "replace")[:16]
+    return np.frombuffer(name.ljust(16, b" "), dtype=np.uint8) & 0x7F
+
+
+def create_mts_bulk_dumps(scales, reference_note=60, reference_frequency=None, programs=None,
+                          names=None, device_id=0x7F):
+    '''
+    Create MIDI Tuning Standard bulk tuning dumps for many scales
+
+    :param scales: A list of scales
+    :param reference_note: The MIDI number of the absolute frequency reference
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :param programs: The tuning program number for each scale. If ``None``
+        the scales are numbered consecutively from zero (modulo 128).
+    :param names: The name of each scale (up to 16 ASCII characters). If ``None``
+        each scale is named "pytuning".
+    :param device_id: The SysEx device ID. The default (0x7F) addresses all devices.
+    :returns: A list of messages (``bytes``), one for each scale
+
+    The encoding and checksum calculation is done for all the scales at once,
+    so this function should be used (rather than ``create_mts_bulk_dump()``)
+    when creating dumps for a large number of scales.
+    '''
+    scales = list(scales)
+    count = len(scales)
+    if programs is None:
+        programs = [x % 128 for x in range(count)]
+    if names is None:
+        names = ["pytuning"] * count
+    frequencies = np.array([create_frequency_table(scale, reference_note, reference_frequency).frequencies
+                            for scale in scales]).reshape(count, 128)
+
+    messages = np.zeros((count, _BULK_DUMP_LENGTH), dtype=np.uint8)
+    messages[:, 0] = 0xF0
+    messages[:, 1] = _NON_REAL_TIME
+    messages[:, 2] = device_id & 0x7F
+    messages[:, 3] = _MIDI_TUNING
+    messages[:, 4] = 0x01
+    messages[:, 5] = np.asarray(programs, dtype=np.uint8) & 0x7F
+    messages[:, 6:22] = np.array([_encode_name(x) for x in names], dtype=np.uint8).reshape(count, 16)
+    messages[:, 22:406] = encode_mts_frequencies(frequencies).reshape(count, 384)
+    messages[:, 406] = np.bitwise_xor.reduce(messages[:, 1:406], axis=1) & 0x7F
+    messages[:, 407] = 0xF7
+    return [row.tobytes() for row in messages]
+
+
+def create_mts_bulk_dump(scale, reference_note=60, reference_frequency=None, program=0,
+                         name="pytuning", device_id=0x7F):
+    '''
+    Create a MIDI Tuning Standard bulk tuning dump
+
+    :param scale: The scale to model (list of frequency ratios)
+    :param reference_note: The MIDI number of the absolute frequency reference
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :param program: The tuning program number (0-127)
+    :param name: The name of the tuning (up to 16 ASCII characters)
+    :param device_id: The SysEx device ID. The default (0x7F) addresses all devices.
+    :returns: The SysEx message (``bytes``)
+
+    The bulk dump sets the frequency of all 128 notes of a tuning program
+    in the receiving device. The message can be written to a ``.syx`` file,
+    which many synthesizers and MIDI utilities can load:
+
+    .. code::
+
+        from pytuning.scales import create_edo_scale
+        from pytuning.tuning_tables import create_mts_bulk_dump, write_tuning_table
+
+        scale = create_edo_scale(19)
+        with open("19-edo.syx", "wb") as syx:
+            write_tuning_table(syx, create_mts_bulk_dump(scale, reference_note=69, name="19-EDO"))
+    '''
+    return create_mts_bulk_dumps([scale], reference_note, reference_frequency, [program],
+                                 [name], device_id)[0]
+
+
+def stream_mts_single_note_changes(scale, reference_note=60, reference_frequency=None, program=0,
+                                   notes=None, device_id=0x7F, notes_per_message=64):
+    '''
+    Create MIDI Tuning Standard real-time single note tuning changes
+
+    :param scale: The scale to model (list of frequency ratios)
+    :param reference_note: The MIDI number of the absolute frequency reference
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :param program: The tuning program number (0-127)
+    :param notes: The notes to retune. If ``None`` all 128 notes are retuned.
+    :param device_id: The SysEx device ID. The default (0x7F) addresses all devices.
+    :param notes_per_message: The maximum number of notes in each message (1-127)
+    :returns: A generator yielding the SysEx messages (``bytes``)
+
+    Unlike the bulk dump, these messages take effect immediately, including
+    for notes that are already sounding.
+    '''
+    table = create_frequency_table(scale, reference_note, reference_frequency)
+    notes = list(range(128)) if notes is None else list(notes)
+    encoded = encode_mts_frequencies(table.frequencies)
+    for start in range(0, len(notes), notes_per_message):
+        chunk = notes[start:start + notes_per_message]
+        message = bytearray([0xF0, _REAL_TIME, device_id & 0x7F, _MIDI_TUNING, 0x02,
+                             program & 0x7F, len(chunk)])
+        for note in chunk:
+            message.append(note & 0x7F)
+            message.extend(encoded[note].tobytes())
+        message.append(0xF7)
+        yield bytes(message)
+
+
+def create_mts_scale_octave_tuning(scale, reference_note=60, reference_frequency=None,
+                                   channels=range(16), two_byte=False, real_time=False,
+                                   device_id=0x7F):
+    '''
+    Create a MIDI Tuning Standard scale/octave tuning message
+
+    :param scale: The scale to model (list of frequency ratios)
+    :param reference_note: The MIDI number of the absolute frequency reference
+    :param reference_frequency: The frequency of the reference note. If ``None``
+        (the default) the frequency will be taken from the standard MIDI 12-EDO tuning
+    :param channels: The MIDI channels (0-15) to which the tuning applies
+    :param two_byte: If ``True`` use the two-byte (14-bit) form of the message,
+        otherwise use the one-byte (1 cent resolution) form
+    :param real_time: If ``True`` send the message as a real-time message
+    :param device_id: The SysEx device ID. The default (0x7F) addresses all devices.
+    :returns: The SysEx message (``bytes``)
+
+    A scale/octave tuning gives, for each of the twelve pitch classes, an
+    offset from 12-EDO which is applied in every octave. It is therefore only an
+    exact representation of twelve-note scales with a 2/1 octave. The offsets are
+    taken from the twelve notes starting at ``reference_note``.
+
+    The one-byte form has a range of -64 to +63 cents, and the two-byte form
+    a range of -100 to +100 cents. Offsets outside of these ranges are clamped.
+    '''
+    table = create_frequency_table(scale, reference_note, reference_frequency)
+    notes = np.arange(reference_note, reference_note + 12) % 128
+    offsets = np.zeros(12)
+    offsets[notes % 12] = table.cents()[notes] - 100.0 * notes
+
+    mask = 0
+    for channel in channels:
+        mask = mask | (1 << channel)
+    message = bytearray([0xF0, _REAL_TIME if real_time else _NON_REAL_TIME, device_id & 0x7F,
+                         _MIDI_TUNING, 0x09 if two_byte else 0x08,
+                         (mask >> 14) & 0x03, (mask >> 7) & 0x7F, mask & 0x7F])
+    if two_byte:
+        values = np.clip(np.rint(offsets / 100.0 * 8192.0) + 8192, 0, 16383).astype(np.int64)
+        for value in values:
+            message.extend([value >> 7, value & 0x7F])
+    else:
+        values = np.clip(np.rint(offsets) + 64, 0, 127).astype(np.int64)
+        message.extend(values.tolist())
+    message.append(0xF7)
+    return bytes(message)
@@ -5,6 +5,9 @@ Created on Tue May 26 10:49:30 2015
 @author: mark
 """
 
+import io
+
+import numpy as np
 import sympy as sp
 
 try:
@@ -12,7 +15,16 @@ try:
 except AttributeError:
     numbers = sp.core.numbers
 
-from pytuning.utilities import note_number_to_freq, ratio_to_cents
+from pytuning.utilities import ratio_to_cents
+from pytuning.tuning_tables.frequency_table import create_frequency_table, create_frequency_tables
+
+
+def _format_frequency(frequency):
+    '''
+    Format a frequency to fifteen significant figures, in the same way as
+    a (default precision) ``sympy`` floating point value.
+    '''
+    return "%s" % sp.Float(float(frequency))
 
 
 def create_timidity_tuning(scale, reference_note=60, reference_frequency=None):
@@ -29,7 +41,11 @@ def create_timidity_tuning(scale, reference_note=60, reference_frequency=None):
     the scale to to the standard concert tuning of middle C (A = 440Hz).
 
     The Timidity table is basically a list of integers for all defined
-    MIDI note numbers, with each entry as 1000 times the note frequency
+    MIDI note numbers, with each entry as 1000 times the note frequency,
+    rounded to the nearest integer. The frequencies are calculated in floating
+    point, so a value that is exactly half-way between two integers (such as
+    12237.5) may be rounded down where earlier versions, which worked with
+    15-digit ``sympy`` values, rounded it up.
 
     As a somewhat detailed example, let's say that the user had a 12-EDO
     scale constructed, and wanted to pin the tonic note to
@@ -67,19 +83,7 @@ def create_timidity_tuning(scale, reference_note=60, reference_frequency=None):
         timidity -Z table.name -iA
 
     '''
-    if reference_frequency is None:
-        reference_frequency = note_number_to_freq(reference_note)
-
-    output_string = '''# Timidity tuning table created by pytuning,
-# call timidity with the -Z option to enable.
-# Note reference: %d; Freq reference: %f Hz''' % (reference_note, reference_frequency)
-    for note in range(128):
-        output_string = output_string + '\n' + str(
-            int(round(
-                note_number_to_freq(
-                    note, scale, reference_note=reference_note, reference_frequency=reference_frequency) * 1000.0))
-        )
-    return output_string
+    return "".join(stream_timidity_tuning(scale, reference_note, reference_frequency))
 
 
 def create_em_tuning(scale, reference_note=60, reference_frequency=None):
@@ -96,17 +100,7 @@ def create_em_tuning(scale, reference_note=60, reference_frequency=None):
         the scale to to the standard concert tuning of middle C (A = 440Hz).
 
     '''
-    if reference_frequency is None:
-        reference_frequency = note_number_to_freq(reference_note)
-
-    output_string = '''# Emergent Tuning Table created by MCW
-# Note reference: %d; Freq reference: %f Hz''' % (reference_note, reference_frequency)
-    for note in range(128):
-        output_string = output_string + '\n' + "set tuning ( " + str(note) + "    " + str(
-            note_number_to_freq(note, scale, reference_note=reference_note,
-                                reference_frequency=reference_frequency)
-        ) + ")"
-    return output_string
+    return "".join(stream_em_tuning(scale, reference_note, reference_frequency))
 
 
 def create_fluidsynth_tuning(scale, reference_note=60, chan=[0], bank=0, prog=[0],
@@ -168,28 +162,7 @@ def create_fluidsynth_tuning(scale, reference_note=60, chan=[0], bank=0, prog=[0
 
 
     '''
-
-    # The fluidsynth tuning table apears to be in cents, based upon a standard 12-EDO scale,
-    # 69 = 440.0 Thus we'll need to calculate this base freqency
-
-    if reference_frequency is None:
-        reference_frequency = note_number_to_freq(reference_note)
-
-    base_freq = note_number_to_freq(0, None, reference_note=69,
-                                    reference_frequency=440.0)
-    output_string = '''# Fluidsynth Tuning Table created by pytuning
-# Note reference: %d; Freq reference: %f Hz''' % (reference_note, reference_frequency)
-    for program in prog:
-        output_string = output_string + "\ntuning tuning%03d %d %d" % (program, bank, program)
-        for note in range(128):
-            freq = note_number_to_freq(
-                note, scale, reference_note=reference_note, reference_frequency=reference_frequency)
-            cents = ratio_to_cents(freq / base_freq) if ratio_to_cents(freq / base_freq) > 0.00001 else 0.0
-            output_string = output_string + "\ntune %d %d %d %f" % (bank, program, note, cents)
-    for channel in chan:
-        for program in prog:
-            output_string = output_string + "\nsettuning %d %d %d" % (channel, bank, program)
-    return output_string
+    return "".join(stream_fluidsynth_tuning(scale, reference_note, chan, bank, prog, reference_frequency))
 
 
 def create_scala_tuning(scale, name):
@@ -274,21 +247,7 @@ def create_scala_tuning(scale, name):
         2/1
 
     '''
-    output = "! Scale produced by pytuning. For tuning yoshimi or zynaddsubfx,\n! only include the portion below the final '!'"
-    output = output + "\n!"
-    output = output + "\n%s" % name
-    output = output + "\n%3d" % (len(scale) - 1)
-    output = output + "\n!"
-    for degree in scale[1:]:
-        if isinstance(degree, numbers.Rational) and isinstance(sp.fraction(degree)[0], numbers.Integer) \
-                and isinstance(sp.fraction(degree)[1], numbers.Integer):
-            representation = "%s" % degree
-        elif isinstance(degree, numbers.Integer) or isinstance(degree, numbers.One):
-            representation = "%s/1" % degree
-        else:
-            representation = "%0.5f" % ratio_to_cents(degree)
-        output = output + "\n%s" % representation
-    return output
+    return "".join(stream_scala_tuning(scale, name))
 
 
 def create_csound_tuning(scale, reference_note=60, reference_frequency=None,
@@ -337,26 +296,212 @@ def create_csound_tuning(scale, reference_note=60, reference_frequency=None,
                      8372.01809  8869.84419  9397.27257  9956.06348 10548.08182 11175.30341 11839.82153 12543.85395
 
     '''
-    if reference_frequency is None:
-        reference_frequency = note_number_to_freq(reference_note)
+    return "".join(stream_csound_tuning(scale, reference_note, reference_frequency, table_num))
+
+
+def stream_timidity_tuning(scale, reference_note=60, reference_frequency=None):
+    '''
+    Create a Timidity++ tuning table, in pieces
+
+    The parameters are the same as those of ``create_timidity_tuning()``.
+    This is a generator yielding the table as a series of strings, which
+    concatenate to the output of ``create_timidity_tuning()``.
+    '''
+    return _stream_timidity_table(create_frequency_table(scale, reference_note, reference_frequency))
+
+
+def _stream_timidity_table(table):
+    yield '''# Timidity tuning table created by pytuning,
+# call timidity with the -Z option to enable.
+# Note reference: %d; Freq reference: %f Hz''' % (table.reference_note, table.reference_frequency)
+    entries = table.frequencies * 1000.0
+    if not np.all(np.isfinite(entries)):
+        raise ValueError("The frequencies of the scale are too large for a Timidity table")
+    # Python integers, as the entries for a large period can exceed 64 bits
+    yield "".join(["\n%d" % round(x) for x in entries.tolist()])
+
+
+def stream_em_tuning(scale, reference_note=60, reference_frequency=None):
+    '''
+    Create an Emergent tuning table, in pieces
+
+    The parameters are the same as those of ``create_em_tuning()``.
+    This is a generator yielding the table as a series of strings, which
+    concatenate to the output of ``create_em_tuning()``.
+    '''
+    return _stream_em_table(create_frequency_table(scale, reference_note, reference_frequency))
+
+
+def _stream_em_table(table):
+    yield '''# Emergent Tuning Table created by MCW
+# Note reference: %d; Freq reference: %f Hz''' % (table.reference_note, table.reference_frequency)
+    yield "".join(["\nset tuning ( %d    %s)" % (note, _format_frequency(freq)) for note, freq in enumerate(table)])
+
+
+def stream_fluidsynth_tuning(scale, reference_note=60, chan=[0], bank=0, prog=[0],
+                             reference_frequency=None):
+    '''
+    Create a Fluidsynth tuning table, in pieces
+
+    The parameters are the same as those of ``create_fluidsynth_tuning()``.
+    This is a generator yielding the table as a series of strings (one for
+    each program), which concatenate to the output of ``create_fluidsynth_tuning()``.
+
+    The note entries are only formatted once, so the time needed is linear
+    in the number of programs.
+    '''
+
+    return _stream_fluidsynth_table(create_frequency_table(scale, reference_note, reference_frequency),
+                                    chan, bank, prog)
+
+
+def _stream_fluidsynth_table(table, chan=[0], bank=0, prog=[0]):
+
+    # The fluidsynth tuning table apears to be in cents, based upon a standard 12-EDO scale,
+    # 69 = 440.0. FrequencyTable.cents() is referenced to that scale.
+
+    cents = table.cents()
+    cents = np.where(cents > 0.00001, cents, 0.0)
+    notes = [" %d %f" % (note, cents[note]) for note in range(128)]
+
+    yield '''# Fluidsynth Tuning Table created by pytuning
+# Note reference: %d; Freq reference: %f Hz''' % (table.reference_note, table.reference_frequency)
+    for program in prog:
+        prefix = "\ntune %d %d" % (bank, program)
+        yield "\ntuning tuning%03d %d %d" % (program, bank, program) + "".join([prefix + x for x in notes])
+    for channel in chan:
+        yield "".join(["\nsettuning %d %d %d" % (channel, bank, program) for program in prog])
+
+
+def stream_scala_tuning(scale, name):
+    '''
+    Create a Scala scale file, in pieces
+
+    The parameters are the same as those of ``create_scala_tuning()``.
+    This is a generator yielding the file as a series of strings, which
+    concatenate to the output of ``create_scala_tuning()``.
+    '''
+    yield "! Scale produced by pytuning. For tuning yoshimi or zynaddsubfx,\n! only include the portion below the final '!'"
+    yield "\n!"
+    yield "\n%s" % name
+    yield "\n%3d" % (len(scale) - 1)
+    yield "\n!"
+    for degree in scale[1:]:
+        if isinstance(degree, numbers.Rational) and isinstance(sp.fraction(degree)[0], numbers.Integer) \
+                and isinstance(sp.fraction(degree)[1], numbers.Integer):
+            representation = "%s" % degree
+        elif isinstance(degree, numbers.Integer) or isinstance(degree, numbers.One):
+            representation = "%s/1" % degree
+        else:
+            representation = "%0.5f" % ratio_to_cents(degree)
+        yield "\n%s" % representation
+
+
+def stream_csound_tuning(scale, reference_note=60, reference_frequency=None, table_num=1):
+    '''
+    Create a CSound tuning table, in pieces
+
+    The parameters are the same as those of ``create_csound_tuning()``.
+    This is a generator yielding the table one line at a time. The lines
+    concatenate to the output of ``create_csound_tuning()``.
+    '''
+    return _stream_csound_table(create_frequency_table(scale, reference_note, reference_frequency), table_num)
 
-    output_string = ""
+
+def _stream_csound_table(table, table_num=1):
     entries_per_line = 8
-    line = "f%d 0 256 -2 " % table_num
-    index = 1
-    for note in range(128):
-        freq = note_number_to_freq(
-            note, scale, reference_note=reference_note, reference_frequency=reference_frequency)
-        representation = "%11.5f" % freq
-        line = line + representation + " "
-        if index % entries_per_line == 0:
-            line = line + "\\\n"
-            output_string = output_string + line
-            line = "            "
-        index += 1
-    output_string = output_string + line
-    output_string = output_string.strip()
-    if output_string[-1] == "\\":
-        output_string = output_string[:-2]
-
-    return output_string.strip() + "\n"
+    representations = ["%11.5f" % freq for freq in table]
+    for index in range(0, len(representations), entries_per_line):
+        prefix = "f%d 0 256 -2 " % table_num if index == 0 else "            "
+        line = prefix + " ".join(representations[index:index + entries_per_line])
+        if index + entries_per_line < len(representations):
+            yield line + " \\\n"
+        else:
+            yield line + "\n"
+
+
+_TABLE_FORMATS = {
+    "timidity": _stream_timidity_table,
+    "em": _stream_em_table,
+    "fluidsynth": _stream_fluidsynth_table,
+    "csound": _stream_csound_table,
+}
+
+
+def stream_tuning_table_sweep(scale, table_format, reference_notes=(60,), concert_pitches=(440.0,), **options):
+    '''
+    Create tuning tables for a scale at many reference notes and pitch standards
+
+    :param scale: The scale to model (list of frequency ratios)
+    :param table_format: The format of the tables: ``"timidity"``, ``"em"``,
+        ``"fluidsynth"`` or ``"csound"``
+    :param reference_notes: The MIDI numbers of the reference notes
+    :param concert_pitches: The pitch standards, as the frequency of A4
+    :param options: Other options for the format (``chan``, ``bank`` and ``prog``
+        for Fluidsynth, and ``table_num`` for Csound)
+    :returns: A generator yielding a tuple (reference note, concert pitch, table)
+        for each combination of reference note and pitch standard
+
+    Each reference note is tuned to its 12-EDO frequency at the pitch
+    standard, so the table for reference note ``n`` and concert pitch ``p`` is
+    the same as that produced by (for example)
+    ``create_timidity_tuning(scale, n, 2 ** ((n - 69) / 12) * p)``. However, all
+    the frequencies are calculated at once (see ``create_frequency_matrix()``),
+    so this is much faster than creating the tables individually. For example, to
+    create Csound tables for a meantone scale at several historical pitch standards:
+
+    .. code::
+
+        scale = create_quarter_comma_meantone_scale()
+        for note, pitch, table in stream_tuning_table_sweep(scale, "csound", [60, 62, 69],
+                                                           [415.0, 430.0, 440.0, 466.0]):
+            with open("meantone-%d-%d.sco" % (note, pitch), "w") as score:
+                score.write(table)
+    '''
+    if table_format not in _TABLE_FORMATS:
+        raise ValueError("Unknown table format: %s" % table_format)
+    tables = create_frequency_tables(scale, reference_notes, concert_pitches)
+    combinations = [(note, pitch) for note in reference_notes for pitch in concert_pitches]
+    for (note, pitch), table in zip(combinations, tables):
+        yield note, pitch, "".join(_TABLE_FORMATS[table_format](table, **options))
+
+
+def write_tuning_table(file_object, table, encoding="utf-8"):
+    '''
+    Write a tuning table to a file object
+
+    :param file_object: The file object. It can be opened in either text or
+        binary mode.
+    :param table: The table, either as a string (such as is returned by
+        ``create_timidity_tuning()``) or an iterable of strings (such
+        as is returned by ``stream_timidity_tuning()``)
+    :param encoding: The encoding used if the file is binary
+    :returns: ``None``
+
+    If the table is passed as a stream the pieces are written as they are
+    created, so the complete table is never held in memory. For example, to
+    write a Fluidsynth table of all 128 programs for every channel:
+
+    .. code::
+
+        from pytuning.tuning_tables import stream_fluidsynth_tuning, write_tuning_table
+
+        with open("fluidsynth.table", "w") as table_file:
+            write_tuning_table(table_file, stream_fluidsynth_tuning(
+                scale, reference_note=69, chan=range(16), prog=range(128)))
+    '''
+    if isinstance(table, (str, bytes)):
+        table = [table]
+    binary = _is_binary_file(file_object)
+    for chunk in table:
+        if binary and not isinstance(chunk, bytes):
+            chunk = chunk.encode(encoding)
+        file_object.write(chunk)
+
+
+def _is_binary_file(file_object):
+    if isinstance(file_object, io.TextIOBase):
+        return False
+    if isinstance(file_object, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(file_object, "mode", "")
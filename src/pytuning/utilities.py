@@ -7,15 +7,19 @@ Created on Tue May 26 10:36:08 2015
 
 from __future__ import print_function, division
 import sympy as sp
+import numpy as np
 import itertools
+import math
 
 import pytuning.constants
+from pytuning.backends import get_backend
+from pytuning.runtime.scales import reduce_to_octave as _reduce_to_octave
 
 __all__ = ["normalize_interval", "distinct_intervals", "get_mode_masks", "mask_scale", "mask_to_steps", \
            "ratio_to_cents", "cents_to_ratio", "note_number_to_freq", "compare_two_scales",
-           "ratio_to_name"]
+           "ratio_to_name", "ratio_to_nearest_names"]
 
-def normalize_interval(interval, octave=2):
+def normalize_interval(interval, octave=2, backend=None):
     '''
     
     Normalize a musical interval
@@ -24,6 +28,8 @@ def normalize_interval(interval, octave=2):
                      ratio, most usefully expressed as a `sympy.Rational`
                      or related data item
     :param octave: The formal octave. Defaults to 2
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+                    the default backend is used.
     :returns: The interval, normalized
     
     Note that any formal octave can be used. In normal usage a
@@ -33,7 +39,15 @@ def normalize_interval(interval, octave=2):
     by the interval (in the case of an interval less than 1) or divided into
     the interval (for intervals greater than 2) will bring the interval into
     the target range of :math:`1 \\le i \\le 2`.
+
+    With a backend other than ``sympy`` the interval is converted to the backend's
+    type and is normalized by repeated multiplication or division (see
+    ``pytuning.runtime.reduce_to_octave()``), which gives the same result.
     '''
+    backend = get_backend(backend)
+    interval = backend.number(interval)
+    if not backend.symbolic and not isinstance(interval, sp.Basic):
+        return _reduce_to_octave(interval, backend.number(octave))
     if interval >= octave:
         return interval/(octave**(sp.ceiling((sp.log(interval/octave)/sp.log(octave)).evalf())))
     elif interval < 1:
@@ -41,11 +55,13 @@ def normalize_interval(interval, octave=2):
     else:
         return interval
 
-def distinct_intervals(scale):
+def distinct_intervals(scale, backend=None):
     '''    
     Find the distinct intervals in a scale, including inversions
     
     :param scale: The scale to analyze
+    :param backend: The numeric backend (see ``pytuning.backends``). If ``None``
+        the default backend is used.
     :returns: A list of distinct intervals
     
     The scale should be specified as a list of ``sympy`` numerical
@@ -80,12 +96,19 @@ def distinct_intervals(scale):
         di_in_cents = [ratio_to_cents(x) for x in di]
             
     '''
+    backend = get_backend(backend)
+    scale = [backend.number(x) for x in scale]
     base = scale[-1] # the formal octave
     # Make the scale span two octaves to get inversions
-    temp_scale = scale + [x*sp.Integer(base) for x in scale]
+    temp_scale = scale + [x*base for x in scale]
     pairs = [x for x in itertools.combinations(temp_scale,2)]
     #intervals = sorted(list(set(map(lambda x: x[1]/x[0], pairs))))
-    intervals = list(set(map(lambda x: x[1]/x[0], pairs)))
+    if backend.exact:
+        intervals = list(set(map(lambda x: x[1]/x[0], pairs)))
+    else:
+        # The same interval calculated from different pairs can differ in the
+        # last few bits, so floating point intervals are matched after rounding
+        intervals = list(dict((round(x, 12), x) for x in map(lambda x: x[1]/x[0], pairs)).values())
     intervals = filter (lambda x: x < 2, intervals)
     intervals = filter (lambda x: x != 1, intervals)
     return [x for x in intervals]
@@ -234,7 +257,7 @@ def cents_to_ratio(cents):
     return sp.exp(cents * sp.log(cent)).evalf()
 
 def note_number_to_freq(note, scale = None, reference_note=69, 
-                        reference_frequency=440.0):
+                        reference_frequency=440.0, keyboard_mapping=None):
     '''                        
     Convert a note number (MIDI) to a frequency (Hz).
     
@@ -242,14 +265,24 @@ def note_number_to_freq(note, scale = None, reference_note=69,
     :param scale: The scale. If none it assume EDO 12.
     :param reference note: The conversions reference note
     :param reference_frequency: The frequency of the reference note
+    :param keyboard_mapping: A ``pytuning.tuning_tables.KeyboardMapping``. If
+      given, it determines the degree assigned to the note, and the reference
+      note and frequency are taken from it.
     :returns: The frequency of the note in Hertz
     
     The default values for ``reference_note`` and
     ``reference_frequency`` correspond to standard
     orchestral tuning, a4 = 440 Hz.
+    
+    With a keyboard mapping the frequency is returned as a ``float``
+    (``nan`` if the note is not mapped). The frequencies of all the notes
+    are calculated on the first call for a scale, so subsequent calls are
+    simple lookups.
     '''
     if scale is None:
         scale = scale = [(sp.Integer(2)**sp.Rational(1,12))**index for index in range(13)]
+    if keyboard_mapping is not None:
+        return float(keyboard_mapping.frequencies(scale)[note])
     octave_offset = (note - reference_note) // (len(scale)-1)
     note_offset   = (note - reference_note) %  (len(scale)-1)
     base = scale[-1].evalf()
@@ -288,9 +321,65 @@ def ratio_to_name(ratio):
     
     :param ratio: The input scale degree (a ``sympy`` value)
     :returns: The degree name if found, ``None`` otherwise
+
+    The catalog is indexed on first use, so each lookup takes constant time.
     '''
-    entries = [x[0] for x in pytuning.constants.interval_catalog if x[1] == ratio]
-    if len(entries) == 0:
+    try:
+        ratio = sp.sympify(ratio)
+    except sp.SympifyError:
         return None
-    else:
-        return entries[0]
+    if not isinstance(ratio, sp.Basic):
+        return None
+    return pytuning.constants._interval_name(ratio)
+
+def _cents(ratio):
+    # Calculated in the same way as the catalog's index, so that exact matches have no deviation
+    ratio = sp.sympify(ratio)
+    if ratio.is_Rational:
+        return 1200.0 * (math.log2(ratio.p) - math.log2(ratio.q))
+    return 1200.0 * math.log2(float(ratio))
+
+def ratio_to_nearest_names(ratio, k=1, tolerance=None, ratio_limit=None):
+    '''
+    Find the named intervals nearest to a scale degree
+
+    :param ratio: The scale degree (a ``sympy`` value), or a list of degrees
+        (a scale, or the output of ``distinct_intervals()``, for example)
+    :param k: The maximum number of names to return for each degree
+    :param tolerance: If given, only intervals within this many cents of the degree
+        are returned
+    :param ratio_limit: If given, the catalog is extended with the ratios
+        ``p/q`` (in lowest terms) with ``q <= p <= ratio_limit``. These are named
+        by the ratio itself (for example, ``"11/8"``).
+    :returns: For a single degree, a list of up to ``k`` tuples (name, deviation),
+        nearest first, where deviation is the size of the degree less that of the named
+        interval, in cents. For a list of degrees, a list of these lists.
+
+    Unlike ``ratio_to_name()`` this will name tempered or mistuned
+    intervals:
+
+    .. code::
+
+        ratio_to_nearest_names(create_edo_scale(19)[6], k=3, tolerance=10)
+
+        [('Pythagorean Diminished Fourth', -5.412624655849129),
+         ('Just Major Third', -7.366345443782052)]
+
+    The catalog is sorted by size when first used, and the nearest entries are
+    found by binary search, with all the degrees in the list searched at once.
+    '''
+    single = not isinstance(ratio, (list, tuple, np.ndarray))
+    ratios = [ratio] if single else ratio
+    cents, names = pytuning.constants._cents_interval_index(ratio_limit)
+    values = np.array([_cents(x) for x in ratios], dtype=np.float64)
+    # The k nearest entries lie within k places either side of the insertion point
+    width = min(2 * k, len(cents))
+    start = np.clip(np.searchsorted(cents, values) - k, 0, len(cents) - width)
+    candidates = start[:, np.newaxis] + np.arange(width)
+    deviations = values[:, np.newaxis] - cents[candidates]
+    order = np.argsort(np.abs(deviations), axis=1, kind="stable")[:, :k]
+    output = []
+    for row, columns in enumerate(order):
+        output.append([(names[candidates[row, x]], float(deviations[row, x])) for x in columns
+                       if tolerance is None or abs(deviations[row, x]) <= tolerance])
+    return output[0] if single else output
@@ -1,4 +1,31 @@
-from pytuning.visualizations.syntonic import plot_syntonic_intervals, plot_syntonic_data
-from pytuning.visualizations.scales import consonance_matrix
+import importlib
 
-__all__ = ["plot_syntonic_intervals", "plot_syntonic_data", "consonance_matrix"]
\ No newline at end of file
+# The plotting functions are loaded from their submodules on first access, so
+# that importing the package doesn't load them (or the plotting libraries).
+
+_EXPORTS = {
+    "plot_syntonic_intervals": "syntonic",
+    "plot_syntonic_data": "syntonic",
+    "syntonic_sweep": "syntonic",
+    "count_clusters": "syntonic",
+    "consonance_matrix": "scales",
+    "consonance_data": "scales",
+    "batch_metric_denom": "scales",
+    "render_consonance_matrix": "scales",
+    "render_consonance_matrices": "scales",
+}
+
+__all__ = ["plot_syntonic_intervals", "plot_syntonic_data", "syntonic_sweep", "count_clusters",
+           "consonance_matrix", "consonance_data",
+           "batch_metric_denom", "render_consonance_matrix", "render_consonance_matrices"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module("pytuning.visualizations." + _EXPORTS[name])
+        return getattr(module, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
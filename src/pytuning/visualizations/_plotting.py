@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 21:24:06 2026
+
+@author: mark
+"""
+
+# The plotting dependencies (matplotlib and the optional seaborn) are large,
+# and most uses of the package never plot, so they are imported the first
+# time a plotting function asks for them rather than when the package is
+# imported.
+
+from __future__ import print_function, division
+
+import numpy as np
+
+my_palette = np.array([np.array([0.13333333, 0.13333333, 0.13333333, 1.]),
+                       np.array([0.31836986, 0.06640523, 0.31836986, 1.]),
+                       np.array([0.50196078, 0., 0.50196078, 1.])])
+
+# Set by pytuning.interactive, so that pyplot is set up for the IPython console
+# when it is loaded
+interactive = False
+
+_modules = {}
+
+
+def pyplot():
+    '''
+    Import (once) and return ``matplotlib.pyplot``
+    '''
+    if "pyplot" not in _modules:
+        try:
+            import matplotlib.pyplot as plt   # type: ignore
+        except ImportError:
+            raise ImportError("Matplotlib is required for plotting")
+        if interactive:
+            plt.ioff()
+            try:
+                from IPython import get_ipython   # type: ignore
+                get_ipython().run_line_magic('matplotlib', '')
+            except Exception:
+                pass
+        _modules["pyplot"] = plt
+    return _modules["pyplot"]
+
+
+def seaborn():
+    '''
+    Import (once) and return ``seaborn``, with its default style set, or
+    ``None`` if it is not available
+    '''
+    if "seaborn" not in _modules:
+        try:
+            import seaborn as sns   # type: ignore
+            sns.set()
+        except Exception:
+            sns = None
+        _modules["seaborn"] = sns
+    return _modules["seaborn"]
+
+
+class LazyModule(object):
+    '''
+    A stand-in for a plotting module, which imports it (with ``loader``) when
+    one of its attributes is first used. This lets names such as ``plt`` be
+    bound in a namespace without importing matplotlib.
+    '''
+    def __init__(self, name, loader):
+        self._name = name
+        self._loader = loader
+
+    def _module(self):
+        module = self._loader()
+        if module is None:
+            raise ImportError("%s is not available" % self._name)
+        return module
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self._module(), name)
+
+    def __dir__(self):
+        return dir(self._module())
+
+    def __repr__(self):
+        return "<lazily imported module %r>" % self._name
+
+
+def colormap(use_seaborn=True):
+    '''
+    The default colormap of the consonance matrix. If ``use_seaborn`` is
+    ``True`` and seaborn is available its purple palette is used.
+    '''
+    key = "colormap" if use_seaborn else "plain colormap"
+    if key not in _modules:
+        import matplotlib.colors   # type: ignore
+        sns = seaborn() if use_seaborn else None
+        palette = my_palette if sns is None else sns.dark_palette('purple', 10)
+        _modules[key] = matplotlib.colors.LinearSegmentedColormap.from_list("Default", palette)
+    return _modules[key]
@@ -6,30 +6,22 @@ Created on Sun May 31 10:57:14 2015
 """
 from __future__ import print_function, division
 
-import copy
+import multiprocessing
+import os
+
 import sympy as sp
 import numpy as np
 
 from pytuning.utilities import normalize_interval
 
-my_palette = np.array([np.array([0.13333333, 0.13333333, 0.13333333, 1.]),
-                       np.array([0.31836986, 0.06640523, 0.31836986, 1.]),
-                       np.array([0.50196078, 0., 0.50196078, 1.])])
-try:
-    import matplotlib.pyplot as plt   # type: ignore
-    import matplotlib                 # type: ignore
-    my_cmap = matplotlib.colors.LinearSegmentedColormap.from_list("Default", my_palette)
-except Exception:
-    print("Wanring: Matplotlib not found.Plotting will not be available")
+from pytuning.visualizations._plotting import pyplot, seaborn, colormap, my_palette  # noqa: F401
 
 
-try:
-    import seaborn as sns   # type: ignore
-    sns.set()
-    my_palette = sns.dark_palette('purple', 10)
-    my_cmap = matplotlib.colors.LinearSegmentedColormap.from_list("Default", my_palette)
-except Exception:
-    print("Warning: Seaborn not available.")
+def __getattr__(name):
+    # The default colormap is created on first use, as it needs matplotlib
+    if name == "my_cmap":
+        return colormap()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def metric_denom(degree):
@@ -49,6 +41,86 @@ def metric_denom(degree):
     return y
 
 
+def batch_metric_denom(numerators, denominators):
+    '''
+    Calculate ``metric_denom`` for many ratios at once
+
+    :param numerators: An array of the numerators of the ratios
+    :param denominators: An array of the denominators of the ratios
+    :returns: An array of the metric values
+
+    The ratios should be positive, and in lowest terms. The calculation is
+    done with integer operations on the arrays: the denominator of the
+    normalized ratio is the odd part of the denominator, multiplied by the
+    power of two that normalization divides into the numerator.
+    '''
+    numerators = np.asarray(numerators, dtype=object)
+    denominators = np.asarray(denominators, dtype=object)
+    odd_numerators = numerators // (numerators & -numerators)
+    odd_denominators = denominators // (denominators & -denominators)
+    bit_length = np.frompyfunc(int.bit_length, 1, 1)
+    shift = np.maximum(bit_length(odd_numerators) - bit_length(odd_denominators), 0)
+    too_far = ((odd_denominators << shift) > odd_numerators).astype(bool)
+    shift = np.where(too_far & (shift > 0), shift - 1, shift)
+    return odd_denominators << shift
+
+
+def _rational_parts(scale):
+    numerators = []
+    denominators = []
+    for degree in scale:
+        degree = sp.sympify(degree)
+        if not isinstance(degree, sp.Rational) or degree <= 0:
+            return None
+        numerators.append(int(degree.p))
+        denominators.append(int(degree.q))
+    return np.array(numerators, dtype=object), np.array(denominators, dtype=object)
+
+
+def consonance_data(scale, metric_function=None, batch_metric_function=None):
+    '''
+    Calculate the data of a consonance matrix
+
+    :param scale: The scale to analyze (list of frequency ratios)
+    :param metric_function: The metric function, applied to one ratio at a time
+        (see ``consonance_matrix()``)
+    :param batch_metric_function: A metric function applied to all the ratios
+        at once. It is passed two arrays, the numerators and denominators of
+        the ratios (in lowest terms), and should return an array of the metric
+        values. It can only be used with rational scales.
+    :returns: A NumPy array. Entry ``[i, j]`` is the metric of
+        ``scale[i] / scale[j]``.
+
+    Only one of the metric functions may be given. If neither is given the default metric (the denominator of
+    the normalized ratio) is used. For rational scales it is calculated with
+    ``batch_metric_denom()``, so the matrix is formed with array operations on
+    the numerators and denominators of the scale, and large scales (72 or 171
+    tones, for example) are practical.
+
+    This function does not need ``matplotlib``.
+    '''
+    if metric_function is not None and batch_metric_function is not None:
+        raise ValueError("Only one of metric_function and batch_metric_function can be given")
+    if metric_function is None:
+        parts = _rational_parts(scale)
+        if batch_metric_function is not None and parts is None:
+            raise ValueError("A batch metric can only be used with a rational scale")
+        if parts is not None:
+            numerators = np.multiply.outer(parts[0], parts[1])
+            denominators = np.multiply.outer(parts[1], parts[0])
+            divisors = np.gcd(numerators, denominators)
+            if batch_metric_function is None:
+                batch_metric_function = batch_metric_denom
+            return np.array(batch_metric_function(numerators // divisors, denominators // divisors),
+                            dtype=np.float64)
+        metric_function = metric_denom
+    data = np.zeros((len(scale), len(scale)))
+    for index1 in range(len(scale)):
+        for index2 in range(len(scale)):
+            data[index1][index2] = metric_function(scale[index1] / scale[index2])
+    return data
+
+
 def consonance_matrix(scale, metric_function=None, figsize=(10, 8),
                       title="Consonance Matrix", annot=True, cmap=None,
                       fig=None, vmin=None, vmax=None):
@@ -115,17 +187,13 @@ def consonance_matrix(scale, metric_function=None, figsize=(10, 8),
     use the same scale, so that visually the graphs are related. Otherwise each
     graph will have its own scale.
 
+    The data is calculated with ``consonance_data()``, which can be used
+    directly if the matrix is wanted without the plot.
     '''
+    plt = pyplot()
+    sns = seaborn()
     xticklabels = ["%s" % x for x in scale]
-    data = np.zeros((len(scale), len(scale)))
-    for index1 in range(len(scale)):
-        for index2 in range(len(scale)):
-            entry = scale[index1] / scale[index2]
-            if metric_function is not None:
-                entry_value = metric_function(entry)
-            else:
-                entry_value = metric_denom(entry)
-            data[index1][index2] = entry_value
+    data = consonance_data(scale, metric_function)
     if fig is None:
         fig = plt.figure(figsize=figsize)
         fig.add_subplot(1, 1, 1)
@@ -133,17 +201,14 @@ def consonance_matrix(scale, metric_function=None, figsize=(10, 8),
     plt.title(title)
 
     # reverse the y axis, as this is more intuitive
-    data = data.tolist()
-    data.reverse()
-    data = np.array(data)
-    yticklabels = copy.deepcopy(xticklabels)
-    yticklabels.reverse()
+    data = np.flipud(data)
+    yticklabels = xticklabels[::-1]
     if cmap is None:
-        cmap_to_use = my_cmap
+        cmap_to_use = colormap()
     else:
         cmap_to_use = cmap
     if vmin is None:
-        if "sns" in globals():
+        if sns is not None:
             sns.heatmap(
                 data, cmap=cmap_to_use, xticklabels=xticklabels,
                 yticklabels=yticklabels, annot=annot)
@@ -159,7 +224,7 @@ def consonance_matrix(scale, metric_function=None, figsize=(10, 8),
                              color="white",
                              )
     else:
-        if "sns" in globals():
+        if sns is not None:
             sns.heatmap(
                 data, cmap=cmap_to_use, xticklabels=xticklabels,
                 yticklabels=yticklabels, annot=annot, vmin=vmin, vmax=vmax)
@@ -178,6 +243,115 @@ def consonance_matrix(scale, metric_function=None, figsize=(10, 8),
     return fig
 
 
+def render_consonance_matrix(scale, file_name, metric_function=None, figsize=(10, 8),
+                             title="Consonance Matrix", annot=None, cmap=None, vmin=None,
+                             vmax=None, dpi=100, max_annotated=24):
+    '''
+    Render a consonance matrix directly to an image file
+
+    :param scale: The scale to analyze (list of frequency ratios)
+    :param file_name: The name of the file to write. The format is taken from
+        the extension (``.png`` and ``.svg``, for example).
+    :param metric_function: The metric function (see ``consonance_matrix()``)
+    :param figsize: Size of the figure (tuple, in inches)
+    :param title: the graph title
+    :param annot: If ``True``, write the value of the metric in each cell. If
+        ``None`` (the default) the values are written if the scale has no more than
+        ``max_annotated`` degrees.
+    :param cmap: A custom ``matplotlib`` colormap, if desired
+    :param vmin: If specified, the lowest value of the range to plot
+    :param vmax: If specified, the largest value of the range to plot
+    :param dpi: The resolution of raster images
+    :param max_annotated: The largest scale for which the cell values (and all the
+        tick labels) are drawn by default
+    :returns: The file name
+
+    Unlike ``consonance_matrix()`` this function doesn't use ``pyplot`` (or
+    ``seaborn``): the figure is created and drawn with ``matplotlib``'s
+    object-oriented interface and the Agg canvas, so no global state is touched,
+    no display is needed, and it is safe to call from worker processes.
+    For large scales the cell text is omitted and the tick labels are thinned,
+    as drawing them dominates the rendering time.
+    '''
+    from matplotlib.figure import Figure                              # type: ignore
+    from matplotlib.backends.backend_agg import FigureCanvasAgg      # type: ignore
+
+    data = np.flipud(consonance_data(scale, metric_function))
+    labels = ["%s" % x for x in scale]
+    size = len(labels)
+    if annot is None:
+        annot = size <= max_annotated
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot(1, 1, 1)
+    image = axes.imshow(data, cmap=colormap(use_seaborn=False) if cmap is None else cmap, vmin=vmin, vmax=vmax,
+                        interpolation="nearest", aspect="auto")
+    figure.colorbar(image, ax=axes)
+    axes.set_title(title)
+    step = 1 if size <= max_annotated else -(-size // max_annotated)
+    ticks = np.arange(0, size, step)
+    axes.set_xticks(ticks)
+    axes.set_xticklabels([labels[x] for x in ticks], rotation=90)
+    axes.set_yticks(ticks)
+    axes.set_yticklabels([labels[size - 1 - x] for x in ticks])
+    if annot:
+        for y in range(size):
+            for x in range(size):
+                axes.text(x, y, '%g' % data[y, x], horizontalalignment='center',
+                          verticalalignment='center', color="white")
+    figure.savefig(file_name, dpi=dpi)
+    return file_name
+
+
+def _render_consonance_job(job):
+    scale, file_name, options = job
+    return render_consonance_matrix(scale, file_name, **options)
+
+
+def render_consonance_matrices(scales, output_directory, names=None, file_format="png",
+                               processes=None, **options):
+    '''
+    Render the consonance matrices of many scales to image files
+
+    :param scales: A list of scales
+    :param output_directory: The directory to write the images to. It is created
+        if it doesn't exist.
+    :param names: A name for each scale, used for the file name and (unless a
+        ``title`` is given) the title. If ``None`` the scales are numbered.
+    :param file_format: The image format (the file extension), for example ``png``
+        or ``svg``
+    :param processes: The number of worker processes to use. If ``None`` (the
+        default) one process per CPU is used. If ``1`` the work is done in the
+        calling process.
+    :param options: Other arguments for ``render_consonance_matrix()``
+    :returns: A list of the file names written, in the order of the scales
+
+    When a process pool is used any ``metric_function`` or ``cmap`` must
+    be picklable (a module-level function rather than a ``lambda``, for example).
+
+    .. code::
+
+        render_consonance_matrices(scales, "images", names, file_format="svg")
+    '''
+    if names is None:
+        names = ["scale-%04d" % x for x in range(len(scales))]
+    if not os.path.isdir(output_directory):
+        os.makedirs(output_directory)
+    jobs = []
+    for scale, name in zip(scales, names):
+        job_options = dict(options)
+        job_options.setdefault("title", name)
+        jobs.append((list(scale), os.path.join(output_directory, "%s.%s" % (name, file_format)), job_options))
+    if processes == 1 or len(jobs) <= 1:
+        return [_render_consonance_job(x) for x in jobs]
+    pool = multiprocessing.Pool(processes)
+    try:
+        return pool.map(_render_consonance_job, jobs)
+    finally:
+        pool.close()
+        pool.join()
+
+
 if __name__ == '__main__':
     from IPython.display import display    # type: ignore
     from pytuning.scales import create_harmonic_scale
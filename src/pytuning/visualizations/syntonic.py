@@ -7,44 +7,62 @@ Created on Tue May 26 12:28:53 2015
 
 from __future__ import print_function, division
 
-try:
-    import matplotlib.pyplot as plt   # type: ignore
-except Exception:
-    print("Warning: Matplotlib not found.Plotting will not be available")
 import numpy as np
 
-from pytuning.scales.equal_interval import create_equal_interval_scale
-from pytuning.utilities import ratio_to_cents, cents_to_ratio
+from pytuning.visualizations._plotting import pyplot, seaborn
 
-try:
-    import seaborn as sns  # type: ignore
-    sns.set()
-except Exception:
-    print("Warning: Seaborn not available.")
 
-try:
-    from sklearn.cluster import MeanShift  # type: ignore
-except Exception:
-    print("WARNING: Scikit-learn not available.")
+def syntonic_sweep(generators, scale_length=13, number_down_intervals=6):
+    '''
+    Calculate the degrees of equal-interval scales for many generators
+
+    :param generators: The generating intervals, in cents (a list or NumPy array)
+    :param scale_length: The number of degrees in each scale
+    :param number_down_intervals: The number of inverted intervals used in
+        constructing the scales
+    :returns: A NumPy array of shape ``(len(generators), scale_length + 2)``.
+        Row ``i`` holds the degrees, in cents, of the scale generated by ``generators[i]``.
+
+    The rows are in the same (unsorted) order as
+    ``create_equal_interval_scale(cents_to_ratio(g), scale_length, number_down_intervals,
+    sort=False, remove_duplicates=False)``: the unison, the ascending chain of
+    generators, the descending chain, and the octave. The calculation is done in
+    cents, where normalizing to the octave is just arithmetic modulo 1200, so the
+    whole matrix is formed with a few array operations. Sweeps of hundreds of
+    thousands of generators are practical:
+
+    .. code::
+
+        data = syntonic_sweep(np.linspace(685, 720, 100000), 12)
+    '''
+    generators = np.asarray(generators, dtype=np.float64)
+    up_intervals = scale_length - number_down_intervals
+    multipliers = np.concatenate([np.arange(up_intervals), -np.arange(number_down_intervals + 1)])
+    degrees = np.mod(generators[:, np.newaxis] * multipliers[np.newaxis, :], 1200.0)
+    # As in create_equal_interval_scale(), a chained degree that lands on the
+    # unison is taken as the octave
+    chained = np.ones(len(multipliers), dtype=bool)
+    chained[[0, up_intervals]] = False
+    degrees[(degrees == 0.0) & chained & (generators[:, np.newaxis] != 0.0)] = 1200.0
+    return np.concatenate([degrees, np.full((len(generators), 1), 1200.0)], axis=1)
 
 
 def plot_syntonic_intervals(scale_length, min_g, max_g, number_g):
     generators = np.linspace(min_g, max_g, num=number_g)
-    ratio_generators = [cents_to_ratio(x) for x in generators]
 
     # Calculations
 
-    x = [create_equal_interval_scale(
-        x, scale_length, sort=False, remove_duplicates=False) for x in ratio_generators]
+    x = syntonic_sweep(generators, scale_length)
     # Graphics
 
+    plt = pyplot()
+    seaborn()
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(1, 1, 1)
     ax.grid(True)
 
     for index in range(scale_length + 1):
-        data = [ratio_to_cents(d[index]) for d in x]
-        plt.plot(generators, data)
+        plt.plot(generators, x[:, index])
     plt.xlabel("Generating Interval (Cents)")
     plt.ylabel("Degree Size (Cents)")
     plt.title("Relationship of Syntonic Tuning to Generator Size")
@@ -53,24 +71,93 @@ def plot_syntonic_intervals(scale_length, min_g, max_g, number_g):
     return fig
 
 
+def count_clusters(values, bandwidth, max_iter=300):
+    '''
+    Count the mean-shift clusters in one-dimensional data
+
+    :param values: The data. This may be a matrix, in which case each row is
+        clustered separately. ``NaN`` entries are ignored, so rows with different
+        numbers of values can be padded with ``NaN``.
+    :param bandwidth: The bandwidth of the (flat) kernel
+    :param max_iter: The maximum number of iterations for each seed
+    :returns: The number of clusters (an integer, or an array with one count per row)
+
+    This is the algorithm of scikit-learn's ``MeanShift(bandwidth=bandwidth)``
+    with its default settings, and gives the same counts. Every value is a seed,
+    and each seed is repeatedly moved to the mean of the values within
+    ``bandwidth`` of it until it moves by less than ``bandwidth / 1000``. The
+    converged centers are then taken in order of the number of values around them,
+    and any center within ``bandwidth`` of one already kept is discarded.
+
+    The seeds of all the rows are iterated together with array operations, so a
+    whole sweep is clustered at once and scikit-learn is not needed. The time per
+    iteration is quadratic in the length of a row, which is small for scales.
+    '''
+    values = np.asarray(values, dtype=np.float64)
+    rows = np.atleast_2d(values)
+    rows = rows.reshape(-1, rows.shape[-1])
+    centers = rows.copy()
+    intensities = np.zeros(rows.shape, dtype=np.int64)
+    active = ~np.isnan(rows)
+    stop_threshold = 1e-3 * bandwidth
+
+    for iteration in range(max_iter + 1):
+        row_index, seed_index = np.nonzero(active)
+        if len(row_index) == 0:
+            break
+        points = rows[row_index]
+        within = np.abs(points - centers[row_index, seed_index, np.newaxis]) <= bandwidth
+        counts = np.count_nonzero(within, axis=-1)
+        means = np.where(within, points, 0.0).sum(axis=-1) / counts
+        converged = np.abs(means - centers[row_index, seed_index]) <= stop_threshold
+        centers[row_index, seed_index] = means
+        intensities[row_index, seed_index] = counts
+        active[row_index[converged], seed_index[converged]] = False
+
+    # Seeds that converge to the same center are one candidate (with the
+    # intensity of the last of them, as in scikit-learn)
+    valid = ~np.isnan(centers)
+    same = centers[:, :, np.newaxis] == centers[:, np.newaxis, :]
+    later = np.triu(np.ones((rows.shape[1], rows.shape[1]), dtype=bool), 1)
+    valid &= ~np.any(same & later, axis=-1)
+
+    # Keep the centers in order of decreasing intensity (and then position),
+    # discarding those near a center already kept
+    order = np.lexsort((-np.where(valid, centers, 0.0), -np.where(valid, intensities, -1)), axis=-1)
+    centers = np.take_along_axis(centers, order, axis=-1)
+    unique = np.take_along_axis(valid, order, axis=-1)
+    for index in range(rows.shape[1]):
+        near = np.abs(centers - centers[:, index, np.newaxis]) <= bandwidth
+        near[:, index] = False
+        unique &= ~(near & unique[:, index, np.newaxis])
+    result = np.count_nonzero(unique, axis=-1).reshape(values.shape[:-1])
+    return int(result) if values.ndim < 2 else result
+
+
 def cluster_syntonic(generators, scale_length=13, bandwidth=0.005):
-    output = []
-    x = [create_equal_interval_scale(x, scale_length) for x in [cents_to_ratio(x) for x in generators]]
+    '''
+    Count the distinct degrees of equal-interval scales over a sweep of generators
+
+    :param generators: The generating intervals, in cents
+    :param scale_length: The number of degrees in each scale
+    :param bandwidth: The clustering bandwidth, in terms of frequency ratio
+    :returns: A tuple of the generators and an array of the number of clusters
+        of degrees in each scale (see ``count_clusters()``)
 
-    for index in range(len(x)):
-        data = x[index]
-        q = np.array(data)
-        q.shape = (len(q), 1)
-        ms = MeanShift(bandwidth=bandwidth)
-        ms.fit(q)
-        output = output + [len(ms.cluster_centers_)]
-    return generators, np.array(output)
+    The scales are calculated with ``syntonic_sweep()``. As in
+    ``create_equal_interval_scale()``, repeated degrees are only counted once.
+    '''
+    degrees = np.sort(2.0 ** (syntonic_sweep(generators, scale_length) / 1200.0), axis=1)
+    degrees[:, 1:][degrees[:, 1:] == degrees[:, :-1]] = np.nan
+    return generators, count_clusters(degrees, bandwidth)
 
 
 def plot_syntonic_data(generators, scale_length=13, bandwidth=0.005,
                        ylab="Number of Discrete Steps"):
     g, data = cluster_syntonic(generators, scale_length=scale_length,
                                bandwidth=bandwidth)
+    plt = pyplot()
+    seaborn()
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(1, 1, 1)
     ax.grid(True)
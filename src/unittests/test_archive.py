@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 19:47:33 2026
+
+@author: mark
+"""
+
+from __future__ import division, print_function
+
+import unittest, sys, os, tempfile, shutil
+from unittest import mock
+
+import numpy as np
+import sympy as sp
+
+from pytuning.archive import write_scale_archive, ScaleArchive
+from pytuning.tuning_tables import create_frequency_table
+from pytuning.scales import create_edo_scale, create_pythagorean_scale, create_harmonic_scale
+
+pythag = create_pythagorean_scale()
+edo    = create_edo_scale(12)
+big    = [sp.Integer(1), sp.Rational(3 ** 50, 2 ** 79), sp.Integer(2)]
+
+class TestArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.directory, "scales.pta")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        scales = [pythag, edo, big, create_harmonic_scale(8, 16)]
+        write_scale_archive(self.file_name, scales, ["Pythagorean", "12-EDO", "Big", "Harmonic"],
+                            reference_note=[60, 69, 60, 48], reference_frequency=[None, 440.0, 256.0, None])
+        with ScaleArchive(self.file_name) as archive:
+            self.assertEqual(len(archive), 4)
+            for index, scale in enumerate(scales):
+                self.assertListEqual(archive.scale(index), scale)
+            self.assertEqual(archive.name(1), "12-EDO")
+            self.assertEqual(archive.reference(2), (60, 256.0))
+            self.assertListEqual(list(archive.kinds(2)), [0, 1, 0])
+            p, q = archive.ratios(0)
+            self.assertEqual((p[2], q[2]), (9, 8))
+            del p, q
+            self.assertTrue(np.array_equal(archive.frequencies(3), create_frequency_table(scales[3], 48).frequencies))
+            self.assertTrue(np.array_equal(archive.frequencies(1), create_frequency_table(edo, 69, 440.0).frequencies))
+            self.assertEqual(archive.frequencies().shape, (4, 128))
+            self.assertTrue(np.allclose(archive.floats(1), [float(x) for x in edo]))
+            self.assertFalse(archive.floats(1).flags.writeable)
+
+    def test_numeric_degrees(self):
+        write_scale_archive(self.file_name, [edo], frequencies=False, symbolic=False)
+        with ScaleArchive(self.file_name) as archive:
+            self.assertEqual(archive.name(0), "")
+            self.assertRaises(ValueError, archive.frequencies, 0)
+            for restored, original in zip(archive.scale(0), edo):
+                self.assertLess(abs(restored - original), 1e-30)
+
+    def test_symbolic_degrees(self):
+        scale = [sp.Integer(1), 3 * sp.Integer(2) ** sp.Rational(1, 3) / 2, 3 * sp.sqrt(7) / 4, sp.pi / 2,
+                 sp.Integer(2)]
+        write_scale_archive(self.file_name, [scale])
+        with ScaleArchive(self.file_name) as archive:
+            restored = archive.scale(0)
+            self.assertListEqual(restored[:3] + restored[4:], scale[:3] + scale[4:])
+            # Only products of rational powers are stored symbolically
+            self.assertIsInstance(restored[3], sp.Float)
+            self.assertLess(abs(restored[3] - sp.pi / 2), 1e-30)
+            with mock.patch("pytuning.archive._MAX_EXPONENT", 0):
+                self.assertRaises(ValueError, archive.scale, 0)
+
+    def test_close(self):
+        write_scale_archive(self.file_name, [pythag])
+        archive = ScaleArchive(self.file_name)
+        frequencies = archive.frequencies(0)
+        self.assertRaises(BufferError, archive.close)
+        del frequencies
+        archive.close()
+
+    def test_invalid(self):
+        with open(self.file_name, "wb") as archive:
+            archive.write(b"\0" * 128)
+        self.assertRaises(ValueError, ScaleArchive, self.file_name)
+
+def suite():
+    archive_suite = unittest.TestLoader().loadTestsFromTestCase(TestArchive)
+    return archive_suite
+
+if __name__ == '__main__':
+    print("***************************")
+    print("Begining Archive Test Suite")
+    print("***************************")
+    archive_suite = suite()
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
+    return_value =  not runner.run(archive_suite).wasSuccessful()
+    sys.exit(return_value)
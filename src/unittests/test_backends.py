@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 22:58:19 2026
+
+@author: mark
+"""
+
+from __future__ import division, print_function
+
+import unittest, sys, threading, warnings
+from fractions import Fraction
+
+import sympy as sp
+
+from pytuning.backends import get_backend, set_backend, use_backend, available_backends
+from pytuning.metrics import all_metrics
+from pytuning.scale_creation import find_best_modes
+from pytuning.scales import create_harmonic_scale, create_pythagorean_scale, create_edo_scale, \
+    create_euler_fokker_scale, create_hexany, create_tonality_diamond
+from pytuning.utilities import normalize_interval, distinct_intervals
+
+class TestBackends(unittest.TestCase):
+
+    def test_selection(self):
+        self.assertEqual(get_backend().name, "sympy")
+        with use_backend("fraction"):
+            self.assertEqual(get_backend().name, "fraction")
+            self.assertIsInstance(create_harmonic_scale(3, 20)[1], Fraction)
+        self.assertEqual(get_backend().name, "sympy")
+        previous = set_backend("float")
+        try:
+            self.assertIsInstance(create_pythagorean_scale()[1], float)
+        finally:
+            set_backend(previous)
+        self.assertIsInstance(create_pythagorean_scale()[1], sp.Rational)
+        self.assertRaises(ValueError, get_backend, "decimal")
+        if "gmpy2" not in available_backends():
+            self.assertRaises(ValueError, get_backend, "gmpy2")
+
+    def test_threads(self):
+        # A backend chosen in one thread doesn't change the default in another
+        entered, done = threading.Event(), threading.Event()
+        names = []
+
+        def worker():
+            with use_backend("float"):
+                names.append(get_backend().name)
+                entered.set()
+                done.wait(5)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        try:
+            entered.wait(5)
+            self.assertEqual(get_backend().name, "sympy")
+            self.assertIsInstance(create_pythagorean_scale()[1], sp.Rational)
+        finally:
+            done.set()
+            thread.join()
+        self.assertListEqual(names, ["float"])
+
+    def test_scales(self):
+        pythag = create_pythagorean_scale()
+        for name in available_backends():
+            backend = get_backend(name)
+            for scale, expected in [(create_pythagorean_scale(backend=name), pythag),
+                                    (create_harmonic_scale(3, 20, backend=name), create_harmonic_scale(3, 20)),
+                                    (create_euler_fokker_scale([3, 5, 7], [1, 1, 1], backend=name),
+                                     create_euler_fokker_scale([3, 5, 7], [1, 1, 1])),
+                                    (create_hexany(backend=name), create_hexany()),
+                                    (create_tonality_diamond(7, backend=name), create_tonality_diamond(7))]:
+                if backend.exact:
+                    self.assertListEqual([Fraction(x) for x in scale], [Fraction(int(x.p), int(x.q)) for x in expected])
+                else:
+                    self.assertEqual(len(scale), len(expected))
+                    for degree, expected_degree in zip(scale, expected):
+                        self.assertAlmostEqual(degree, float(expected_degree))
+        edo = create_edo_scale(12, backend="fraction")
+        self.assertEqual(edo[0], Fraction(1))
+        self.assertEqual(edo[7], sp.Integer(2) ** sp.Rational(7, 12))
+        self.assertEqual(edo[-1], Fraction(2))
+        self.assertAlmostEqual(create_edo_scale(12, backend="float")[7], 2 ** (7 / 12))
+
+    def test_intervals(self):
+        self.assertEqual(normalize_interval(Fraction(1, 3), backend="fraction"), Fraction(4, 3))
+        self.assertEqual(normalize_interval(sp.Integer(8), backend="fraction"), Fraction(2))
+        self.assertEqual(normalize_interval(9, backend="float"), 1.125)
+        self.assertEqual(normalize_interval(sp.sqrt(7), backend="fraction"), sp.sqrt(7) / 2)
+        expected = sorted(Fraction(int(x.p), int(x.q)) for x in distinct_intervals(create_pythagorean_scale()))
+        self.assertListEqual(sorted(distinct_intervals(create_pythagorean_scale(), "fraction")), expected)
+        self.assertEqual(len(distinct_intervals(create_pythagorean_scale(), "float")), len(expected))
+
+    def test_metrics(self):
+        pythag = create_pythagorean_scale()
+        expected = all_metrics(pythag)
+        for name in available_backends():
+            metrics = all_metrics(pythag, backend=name)
+            for key in expected:
+                self.assertAlmostEqual(float(metrics[key]), float(expected[key]))
+        # The ratios of a tempered scale can't be recovered from floats
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            all_metrics(create_pythagorean_scale(), backend="float")
+            all_metrics(create_harmonic_scale(8, 16), backend="float")
+        with self.assertWarns(RuntimeWarning):
+            all_metrics(create_edo_scale(12), backend="float")
+
+    def test_modes(self):
+        pythag = create_pythagorean_scale()
+        expected = find_best_modes(pythag, 7)[0]
+        for name in available_backends():
+            mode = find_best_modes(pythag, 7, backend=name)[0]
+            self.assertEqual(mode["mask"], expected["mask"])
+            self.assertEqual(mode["sum_p_q_for_all_intervals"], expected["sum_p_q_for_all_intervals"])
+        self.assertIsInstance(find_best_modes(pythag, 7, backend="fraction")[0]["scale"][1], Fraction)
+        self.assertEqual(get_backend().name, "sympy")
+
+def suite():
+    backends_suite = unittest.TestLoader().loadTestsFromTestCase(TestBackends)
+    return backends_suite
+
+if __name__ == '__main__':
+    print("***************************")
+    print("Begining Backend Test Suite")
+    print("***************************")
+    backends_suite = suite()
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
+    return_value =  not runner.run(backends_suite).wasSuccessful()
+    sys.exit(return_value)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 18:31:40 2026
+
+@author: mark
+"""
+
+from __future__ import division, print_function
+
+import unittest, sys, os, io, json, tempfile, shutil, contextlib
+from unittest import mock
+
+import sympy as sp
+
+from pytuning.cli import read_scale_file, export_scales, main, FORMATS
+from pytuning.tuning_tables import create_scala_tuning, create_timidity_tuning, create_mts_bulk_dump
+from pytuning.scales import create_pythagorean_scale, create_edo_scale
+
+pythag = create_pythagorean_scale()
+ptolemy = [1, "9/8", "5/4", "4/3", "3/2", "5/3", "15/8", 2]
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.input_directory = os.path.join(self.directory, "scales")
+        self.output_directory = os.path.join(self.directory, "tables")
+        os.mkdir(self.input_directory)
+        with open(os.path.join(self.input_directory, "pythag.scl"), "w") as scl:
+            scl.write(create_scala_tuning(pythag, "Pythagorean"))
+        with open(os.path.join(self.input_directory, "ptolemy.json"), "w") as definition:
+            json.dump({"name": "Ptolemy", "scale": ptolemy}, definition)
+        with open(os.path.join(self.input_directory, "edo.json"), "w") as definition:
+            json.dump(["2**(%d/12)" % x for x in range(13)], definition)
+        with open(os.path.join(self.input_directory, "notes.txt"), "w") as notes:
+            notes.write("Not a scale")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_read_scale_file(self):
+        scale, name = read_scale_file(os.path.join(self.input_directory, "ptolemy.json"))
+        self.assertEqual(name, "Ptolemy")
+        self.assertListEqual(scale, [sp.Rational(x) for x in ptolemy])
+        scale, name = read_scale_file(os.path.join(self.input_directory, "edo.json"))
+        self.assertEqual(name, "edo")
+        self.assertListEqual(scale, create_edo_scale(12))
+        scale, name = read_scale_file(os.path.join(self.input_directory, "pythag.scl"))
+        self.assertEqual(name, "Pythagorean")
+        self.assertListEqual(scale, pythag)
+        file_name = os.path.join(self.input_directory, "degrees.json")
+        with open(file_name, "w") as definition:
+            json.dump([1, "1.2", "(3/2)**(1/2)", " 2 ** (7/12) ", 2], definition)
+        self.assertListEqual(read_scale_file(file_name)[0], [1, sp.Rational(6, 5), sp.sqrt(sp.Rational(3, 2)),
+                                                             2 ** sp.Rational(7, 12), 2])
+        # Degrees are not evaluated, so anything other than a (power of a) ratio is rejected
+        for degree in ["x", "__import__('os').getcwd()", "2**x", "1/0", "2**1000000", "0"]:
+            with open(file_name, "w") as definition:
+                json.dump([1, degree, 2], definition)
+            self.assertRaises(ValueError, read_scale_file, file_name)
+
+    def test_render_errors(self):
+        def fail(scale, name, options):
+            raise TypeError("Cannot render")
+        with mock.patch.dict(FORMATS, {"failing": (".failing", fail, False)}):
+            summary = export_scales(self.input_directory, self.output_directory, formats=["scala", "failing"],
+                                    processes=1, report=lambda line: None)
+        self.assertEqual(len(summary["errors"]), 3)
+        self.assertIn("failing: Cannot render", summary["errors"][0][1])
+
+    def test_export(self):
+        for processes in [1, 2]:
+            summary = export_scales(self.input_directory, self.output_directory, processes=processes, force=True)
+            self.assertEqual(summary["rendered"], 15)
+            self.assertEqual(summary["timings"]["mts"][0], 3)
+        with open(os.path.join(self.output_directory, "pythag.scl.timidity")) as table:
+            self.assertEqual(table.read(), create_timidity_tuning(pythag))
+        with open(os.path.join(self.output_directory, "ptolemy.json.syx"), "rb") as table:
+            self.assertEqual(table.read(), create_mts_bulk_dump([sp.Rational(x) for x in ptolemy], name="Ptolemy"))
+        # Nothing has changed, so nothing is rendered
+        summary = export_scales(self.input_directory, self.output_directory)
+        self.assertEqual((summary["rendered"], summary["skipped"]), (0, 15))
+        # A changed input, a changed output, and a changed setting
+        with open(os.path.join(self.input_directory, "edo.json"), "w") as definition:
+            json.dump(["2**(%d/5)" % x for x in range(6)], definition)
+        os.remove(os.path.join(self.output_directory, "pythag.scl.csound"))
+        summary = export_scales(self.input_directory, self.output_directory, processes=1)
+        self.assertEqual((summary["rendered"], summary["skipped"]), (6, 9))
+        summary = export_scales(self.input_directory, self.output_directory, formats=["scala", "mts"],
+                                reference_note=69, processes=1)
+        self.assertEqual((summary["rendered"], summary["skipped"]), (3, 3))
+
+    def test_output_names(self):
+        # Inputs with the same stem don't overwrite each other's outputs
+        with open(os.path.join(self.input_directory, "pythag.json"), "w") as definition:
+            json.dump([str(x) for x in pythag], definition)
+        summary = export_scales(self.input_directory, self.output_directory, formats=["scala"], processes=1)
+        self.assertEqual(summary["rendered"], 4)
+        self.assertEqual(len([x for x in os.listdir(self.output_directory) if x.endswith(".scl")]), 4)
+        with open(os.path.join(self.input_directory, "pythag.scl")) as scl:
+            source = scl.read()
+        self.assertRaises(ValueError, export_scales, self.input_directory, self.input_directory + os.sep, processes=1)
+        with open(os.path.join(self.input_directory, "pythag.scl")) as scl:
+            self.assertEqual(scl.read(), source)
+
+    def test_main(self):
+        with open(os.path.join(self.input_directory, "broken.json"), "w") as definition:
+            definition.write("{}")
+        with open(os.path.join(self.input_directory, "symbolic.json"), "w") as definition:
+            json.dump([1, "x", 2], definition)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            status = main([self.input_directory, self.output_directory, "-f", "scala,csound", "-j", "1"])
+        self.assertEqual(status, 1)
+        self.assertIn("6 rendered, 0 up to date, 2 errors", output.getvalue())
+        self.assertTrue(os.path.exists(os.path.join(self.output_directory, "edo.json.scl")))
+
+def suite():
+    cli_suite = unittest.TestLoader().loadTestsFromTestCase(TestCli)
+    return cli_suite
+
+if __name__ == '__main__':
+    print("***********************")
+    print("Begining CLI Test Suite")
+    print("***********************")
+    cli_suite = suite()
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
+    return_value =  not runner.run(cli_suite).wasSuccessful()
+    sys.exit(return_value)
@@ -11,13 +11,36 @@ Created on Thu Dec  1 09:45:13 2016
 
 from __future__ import division, print_function
 
-import unittest, sys
+import unittest, sys, os, subprocess
+from unittest import mock
+
+from pytuning.visualizations import _plotting
 
 class TestInteractive(unittest.TestCase):
     
     def test_file_load(self):
         from pytuning.interactive import harmonic_scale
-        
+
+    def test_plotting_names(self):
+        # plt and sns are bound without importing the plotting libraries, both by
+        # "import *" and when the script is run with %load
+        import pytuning.interactive
+        code = "import sys\n" \
+               "from pytuning.interactive import *\n" \
+               "print(plt, sns)\n" \
+               "exec(open(%r).read())\n" \
+               "print(plt, 'matplotlib' in sys.modules)" % pytuning.interactive.__file__
+        output = subprocess.check_output([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+        self.assertEqual(output.decode("utf-8").split(), ["<lazily", "imported", "module", "'matplotlib.pyplot'>",
+                                                          "<lazily", "imported", "module", "'seaborn'>",
+                                                          "<lazily", "imported", "module", "'matplotlib.pyplot'>",
+                                                          "False"])
+        pyplot = mock.Mock()
+        with mock.patch.dict(_plotting._modules, {"pyplot": pyplot, "seaborn": None}):
+            pytuning.interactive.plt.figure(figsize=(4, 4))
+            pyplot.figure.assert_called_once_with(figsize=(4, 4))
+            self.assertRaises(ImportError, getattr, pytuning.interactive.sns, "heatmap")
+
 def suite():
     interactive_suite = unittest.TestLoader().loadTestsFromTestCase(TestInteractive)
     return interactive_suite
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 17:18:52 2026
+
+@author: mark
+"""
+
+from __future__ import division, print_function
+
+import unittest, sys, os, struct, tempfile, shutil
+
+from pytuning.midi import read_midi_events, write_midi_file, retune_midi_events, retune_midi_file
+from pytuning.scales import create_edo_scale, create_pythagorean_scale
+
+pythag = create_pythagorean_scale()
+edo    = create_edo_scale(12)
+
+def track(data):
+    return b"MTrk" + struct.pack(">I", len(data)) + data
+
+# A format 1 file: a tempo track, and a track playing a C major triad
+# (using running status) and then a drum note.
+
+tempo_track = track(b"\x00\xff\x51\x03\x07\xa1\x20" + b"\x00\xff\x2f\x00")
+note_track = track(b"\x00\xc0\x05" + b"\x00\x90\x3c\x40" + b"\x00\x40\x40" + b"\x00\x43\x40" +
+                   b"\x83\x60\x3c\x00" + b"\x00\x40\x00" + b"\x00\x43\x00" +
+                   b"\x00\x99\x24\x64" + b"\x60\x89\x24\x00" + b"\x00\xff\x2f\x00")
+midi_file = b"MThd" + struct.pack(">IHHH", 6, 1, 2, 480) + tempo_track + note_track
+
+class TestMidi(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.directory, "input.mid")
+        with open(self.input_file, "wb") as midi:
+            midi.write(midi_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_read_write(self):
+        division, events = read_midi_events(self.input_file)
+        events = list(events)
+        self.assertEqual(division, 480)
+        self.assertEqual(events[0], (0, b"\xff\x51\x07\xa1\x20"))
+        self.assertEqual(events[2], (0, b"\x90\x3c\x40"))
+        self.assertEqual(events[5], (480, b"\x90\x3c\x00"))
+        self.assertEqual(events[-1], (576, b"\x89\x24\x00"))
+        output_file = os.path.join(self.directory, "output.mid")
+        write_midi_file(output_file, events, division)
+        division, written = read_midi_events(output_file)
+        self.assertEqual(list(written), events)
+
+    def test_retune(self):
+        division, events = read_midi_events(self.input_file)
+        events = list(retune_midi_events(events, pythag, reference_note=60))
+        setup = [e for t, e in events[:15 * 7]]
+        self.assertIn(b"\xb0\x65\x00", setup)
+        self.assertIn(b"\xb0\x06\x02", setup)
+        notes = [(t, e) for t, e in events[15 * 7:]]
+        # The root is unbent, the Pythagorean third is 7.82 cents sharp and
+        # the fifth 1.96 cents sharp, so each note is on its own channel
+        note_ons = [e for t, e in notes if e[0] & 0xF0 == 0x90 and e[2] > 0 and e[0] != 0x99]
+        self.assertEqual(len(set(e[0] for e in note_ons)), 3)
+        bends = dict((e[0] & 0x0F, e[1] | (e[2] << 7)) for t, e in events if e[0] & 0xF0 == 0xE0)
+        for note_on in note_ons:
+            self.assertIn(bends[note_on[0] & 0x0F], [8192, 8512, 8272])
+        self.assertEqual(len([e for t, e in notes if e[0] & 0xF0 == 0xC0]), 3)
+        self.assertIn((480, b"\x99\x24\x64"), notes)
+        note_offs = [e for t, e in notes if e[0] & 0xF0 in (0x80, 0x90) and e[2] == 0 and e[0] & 0x0F != 9]
+        self.assertListEqual(sorted(e[0] for e in note_offs), sorted(e[0] for e in note_ons))
+        # Equal temperament needs no bends, so only one channel is used
+        division, events = read_midi_events(self.input_file)
+        events = list(retune_midi_events(events, edo, channels=[0, 1]))
+        note_ons = [e for t, e in events if e[0] & 0xF0 == 0x90 and e[2] > 0 and e[0] != 0x99]
+        self.assertEqual(set(e[0] for e in note_ons), set([0x90]))
+
+    def test_stealing(self):
+        division, events = read_midi_events(self.input_file)
+        events = list(retune_midi_events(events, pythag, channels=[0, 1]))
+        note_ons = [e for t, e in events if e[0] & 0xF0 == 0x90 and e[2] > 0 and e[0] != 0x99]
+        self.assertEqual(len(note_ons), 3)
+        # The first note's channel is stolen for the third
+        self.assertIn((0, b"\x80\x3c\x00"), events)
+
+    def test_program_reset(self):
+        # Input channel 1 never sends a program change, so when it takes over the
+        # channel that played input channel 0's program it is reset to the default
+        events = [(0, b"\xc0\x05"), (0, b"\x90\x3c\x40"), (480, b"\x80\x3c\x00"),
+                  (480, b"\x91\x3c\x40"), (960, b"\x81\x3c\x00")]
+        output = list(retune_midi_events(events, edo, channels=[3]))
+        programs = [(t, e) for t, e in output if e[0] & 0xF0 == 0xC0]
+        self.assertListEqual(programs, [(0, b"\xc3\x05"), (480, b"\xc3\x00")])
+        self.assertLess(output.index((480, b"\xc3\x00")), output.index((480, b"\x93\x3c\x40")))
+        # A channel which has never had a program change already plays the default
+        output = list(retune_midi_events(events[3:], edo, channels=[3]))
+        self.assertEqual(len([e for t, e in output if e[0] & 0xF0 == 0xC0]), 0)
+
+    def test_retune_file(self):
+        output_file = os.path.join(self.directory, "output.mid")
+        retune_midi_file(self.input_file, output_file, pythag, reference_note=60)
+        division, events = read_midi_events(self.input_file)
+        expected = list(retune_midi_events(events, pythag, reference_note=60))
+        division, events = read_midi_events(output_file)
+        self.assertEqual(list(events), expected)
+
+def suite():
+    midi_suite = unittest.TestLoader().loadTestsFromTestCase(TestMidi)
+    return midi_suite
+
+if __name__ == '__main__':
+    print("************************")
+    print("Begining MIDI Test Suite")
+    print("************************")
+    midi_suite = suite()
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
+    return_value =  not runner.run(midi_suite).wasSuccessful()
+    sys.exit(return_value)
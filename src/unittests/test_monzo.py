@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:02:47 2026
+
+@author: mark
+"""
+
+from __future__ import division, print_function
+
+import unittest, sys
+
+import sympy as sp
+
+from pytuning.monzo import MonzoScale
+from pytuning.metrics import all_metrics
+from pytuning.number_theory import prime_factor_ratio
+from pytuning.utilities import distinct_intervals, normalize_interval
+from pytuning.scales import create_pythagorean_scale, create_euler_fokker_scale, \
+    create_harmonic_scale, create_edo_scale
+
+pythag_scale = create_pythagorean_scale()
+
+class TestMonzo(unittest.TestCase):
+
+    def test_round_trip(self):
+        for scale in [pythag_scale, create_euler_fokker_scale([3,5,7],[2,1,1]),
+                      create_harmonic_scale(4,30)]:
+            self.assertListEqual(scale, MonzoScale.from_scale(scale).to_scale())
+
+    def test_vectors(self):
+        r = sp.Rational(243,224)
+        monzos = MonzoScale([prime_factor_ratio(r, return_as_vector=True), (1,)])
+        self.assertListEqual(monzos.primes.tolist(), [2, 3, 5, 7])
+        self.assertListEqual(monzos.to_scale(), [r, sp.Integer(2)])
+
+    def test_irrational(self):
+        self.assertRaises(ValueError, MonzoScale.from_scale, create_edo_scale(12))
+
+    def test_normalize(self):
+        intervals = [sp.Rational(1,2), sp.Integer(8), sp.Rational(1,3), sp.Rational(27,4),
+                     sp.Integer(1), sp.Rational(2,3)]
+        monzos = MonzoScale.from_scale(intervals)
+        self.assertListEqual([normalize_interval(x) for x in intervals],
+                             monzos.normalize().to_scale())
+        self.assertListEqual([normalize_interval(x, 3) for x in intervals],
+                             monzos.normalize(3).to_scale())
+
+    def test_distinct_intervals(self):
+        monzos = MonzoScale.from_scale(pythag_scale)
+        self.assertListEqual(sorted(distinct_intervals(pythag_scale)),
+                             sorted(monzos.distinct_intervals().to_scale()))
+
+    def test_metrics(self):
+        for scale in [pythag_scale, create_harmonic_scale(4,30)]:
+            expected = all_metrics(scale)
+            metrics = MonzoScale.from_scale(scale).all_metrics()
+            self.assertAlmostEqual(expected.pop("metric_3"), metrics.pop("metric_3"))
+            self.assertDictEqual(expected, metrics)
+
+def suite():
+    monzo_suite = unittest.TestLoader().loadTestsFromTestCase(TestMonzo)
+    return monzo_suite
+
+if __name__ == '__main__':
+    print("*************************")
+    print("Begining Monzo Test Suite")
+    print("*************************")
+    monzo_suite = suite()
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
+    return_value =  not runner.run(monzo_suite).wasSuccessful()
+    sys.exit(return_value)
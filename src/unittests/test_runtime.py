@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 22:14:52 2026
+
+@author: mark
+"""
+
+from __future__ import division, print_function
+
+import unittest, sys, os, subprocess
+from fractions import Fraction
+
+import sympy as sp
+
+import pytuning.runtime as runtime
+from pytuning.scales import create_harmonic_scale, create_pythagorean_scale
+from pytuning.tuning_tables import create_timidity_tuning, create_em_tuning, create_fluidsynth_tuning, \
+    create_csound_tuning, create_scala_tuning
+from pytuning.utilities import ratio_to_cents, note_number_to_freq
+
+class TestRuntime(unittest.TestCase):
+
+    def test_no_sympy(self):
+        code = "import sys, pytuning.runtime; print('sympy' in sys.modules, 'numpy' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code],
+                                         env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+        self.assertEqual(output.decode("utf-8").split(), ["False", "False"])
+
+    def test_scales(self):
+        self.assertListEqual(runtime.create_harmonic_scale(3, 20),
+                             [Fraction(x.p, x.q) for x in create_harmonic_scale(3, 20)])
+        self.assertListEqual(runtime.create_harmonic_scale(3, 10, normalize=False),
+                             [Fraction(x.p, x.q) for x in create_harmonic_scale(3, 10, normalize=False)])
+        self.assertListEqual(runtime.create_equal_interval_scale(Fraction(3, 2)),
+                             [Fraction(x.p, x.q) for x in create_pythagorean_scale()])
+        edo = runtime.create_edo_scale(12)
+        self.assertEqual(len(edo), 13)
+        self.assertAlmostEqual(edo[7], 2 ** (7 / 12))
+        self.assertEqual(edo[-1], 2.0)
+
+    def test_conversions(self):
+        self.assertEqual(runtime.ratio_to_cents(2), 1200.0)
+        self.assertAlmostEqual(runtime.ratio_to_cents(Fraction(3, 2)), float(ratio_to_cents(sp.Rational(3, 2))))
+        self.assertAlmostEqual(runtime.cents_to_ratio(700.0), 2 ** (7 / 12))
+        self.assertAlmostEqual(runtime.note_number_to_freq(60), float(note_number_to_freq(60)))
+        scale = create_harmonic_scale(8, 16)
+        self.assertAlmostEqual(runtime.note_number_to_freq(40, runtime.create_harmonic_scale(8, 16), 60, 256.0),
+                               float(note_number_to_freq(40, scale, 60, 256.0)))
+
+    def test_tables(self):
+        # For the same floating point scale the tables are identical to those of pytuning.tuning_tables
+        for scale in [runtime.create_edo_scale(12), runtime.create_edo_scale(31),
+                      [float(x) for x in runtime.create_harmonic_scale(5, 40)]]:
+            for reference_note, reference_frequency in [(60, None), (69, 440.0), (62, 293.3)]:
+                self.assertEqual(runtime.create_timidity_tuning(scale, reference_note, reference_frequency),
+                                 create_timidity_tuning(scale, reference_note, reference_frequency))
+                self.assertEqual(runtime.create_em_tuning(scale, reference_note, reference_frequency),
+                                 create_em_tuning(scale, reference_note, reference_frequency))
+                self.assertEqual(runtime.create_csound_tuning(scale, reference_note, reference_frequency),
+                                 create_csound_tuning(scale, reference_note, reference_frequency))
+                self.assertEqual(runtime.create_fluidsynth_tuning(scale, reference_note, [0, 1], 0, [0, 3],
+                                                                  reference_frequency),
+                                 create_fluidsynth_tuning(scale, reference_note, [0, 1], 0, [0, 3],
+                                                          reference_frequency=reference_frequency))
+        self.assertEqual(runtime.create_scala_tuning(runtime.create_harmonic_scale(8, 16), "Harmonic"),
+                         create_scala_tuning(create_harmonic_scale(8, 16), "Harmonic"))
+
+def suite():
+    runtime_suite = unittest.TestLoader().loadTestsFromTestCase(TestRuntime)
+    return runtime_suite
+
+if __name__ == '__main__':
+    print("***************************")
+    print("Begining Runtime Test Suite")
+    print("***************************")
+    runtime_suite = suite()
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
+    return_value =  not runner.run(runtime_suite).wasSuccessful()
+    sys.exit(return_value)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:20:16 2026
+
+@author: mark
+"""
+
+from __future__ import division, print_function
+
+import unittest, sys, os, shutil, tempfile
+
+import sympy as sp
+
+from pytuning.scala import parse_scala_scale, read_scala_scale, parse_scala_keyboard_mapping, \
+    index_scala_archive, ScalaIndex
+from pytuning.tuning_tables import create_scala_tuning
+from pytuning.scales import create_pythagorean_scale, create_edo_scale
+from pytuning.utilities import ratio_to_cents
+
+pythag = create_pythagorean_scale()
+edo    = create_edo_scale(12)
+
+kbm = '''! A whole-tone mapping
+6
+0
+127
+60
+69
+440.0
+12
+! Mapping.
+0
+2
+x
+6
+8
+'''
+
+class TestScala(unittest.TestCase):
+
+    def test_round_trip(self):
+        scale, description = parse_scala_scale(create_scala_tuning(pythag, "Pythagorean"),
+                                               return_description=True)
+        self.assertListEqual(scale, pythag)
+        self.assertEqual(description, "Pythagorean")
+        scale = parse_scala_scale(create_scala_tuning(edo, "12-EDO"))
+        self.assertEqual(len(scale), len(edo))
+        for parsed, original in zip(scale, edo):
+            self.assertAlmostEqual(float(parsed), float(original), places=9)
+
+    def test_pitches(self):
+        scale = parse_scala_scale("!\n\n 3\n!\n 700.0 fifth\n5/4\n 2\n")
+        self.assertListEqual(scale, [1, 2 ** sp.Rational(7, 12), sp.Rational(5, 4), 2])
+        self.assertRaises(ValueError, parse_scala_scale, "Test\n3\n3/2\n2\n")
+        self.assertRaises(ValueError, parse_scala_scale, "Test\n1\n-3/2\n")
+        self.assertRaises(ValueError, parse_scala_scale, "Test\n1\nthree\n")
+
+    def test_keyboard_mapping(self):
+        mapping = parse_scala_keyboard_mapping(kbm)
+        self.assertEqual(mapping["size"], 6)
+        self.assertEqual(mapping["middle_note"], 60)
+        self.assertEqual(mapping["reference_frequency"], 440.0)
+        self.assertEqual(mapping["octave_degree"], 12)
+        self.assertListEqual(mapping["mapping"], [0, 2, None, 6, 8, None])
+
+    def test_index(self):
+        directory = tempfile.mkdtemp()
+        try:
+            os.mkdir(os.path.join(directory, "sub"))
+            for name, scale in [("pythag.scl", pythag), ("edo.scl", edo),
+                                (os.path.join("sub", "fifth.scl"), [1, sp.Rational(3, 2), sp.Integer(2)])]:
+                with open(os.path.join(directory, name), "w") as scl:
+                    scl.write(create_scala_tuning(scale, name))
+            with open(os.path.join(directory, "broken.scl"), "w") as scl:
+                scl.write("Broken\n")
+            index_file = os.path.join(directory, "index.npz")
+            for processes in [1, 2]:
+                self.assertEqual(index_scala_archive(directory, index_file, processes=processes), 3)
+                index = ScalaIndex(index_file)
+                self.assertEqual(len(index), 3)
+                self.assertListEqual(list(index.names), ["edo.scl", "pythag.scl", os.path.join("sub", "fifth.scl")])
+                self.assertListEqual(list(index.sizes), [12, 12, 2])
+                self.assertListEqual(list(index.prime_limits), [0, 3, 3])
+                self.assertListEqual(list(index.find(size=12)), [0, 1])
+                self.assertListEqual(list(index.find(prime_limit=3)), [1, 2])
+                for cents, degree in zip(index.cents(1), pythag[1:]):
+                    self.assertAlmostEqual(cents, float(ratio_to_cents(degree)))
+                self.assertListEqual(index.scale(1), pythag)
+                self.assertListEqual(read_scala_scale(os.path.join(directory, "pythag.scl")), pythag)
+        finally:
+            shutil.rmtree(directory)
+
+def suite():
+    scala_suite = unittest.TestLoader().loadTestsFromTestCase(TestScala)
+    return scala_suite
+
+if __name__ == '__main__':
+    print("*************************")
+    print("Begining Scala Test Suite")
+    print("*************************")
+    scala_suite = suite()
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
+    return_value =  not runner.run(scala_suite).wasSuccessful()
+    sys.exit(return_value)
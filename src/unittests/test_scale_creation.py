@@ -13,7 +13,8 @@ from functools import partial
 
 import sympy as sp
 
-from pytuning.scale_creation import find_best_modes, find_factors, create_scale_from_scale
+from pytuning.scale_creation import find_best_modes, find_factors, create_scale_from_scale, \
+    find_factors_many
 from pytuning.constants import five_limit_constructors
 from pytuning.scales import create_pythagorean_scale, create_diatonic_scale, \
     create_euler_fokker_scale
@@ -70,6 +71,15 @@ class TestScaleCreatio(unittest.TestCase):
         for factor in factors[1]:
             self.assertTrue( factor in ['1/T', 's'] )
         
+    def test_factoring_many(self):
+        intervals = [sp.Rational(16,15), sp.Rational(9,8), sp.Rational(10,9),
+                     sp.Rational(16,15) / sp.Rational(9,8)]
+        expected = [find_factors(x, five_limit_with_reciprocal) for x in intervals]
+        factors = list(find_factors_many(intervals, five_limit_with_reciprocal))
+        self.assertListEqual(expected, factors)
+        factors = list(find_factors_many(intervals, five_limit_with_reciprocal, processes=2))
+        self.assertListEqual(expected, factors)
+
     def test_create_scale_from_scale(self):
         # Use Ptolemy for the target scale
         scale = create_diatonic_scale(five_limit_constructors, ["T", "t", "s", "T", "t", "T", "s"])
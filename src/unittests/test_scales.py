@@ -13,9 +13,12 @@ import sympy as sp
 
 from pytuning.scales import create_harmonic_scale, create_edo_scale, \
     create_pythagorean_scale, create_equal_interval_scale, create_diatonic_scale, \
-    create_quarter_comma_meantone_scale, create_euler_fokker_scale
+    create_quarter_comma_meantone_scale, create_euler_fokker_scale, \
+    create_combination_product_set, create_hexany, create_dekany, create_eikosany, \
+    create_tonality_diamond, find_mos_sizes, create_mos_tree, create_mos_scale
     
 from pytuning.constants import five_limit_constructors
+from pytuning.utilities import normalize_interval
 
 from pytuning.scales.meantone import convert_p5_to_r, convert_r_to_p5 # Not tested elsewhere
 
@@ -113,6 +116,29 @@ class TestScales(unittest.TestCase):
                                             epsilon=1)
         self.assertListEqual(scale, [sp.Integer(1), sp.Integer(2)])
         
+    def test_equal_interval_long_chain(self):
+        # The incremental chain should agree with explicit powers
+        generator = sp.Rational(3,2) / sp.Rational(81,80) ** sp.Rational(1,4)
+        scale = create_equal_interval_scale(generator, scale_size=60,
+                                            number_down_intervals=20,
+                                            sort=False, remove_duplicates=False)
+        expected = [normalize_interval(generator ** index) for index in range(40)] + \
+                   [normalize_interval(generator ** -index) for index in range(21)] + \
+                   [sp.Integer(2)]
+        self.assertListEqual(scale, expected)
+
+        # An EDO fifth closes the circle onto the octave
+        scale = create_equal_interval_scale(sp.Integer(2) ** sp.Rational(7,12), 
+                                            number_down_intervals=0)
+        self.assertListEqual(scale, create_edo_scale(12))
+
+    def test_equal_interval_floating_point(self):
+        scale = create_equal_interval_scale(sp.Rational(3,2),12, floating_point=True)
+        self.assertEqual(len(scale), len(pythag_scale))
+        for degree, exact in zip(scale, pythag_scale):
+            self.assertIsInstance(degree, float)
+            self.assertAlmostEqual(degree, float(exact))
+
     def test_diatonic_scale(self):
         scale = create_diatonic_scale(five_limit_constructors, ["T", "t", "s", "T", "t", "T", "s"])
         self.assertListEqual(scale, ptolemy)
@@ -163,7 +189,68 @@ class TestScales(unittest.TestCase):
         
         scale = create_euler_fokker_scale([3,5],[0,0])
         self.assertListEqual(scale, [sp.Integer(1),sp.Integer(2)])
+
+    def test_euler_fokker_multiplicities(self):
+        # Repeated factors and multiplicities describe the same genus
+        scale1 = create_euler_fokker_scale([3,5,7],[2,2,1])
+        scale2 = create_euler_fokker_scale([3,3,5,5,7],[1,1,1,1,1])
+        self.assertListEqual(scale1, scale2)
+        self.assertEqual(len(scale1), 3 * 3 * 2 + 1)
+
+        scale = create_euler_fokker_scale([3,5],[1,1], octave=sp.Integer(2))
+        self.assertListEqual(scale, create_euler_fokker_scale([3,5],[1,1]))
         
+    def test_combination_product_set(self):
+        hexany = [sp.Integer(1), sp.Rational(7,6), sp.Rational(5,4), sp.Rational(35,24),
+                  sp.Rational(5,3), sp.Rational(7,4), sp.Integer(2)]
+        self.assertListEqual(create_combination_product_set([1,3,5,7], 2), hexany)
+        self.assertListEqual(create_hexany([1,3,5,7]), hexany)
+        self.assertListEqual(create_hexany([1,3,5,7], normalize=False),
+                             [sp.Integer(1), sp.Rational(5,3), sp.Integer(2), sp.Rational(7,3),
+                              sp.Integer(5), sp.Integer(7), sp.Rational(35,3)])
+        # Ten and twenty degrees, plus the octave
+        self.assertEqual(len(create_dekany()), 11)
+        self.assertEqual(len(create_dekany(k=3)), 11)
+        self.assertEqual(len(create_eikosany()), 21)
+        self.assertRaises(ValueError, create_hexany, [1,3,5])
+        self.assertRaises(ValueError, create_combination_product_set, [1,3,5,7], 0)
+        self.assertRaises(ValueError, create_combination_product_set, [1,3,5,7], 5)
+        self.assertListEqual(create_combination_product_set([1,3,5,7], 4), [sp.Integer(1), sp.Integer(2)])
+
+    def test_tonality_diamond(self):
+        scale = create_tonality_diamond(5)
+        self.assertListEqual(scale, [sp.Integer(1), sp.Rational(6,5), sp.Rational(5,4),
+                                     sp.Rational(4,3), sp.Rational(3,2), sp.Rational(8,5),
+                                     sp.Rational(5,3), sp.Integer(2)])
+        # Partch's 11-limit diamond has 29 degrees
+        self.assertEqual(len(create_tonality_diamond(11)), 30)
+
+    def test_mos(self):
+        sizes = find_mos_sizes(sp.Rational(3,2), max_size=60)
+        self.assertListEqual([x.size for x in sizes], [2, 3, 5, 7, 12, 17, 29, 41, 53])
+        self.assertEqual((sizes[3].large, sizes[3].small), (5, 2))
+        # A 12-EDO fifth closes the chain at 12
+        self.assertListEqual([x.size for x in find_mos_sizes(2 ** sp.Rational(7,12))], [2, 3, 5, 7])
+        # Check the step counts against the scales themselves
+        for pattern in sizes[:6]:
+            scale = create_mos_scale(sp.Rational(3,2), pattern.size)
+            steps = [y / x for x, y in zip(scale[:-1], scale[1:])]
+            self.assertListEqual(sorted(steps.count(x) for x in set(steps)),
+                                 sorted([pattern.large, pattern.small]))
+        self.assertRaises(ValueError, create_mos_scale, sp.Rational(3,2), 6)
+        self.assertRaises(ValueError, find_mos_sizes, sp.Rational(5,2))
+
+    def test_mos_tree(self):
+        tree = create_mos_tree(2 ** sp.Rational(4,7), 2 ** sp.Rational(3,5), max_size=12)
+        self.assertListEqual([(x.size, x.boundary) for x in tree],
+                             [(2, sp.Rational(1,2)), (3, sp.Rational(2,3)), (5, sp.Rational(3,5)),
+                              (7, sp.Rational(4,7)), (12, sp.Rational(7,12))])
+        self.assertEqual(tree[3].above, (7, 5, 2))
+        self.assertEqual(tree[3].below, (7, 2, 5))
+        tree = create_mos_tree(sp.Rational(10,9), sp.Rational(16,9), max_size=30)
+        self.assertEqual(len(set((x.lower, x.upper) for x in tree)), len(tree))
+        self.assertRaises(ValueError, create_mos_tree, sp.Rational(3,2), sp.Rational(4,3))
+
 def suite():
     scale_suite = unittest.TestLoader().loadTestsFromTestCase(TestScales)
 
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:02:44 2026
+
+@author: mark
+"""
+
+from __future__ import division, print_function
+
+import unittest, sys, os, asyncio, socket, tempfile, shutil
+
+from pytuning.server import RetuningServer, encode_osc_message, decode_osc_message
+from pytuning.tuning_tables import create_frequency_table, create_scala_tuning
+from pytuning.scales import create_edo_scale, create_pythagorean_scale
+
+pythag = create_pythagorean_scale()
+edo    = create_edo_scale(12)
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.scale_directory = os.path.join(self.directory, "scales")
+        os.mkdir(self.scale_directory)
+        with open(os.path.join(self.scale_directory, "pythag.scl"), "w") as scl:
+            scl.write(create_scala_tuning(pythag, "Pythagorean"))
+        self.server = RetuningServer(scale_directory=self.scale_directory)
+        self.server.load_scale("pythag", pythag)
+        self.server.load_scale("edo", edo, reference_note=69, reference_frequency=440.0)
+
+    def test_text_requests(self):
+        table = create_frequency_table(pythag)
+        self.assertEqual(self.server.handle(b"freq 64"), ("ok 64 %r" % float(table[64])).encode())
+        self.assertEqual(self.server.handle(b"freq 69 edo"), b"ok 69 440.0")
+        # The Pythagorean major third is 7.82 cents sharp: 8192 + 8192 * 7.82 / 200
+        self.assertEqual(self.server.handle(b"bend 64"), b"ok 64 64 8512")
+        self.assertEqual(self.server.handle(b"list"), b"ok pythag edo")
+        self.assertEqual(self.server.handle(b"use edo"), b"ok edo")
+        self.assertEqual(self.server.handle(b"bend 64"), b"ok 64 64 8192")
+        self.assertTrue(self.server.handle(b"freq 128").startswith(b"error"))
+        self.assertTrue(self.server.handle(b"freq 60 nothing").startswith(b"error"))
+        self.assertTrue(self.server.handle(b"tune").startswith(b"error"))
+
+    def test_osc_requests(self):
+        self.assertEqual(decode_osc_message(encode_osc_message("/a/b", 1, 2.5, "abcd")),
+                         ("/a/b", [1, 2.5, "abcd"]))
+        address, arguments = decode_osc_message(self.server.handle(encode_osc_message("/pytuning/freq", 69, "edo")))
+        self.assertEqual(address, "/pytuning/freq")
+        self.assertEqual(arguments, [69, 440.0])
+        address, arguments = decode_osc_message(self.server.handle(encode_osc_message("/pytuning/use", "missing")))
+        self.assertEqual(address, "/pytuning/error")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_load(self):
+        secret = os.path.join(self.directory, "secret.scl")
+        with open(secret, "w") as scl:
+            scl.write("Secret\nnot a number\n")
+        os.symlink(secret, os.path.join(self.scale_directory, "link.scl"))
+        self.assertEqual(asyncio.run(self.server.handle_load(b"load scala pythag.scl")), b"ok scala")
+        # Files outside the scale directory are refused, and the reply doesn't depend
+        # on whether the file exists or what it contains
+        for file_name in [secret, "../secret.scl", "link.scl", "missing.scl", "../missing.scl"]:
+            reply = asyncio.run(self.server.handle_load(("load other %s" % file_name).encode()))
+            self.assertEqual(reply, ("error Cannot load scale: %s" % file_name).encode())
+        self.assertNotIn("other", self.server.tables)
+        self.assertTrue(self.server._is_load_request(b"load scala pythag.scl"))
+        self.assertTrue(self.server._is_load_request(encode_osc_message("/pytuning/load", "scala", "pythag.scl")))
+        self.assertTrue(self.server._is_load_request(b"load"))
+        for request in [b"loadxyz scala pythag.scl", encode_osc_message("/pytuning/loader", "x")]:
+            self.assertFalse(self.server._is_load_request(request))
+        self.assertTrue(self.server.handle(b"loadxyz scala").startswith(b"error"))
+        reply = asyncio.run(RetuningServer().handle_load(b"load scala pythag.scl"))
+        self.assertEqual(reply, b"error Loading scales is not enabled")
+
+    def test_udp(self):
+        async def exchange():
+            transport = await self.server.serve_udp("127.0.0.1", 0)
+            client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            client.setblocking(False)
+            loop = asyncio.get_running_loop()
+            replies = []
+            try:
+                for request in [b"freq 69 edo", b"load scala pythag.scl 69 440", b"freq 69 scala"]:
+                    client.sendto(request, transport.get_extra_info("sockname"))
+                    replies.append(await asyncio.wait_for(loop.sock_recv(client, 1024), 5))
+            finally:
+                client.close()
+                transport.close()
+            return replies
+
+        self.assertEqual(asyncio.run(exchange()), [b"ok 69 440.0", b"ok scala", b"ok 69 440.0"])
+        self.assertEqual(self.server.active, "pythag")
+        self.assertIn("scala", self.server.tables)
+
+def suite():
+    server_suite = unittest.TestLoader().loadTestsFromTestCase(TestServer)
+    return server_suite
+
+if __name__ == '__main__':
+    print("**************************")
+    print("Begining Server Test Suite")
+    print("**************************")
+    server_suite = suite()
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
+    return_value =  not runner.run(server_suite).wasSuccessful()
+    sys.exit(return_value)
@@ -12,10 +12,19 @@ Created on Wed Nov 30 16:18:36 2016
 
 from __future__ import division, print_function
 
-import unittest, sys
+import unittest, sys, io, hashlib
+import numpy as np
+import sympy as sp
 from pytuning.tuning_tables import create_scala_tuning, create_csound_tuning, create_em_tuning, \
-    create_fluidsynth_tuning, create_timidity_tuning
+    create_fluidsynth_tuning, create_timidity_tuning, create_frequency_table, \
+    stream_scala_tuning, stream_csound_tuning, stream_em_tuning, stream_fluidsynth_tuning, \
+    stream_timidity_tuning, write_tuning_table, encode_mts_frequencies, create_mts_bulk_dump, \
+    create_mts_bulk_dumps, stream_mts_single_note_changes, create_mts_scale_octave_tuning, \
+    KeyboardMapping, create_frequency_matrix, create_frequency_tables, stream_tuning_table_sweep
+from pytuning.scala import parse_scala_keyboard_mapping
+from pytuning.utilities import note_number_to_freq
 from pytuning.scales import create_edo_scale, create_pythagorean_scale
+from pytuning import runtime
 
 # For each table we'll check a rational and irrational scale, as they are
 # handeled differently for some tuning tables.
@@ -53,6 +62,176 @@ class TestTables(unittest.TestCase):
         create_timidity_tuning(pythag, reference_note=69)
         create_timidity_tuning(edo, reference_note=69)
     
+    def test_frequency_table(self):
+        for scale in [pythag, edo]:
+            for reference_note, reference_frequency in [(60, None), (69, 415.0)]:
+                table = create_frequency_table(scale, reference_note, reference_frequency)
+                self.assertEqual(len(table), 128)
+                for note in [0, 21, 60, 69, 127]:
+                    expected = note_number_to_freq(note, scale, reference_note,
+                                                   reference_frequency if reference_frequency else
+                                                   note_number_to_freq(reference_note))
+                    self.assertAlmostEqual(float(expected), table[note], places=7)
+        # Tables are cached on their inputs
+        self.assertIs(create_frequency_table(edo, 69, 440.0), create_frequency_table(edo, 69, 440))
+        self.assertAlmostEqual(create_frequency_table(edo, 69).cents()[69], 6900.0)
+
+    def test_timidity_values(self):
+        table = create_timidity_tuning(edo, reference_note=69).splitlines()
+        self.assertEqual(table[3 + 69], "440000")
+        self.assertEqual(table[3 + 60], "261626")
+
+    def test_timidity_large_period(self):
+        # A large period with few steps gives entries that don't fit in 64 bits
+        scale = [sp.Integer(1), sp.Rational(5, 3), sp.Integer(3)]
+        table = create_timidity_tuning(scale).splitlines()
+        expected = create_frequency_table(scale).frequencies[127] * 1000.0
+        self.assertEqual(int(table[-1]), round(expected))
+        self.assertGreater(int(table[-1]), 2 ** 63)
+        self.assertEqual("\n".join(table), runtime.create_timidity_tuning([1.0, 5 / 3, 3.0]))
+        with np.errstate(over="ignore"):
+            self.assertRaises(ValueError, create_timidity_tuning, [sp.Integer(1), sp.Integer(10) ** 20])
+
+    def test_streamed_tables(self):
+        # The output of the streaming writers must be that of the original
+        # (non-streaming) implementation. The full Scala table is checked as text,
+        # and the others against the SHA-256 digests of the original output.
+        expected_scala = "! Scale produced by pytuning. For tuning yoshimi or zynaddsubfx,\n" \
+                         "! only include the portion below the final '!'\n!\nScale\n 12\n!\n" \
+                         "256/243\n9/8\n32/27\n81/64\n4/3\n1024/729\n3/2\n128/81\n27/16\n16/9\n243/128\n2"
+        self.assertEqual("".join(stream_scala_tuning(pythag, "Scale")), expected_scala)
+        expected = {
+            "pythag": ["e40b0af4703cf92c18018654c5348386cc6fa2c383badbc2310e0239f7679086",
+                       "711d1f73cd70fc3f1aeffbfef640675d7b98034301844fdbba217bf9749674eb",
+                       "bd420906f3f1b39104968ea838c47f66efef9045d7b9ef832a6f804a79615695",
+                       "450069e912d364027b7d3971eaab195718344df4843677926645bd9f94203054",
+                       "ac23146bea51fca067eac910e7f4009f6e5e92f9a8e291722c80f08f04a3a0ba"],
+            "edo":    ["d06ec0adb7bf7a0aa709e7ec8b223f241cc7b10279c3729519a74cb6f39f86a9",
+                       "7fa1e4e6d48e7836da41b9c93991afb39b09a2239bc3e78c33936b3aa44091c1",
+                       "a721cb928fa63fe204d93bc9e94a784c0ac91323bf92bcba0c9a100be68ce678",
+                       "0d6e338f2da0f5fbfe2b8d943ee6698f78227cdde7baa521098d87bf999f9593",
+                       "1a815b77a786b195e1b38ae362af767cde682da2ec4a421614fc03b3412c4557"],
+        }
+        for name, scale in [("pythag", pythag), ("edo", edo)]:
+            streams = [stream_scala_tuning(scale, "Scale"), stream_csound_tuning(scale, reference_note=69),
+                       stream_em_tuning(scale), stream_timidity_tuning(scale),
+                       stream_fluidsynth_tuning(scale, chan=[0, 1], prog=[0, 5])]
+            tables = [create_scala_tuning(scale, "Scale"), create_csound_tuning(scale, reference_note=69),
+                      create_em_tuning(scale), create_timidity_tuning(scale),
+                      create_fluidsynth_tuning(scale, chan=[0, 1], prog=[0, 5])]
+            for stream, table, digest in zip(streams, tables, expected[name]):
+                self.assertEqual(hashlib.sha256("".join(stream).encode("utf-8")).hexdigest(), digest)
+                self.assertEqual(hashlib.sha256(table.encode("utf-8")).hexdigest(), digest)
+
+    def test_write_tuning_table(self):
+        expected = create_fluidsynth_tuning(edo, chan=range(4), prog=range(16))
+        text_file = io.StringIO()
+        write_tuning_table(text_file, stream_fluidsynth_tuning(edo, chan=range(4), prog=range(16)))
+        self.assertEqual(text_file.getvalue(), expected)
+        binary_file = io.BytesIO()
+        write_tuning_table(binary_file, expected)
+        self.assertEqual(binary_file.getvalue().decode("utf-8"), expected)
+
+    def test_mts_encoding(self):
+        encoded = encode_mts_frequencies([440.0, 440.0 * 2 ** (0.5 / 12), 1.0, 20000.0, float("nan")])
+        self.assertEqual(encoded.tolist(), [[69, 0, 0], [69, 64, 0], [0, 0, 0],
+                                            [127, 127, 126], [127, 127, 127]])
+
+    def test_mts_bulk_dump(self):
+        dump = create_mts_bulk_dump(edo, program=3, name="12-EDO")
+        self.assertEqual(len(dump), 408)
+        self.assertEqual(dump[:6], bytes([0xF0, 0x7E, 0x7F, 0x08, 0x01, 3]))
+        self.assertEqual(dump[6:22], b"12-EDO          ")
+        self.assertEqual(dump[-1], 0xF7)
+        checksum = 0
+        for byte in dump[1:-2]:
+            checksum = checksum ^ byte
+        self.assertEqual(dump[-2], checksum & 0x7F)
+        for note in range(128):
+            self.assertEqual(dump[22 + 3 * note:25 + 3 * note], bytes([note, 0, 0]))
+        dumps = create_mts_bulk_dumps([edo, pythag], programs=[3, 4], names=["12-EDO", "Pythagorean"])
+        self.assertEqual(dumps[0], dump)
+        self.assertEqual(dumps[1], create_mts_bulk_dump(pythag, program=4, name="Pythagorean"))
+        binary_file = io.BytesIO()
+        write_tuning_table(binary_file, dumps)
+        self.assertEqual(binary_file.getvalue(), b"".join(dumps))
+
+    def test_mts_real_time_messages(self):
+        messages = list(stream_mts_single_note_changes(edo, program=1))
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[0][:7], bytes([0xF0, 0x7F, 0x7F, 0x08, 0x02, 1, 64]))
+        self.assertEqual(messages[1][7:11], bytes([64, 64, 0, 0]))
+        self.assertEqual(len(messages[1]), 7 + 64 * 4 + 1)
+        octave = create_mts_scale_octave_tuning(pythag, channels=[0, 8, 15])
+        self.assertEqual(octave[:8], bytes([0xF0, 0x7E, 0x7F, 0x08, 0x08, 0x02, 0x02, 0x01]))
+        # The Pythagorean major third is 7.82 cents sharp
+        self.assertEqual(octave[8 + 4], 64 + 8)
+        octave = create_mts_scale_octave_tuning(edo, two_byte=True)
+        self.assertEqual(octave[8:-1], bytes([0x40, 0x00] * 12))
+
+    def test_keyboard_mapping(self):
+        # A linear mapping is the same as the default assignment of notes
+        linear = KeyboardMapping(middle_note=60, reference_frequency=261.0)
+        self.assertTrue(np.allclose(create_frequency_table(pythag, keyboard_mapping=linear).frequencies,
+                                    create_frequency_table(pythag, 60, 261.0).frequencies))
+        self.assertEqual(note_number_to_freq(67, pythag, keyboard_mapping=linear), 261.0 * 1.5)
+        # A diatonic scale on the white keys, with A4 at 440 Hz
+        diatonic = [1, 9/8, 5/4, 4/3, 3/2, 5/3, 15/8, 2]
+        white = KeyboardMapping([0, None, 1, None, 2, 3, None, 4, None, 5, None, 6],
+                                middle_note=60, reference_note=69, reference_frequency=440.0,
+                                octave_degree=7, first_note=21, last_note=108)
+        table = create_frequency_table(diatonic, keyboard_mapping=white)
+        self.assertEqual(table.reference_note, 69)
+        self.assertAlmostEqual(table[69], 440.0)
+        self.assertAlmostEqual(table[60], 264.0)
+        self.assertAlmostEqual(table[72], 528.0)
+        self.assertAlmostEqual(table[59], 264.0 * 15 / 16)
+        for note in [61, 20, 109]:
+            self.assertTrue(np.isnan(table[note]))
+        self.assertTrue(np.isnan(note_number_to_freq(61, diatonic, keyboard_mapping=white)))
+        # The mapping may be shorter than the scale
+        mapping = KeyboardMapping([0, 2], octave_degree=4)
+        self.assertAlmostEqual(note_number_to_freq(63, edo, keyboard_mapping=mapping) /
+                               note_number_to_freq(60, edo, keyboard_mapping=mapping), 2 ** (6 / 12))
+        self.assertRaises(ValueError, KeyboardMapping([0, None], reference_note=61).frequencies, edo)
+        # Each repetition is transposed by the ratio of the octave degree, rather than
+        # stepping that many degrees up the scale: with the diatonic scale and a 5-key
+        # pattern repeating at the fifth, the key above the sixth degree is a fifth
+        # above 9/8, not the sixth degree of the scale
+        fifths = KeyboardMapping([0, 1, 2, 3, 4], middle_note=60, octave_degree=4)
+        table = create_frequency_table(diatonic, keyboard_mapping=fifths)
+        self.assertAlmostEqual(table[66] / table[60], 27 / 16)
+        self.assertAlmostEqual(table[70] / table[60], 9 / 4)
+        self.assertAlmostEqual(table[55] / table[60], 2 / 3)
+        self.assertAlmostEqual(table[56] / table[60], 3 / 4)
+        # Mapped degrees beyond the scale continue into the next octave
+        wide = KeyboardMapping([0, 9], middle_note=60, octave_degree=7)
+        table = create_frequency_table(diatonic, keyboard_mapping=wide)
+        self.assertAlmostEqual(table[61] / table[60], 5 / 2)
+        kbm = parse_scala_keyboard_mapping("12\n21\n108\n60\n69\n440.0\n7\n0\nx\n1\nx\n2\n3\nx\n4\nx\n5\nx\n6\n")
+        self.assertEqual(KeyboardMapping.from_scala(kbm), white)
+
+    def test_frequency_sweep(self):
+        notes = [60, 62, 69]
+        pitches = [415.0, 432.0, 440.0, 466.0]
+        matrix = create_frequency_matrix(pythag, notes, pitches)
+        self.assertEqual(matrix.shape, (3, 4, 128))
+        self.assertTrue(np.array_equal(matrix[2, 2], create_frequency_table(pythag, 69).frequencies))
+        self.assertEqual(matrix[2, 0, 69], 415.0)
+        tables = create_frequency_tables(edo, notes, pitches)
+        self.assertEqual(len(tables), 12)
+        self.assertEqual((tables[5].reference_note, tables[5].reference_frequency), (62, matrix[1, 1, 62]))
+        for scale in [pythag, edo]:
+            sweep = list(stream_tuning_table_sweep(scale, "csound", notes, pitches, table_num=2))
+            self.assertEqual(len(sweep), 12)
+            for note, pitch, table in sweep:
+                self.assertEqual(table, create_csound_tuning(scale, note, pitch * 2 ** ((note - 69) / 12), 2))
+            for note, pitch, table in stream_tuning_table_sweep(scale, "timidity", notes, pitches):
+                self.assertEqual(table, create_timidity_tuning(scale, note, pitch * 2 ** ((note - 69) / 12)))
+            for note, pitch, table in stream_tuning_table_sweep(scale, "fluidsynth", notes, [440.0], prog=[1, 2]):
+                self.assertEqual(table, create_fluidsynth_tuning(scale, note, prog=[1, 2]))
+        self.assertRaises(ValueError, list, stream_tuning_table_sweep(edo, "scala"))
+
 def suite():
     table_suite = unittest.TestLoader().loadTestsFromTestCase(TestTables)
     return table_suite
@@ -10,6 +10,8 @@ from __future__ import division, print_function
 
 import unittest
 import sys
+import os
+import subprocess
 
 import sympy as sp
 
@@ -20,7 +22,7 @@ except AttributeError:
 
 from pytuning.utilities import normalize_interval, distinct_intervals, get_mode_masks, mask_scale, \
     mask_to_steps, ratio_to_cents, cents_to_ratio, note_number_to_freq, \
-    compare_two_scales, ratio_to_name
+    compare_two_scales, ratio_to_name, ratio_to_nearest_names
 
 from pytuning.scales import create_edo_scale
 
@@ -110,6 +112,40 @@ class TestUtilities(unittest.TestCase):
     def test_ratio_to_name(self):
         self.assertEqual("Perfect Fifth", ratio_to_name(sp.Rational(3, 2)))
         self.assertTrue(ratio_to_name(sp.Integer(12)) is None)
+        self.assertEqual("Equal-tempered Perfect Fifth", ratio_to_name(create_edo_scale(12)[7]))
+        self.assertEqual("Unison", ratio_to_name(1))
+        self.assertTrue(ratio_to_name(None) is None)
+        # Every interval in the catalog is found, by the first name it is listed under
+        import pytuning.constants
+        catalog = pytuning.constants.interval_catalog
+        for name, interval in catalog:
+            self.assertEqual(ratio_to_name(interval), [x[0] for x in catalog if x[1] == interval][0])
+
+    def test_ratio_to_nearest_names(self):
+        edo = create_edo_scale(12)
+        names = ratio_to_nearest_names(edo[7], k=3)
+        self.assertListEqual([x[0] for x in names], ["Equal-tempered Perfect Fifth",
+                                                     "1/6-comma Meantone Perfect Fifth", "53-TET Perfect Fifth"])
+        self.assertAlmostEqual(names[2][1], 1200 * 7 / 12 - 1200 * 31 / 53)
+        # A tempered interval with no exact name
+        self.assertTrue(ratio_to_name(edo[7] / sp.Integer(2) ** sp.Rational(1, 2400)) is None)
+        self.assertEqual(ratio_to_nearest_names(edo[7] / sp.Integer(2) ** sp.Rational(1, 2400))[0][0],
+                         "Equal-tempered Perfect Fifth")
+        # The whole scale at once, and the tolerance
+        names = ratio_to_nearest_names(edo, k=2, tolerance=0.5)
+        self.assertEqual(len(names), len(edo))
+        self.assertTrue(all(abs(y[1]) <= 0.5 for x in names for y in x))
+        self.assertEqual(names[0][0], ("Unison", 0.0))
+        self.assertEqual(ratio_to_nearest_names(sp.Rational(31, 29), tolerance=1), [])
+        # Generated ratios
+        self.assertEqual(ratio_to_nearest_names(sp.Rational(31, 29), ratio_limit=31)[0], ("31/29", 0.0))
+        self.assertEqual(ratio_to_nearest_names(sp.Rational(3, 2), ratio_limit=31)[0], ("Perfect Fifth", 0.0))
+
+    def test_lazy_constants(self):
+        code = "import pytuning.constants as c; print('interval_catalog' in vars(c)); print(c.perfect_fifth)"
+        output = subprocess.check_output([sys.executable, "-c", code],
+                                         env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+        self.assertListEqual(output.decode("utf-8").split(), ["False", "3/2"])
 
 
 def suite():
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 20:21:47 2026
+
+@author: mark
+"""
+
+from __future__ import division, print_function
+
+import unittest, sys, os, tempfile, shutil, subprocess
+
+import numpy as np
+import sympy as sp
+
+from pytuning.visualizations.scales import consonance_data, batch_metric_denom, metric_denom, \
+    render_consonance_matrix, render_consonance_matrices
+from pytuning.visualizations.syntonic import syntonic_sweep, count_clusters, cluster_syntonic
+from pytuning.utilities import cents_to_ratio, ratio_to_cents
+from pytuning.scales import create_pythagorean_scale, create_harmonic_scale, create_euler_fokker_scale, \
+    create_edo_scale, create_equal_interval_scale
+
+pythag   = create_pythagorean_scale()
+harmonic = create_harmonic_scale(72, 143)
+euler    = create_euler_fokker_scale([3, 5, 7], [2, 2, 1])
+edo      = create_edo_scale(12)
+
+try:
+    import matplotlib  # noqa: F401
+    have_matplotlib = True
+except ImportError:
+    have_matplotlib = False
+
+try:
+    from sklearn.cluster import MeanShift  # type: ignore
+    have_sklearn = True
+except ImportError:
+    have_sklearn = False
+
+def reference_data(scale, metric_function=metric_denom):
+    return np.array([[float(metric_function(x / y)) for y in scale] for x in scale])
+
+class TestConsonanceData(unittest.TestCase):
+
+    def test_rational_scales(self):
+        for scale in [pythag, harmonic, euler]:
+            self.assertTrue(np.array_equal(consonance_data(scale), reference_data(scale)))
+
+    def test_non_rational_scale(self):
+        self.assertTrue(np.array_equal(consonance_data(edo), reference_data(edo)))
+        self.assertRaises(ValueError, consonance_data, edo, batch_metric_function=batch_metric_denom)
+
+    def test_metric_functions(self):
+        metric = lambda x: sp.fraction(x)[0]  # noqa: E731
+        self.assertTrue(np.array_equal(consonance_data(pythag, metric), reference_data(pythag, metric)))
+        data = consonance_data(pythag, batch_metric_function=lambda p, q: p * q)
+        self.assertEqual(data[pythag.index(sp.Rational(9, 8))][0], 9 * 8)
+        self.assertRaises(ValueError, consonance_data, pythag, metric, batch_metric_denom)
+
+    def test_batch_metric_denom(self):
+        values = batch_metric_denom([1, 2, 3, 9, 45, 1], [1, 1, 2, 4, 32, 3])
+        self.assertListEqual(list(values), [1, 1, 2, 8, 32, 3])
+
+class TestSyntonicSweep(unittest.TestCase):
+
+    def test_sweep(self):
+        generators = np.linspace(683.3, 721.7, 13)
+        data = syntonic_sweep(generators, 13)
+        self.assertEqual(data.shape, (13, 15))
+        for row, generator in zip(data, generators):
+            scale = create_equal_interval_scale(cents_to_ratio(generator), 13, sort=False, remove_duplicates=False)
+            expected = np.array([float(ratio_to_cents(x)) for x in scale])
+            self.assertTrue(np.allclose(row, expected, rtol=0, atol=1e-6))
+
+    def test_octave(self):
+        data = syntonic_sweep([600.0], 5, number_down_intervals=2)
+        self.assertListEqual(list(data[0]), [0.0, 600.0, 1200.0, 0.0, 600.0, 1200.0, 1200.0])
+
+    def test_count_clusters(self):
+        self.assertEqual(count_clusters([1.0, 1.001, 1.2, 1.5, 1.503, 2.0], 0.005), 4)
+        counts = count_clusters([[1.0, 1.1, 1.2], [1.0, 1.0, 1.0]], 0.005)
+        self.assertListEqual(list(counts), [3, 1])
+        self.assertListEqual(list(count_clusters([[1.0, 1.1, np.nan], [1.0, np.nan, 1.0]], 0.005)), [2, 1])
+        # A chain of values closer than the bandwidth is not one cluster
+        self.assertEqual(count_clusters(np.arange(0, 0.1, 0.004), 0.005), 12)
+
+    @unittest.skipUnless(have_sklearn, "scikit-learn is not available")
+    def test_mean_shift(self):
+        generators = np.linspace(600, 800, 200)
+        degrees = np.sort(2.0 ** (syntonic_sweep(generators, 12) / 1200.0), axis=1)
+        for bandwidth in [0.005, 0.02, 0.05]:
+            expected = [len(MeanShift(bandwidth=bandwidth).fit(np.unique(x)[:, np.newaxis]).cluster_centers_)
+                        for x in degrees]
+            self.assertListEqual(list(cluster_syntonic(generators, 12, bandwidth)[1]), expected)
+
+    def test_cluster_syntonic(self):
+        # 12-EDO has 13 distinct degrees (including the octave), 17-EDO's fifth gives 13 as well,
+        # and a generator near a 7-EDO fifth collapses the scale onto (about) 8 degrees
+        generators, counts = cluster_syntonic(np.array([700.0, 705.88, 685.714]), 12)
+        self.assertListEqual(list(counts), [13, 13, 8])
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        # Importing the package (and the visualizations package) must not load the plotting libraries
+        code = "import sys, pytuning, pytuning.visualizations; " \
+               "print(sorted(x for x in ['matplotlib', 'seaborn', 'sklearn', 'pytuning.visualizations.scales'] " \
+               "if x in sys.modules))"
+        output = subprocess.check_output([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+        self.assertEqual(output.decode("utf-8").strip(), "[]")
+        import pytuning
+        self.assertTrue(callable(pytuning.visualizations.consonance_data))
+        self.assertIs(pytuning.midi, sys.modules["pytuning.midi"])
+        self.assertRaises(AttributeError, getattr, pytuning.visualizations, "no_such_function")
+
+@unittest.skipUnless(have_matplotlib, "matplotlib is not available")
+class TestRendering(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_render(self):
+        files = render_consonance_matrices([pythag, harmonic], self.directory, ["pythag", "harmonic"],
+                                           processes=2)
+        self.assertListEqual(files, [os.path.join(self.directory, x) for x in ["pythag.png", "harmonic.png"]])
+        with open(files[0], "rb") as image:
+            self.assertEqual(image.read(8), b"\x89PNG\r\n\x1a\n")
+        files = render_consonance_matrices([euler], self.directory, file_format="svg", processes=1)
+        self.assertTrue(os.path.exists(os.path.join(self.directory, "scale-0000.svg")))
+
+    def test_annotation(self):
+        # Non-integer metric values are not truncated in the cells
+        import matplotlib
+        file_name = os.path.join(self.directory, "ratios.svg")
+        with matplotlib.rc_context({"svg.fonttype": "none"}):
+            render_consonance_matrix(pythag[:3], file_name, metric_function=float)
+        with open(file_name) as image:
+            text = image.read()
+        self.assertIn(">1.125<", text)
+        self.assertIn(">1<", text)
+
+def suite():
+    visualizations_suite = unittest.TestLoader().loadTestsFromTestCase(TestConsonanceData)
+    visualizations_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestSyntonicSweep))
+    visualizations_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestLazyImports))
+    visualizations_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(TestRendering))
+    return visualizations_suite
+
+if __name__ == '__main__':
+    print("**********************************")
+    print("Begining Visualizations Test Suite")
+    print("**********************************")
+    visualizations_suite = suite()
+    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
+    return_value =  not runner.run(visualizations_suite).wasSuccessful()
+    sys.exit(return_value)